@@ -0,0 +1,47 @@
+"""Micro-benchmark for decoding current_conditions response bodies.
+
+Run from the repository root:
+
+    python3 -m benchmarks.bench_decode_current_conditions
+
+Compares the stdlib path response.json() used (decode text, then json.loads)
+with decode_json on the raw bytes, and reports decode plus parse per poll.
+"""
+
+import json
+import logging
+import timeit
+
+from benchmarks.bench_parse_weather_data import build_payload
+from custom_components.davis_weatherlink_live.davis_weatherlink_live import (
+    DavisWeatherLinkLive,
+    decode_json,
+    orjson,
+)
+
+
+def best_per_call(func, runs: int = 5_000) -> float:
+    """Return the best time of one call in microseconds."""
+    return min(timeit.repeat(func, number=runs, repeat=5)) / runs * 1e6
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    client = DavisWeatherLinkLive(None, None)
+    print(f"decode_json backend: {'orjson' if orjson is not None else 'json'}")
+
+    for transmitters in (1, 4, 8):
+        body = json.dumps(build_payload(transmitters)).encode()
+
+        stdlib = best_per_call(lambda: json.loads(body.decode("utf-8")))
+        fast = best_per_call(lambda: decode_json(body))
+        total = best_per_call(lambda: client.parse_weather_data(decode_json(body)))
+        print(
+            f"{transmitters} ISS transmitter(s), {len(body)} bytes: "
+            f"stdlib {stdlib:6.1f} us, decode_json {fast:6.1f} us, "
+            f"decode + parse {total:6.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Micro-benchmark for DavisWeatherLinkLive.parse_weather_data.
+
+Run from the repository root:
+
+    python3 -m benchmarks.bench_parse_weather_data
+
+Builds a multi-transmitter WeatherLink Live payload and reports the cost of
+parsing one poll.
+"""
+
+import copy
+import logging
+import timeit
+
+from custom_components.davis_weatherlink_live.davis_weatherlink_live import (
+    DavisWeatherLinkLive,
+)
+
+ISS_CONDITION = {
+    "lsid": 309782,
+    "data_structure_type": 1,
+    "txid": 1,
+    "temp": 62.1,
+    "hum": 50.2,
+    "dew_point": 37.7,
+    "wet_bulb": 46.7,
+    "heat_index": 63.8,
+    "wind_chill": 62.1,
+    "thw_index": 63.8,
+    "thsw_index": 66.2,
+    "wind_speed_last": 3.00,
+    "wind_dir_last": 46,
+    "wind_speed_avg_last_1_min": 5.06,
+    "wind_dir_scalar_avg_last_1_min": 68,
+    "wind_speed_avg_last_2_min": 4.00,
+    "wind_dir_scalar_avg_last_2_min": 64,
+    "wind_speed_hi_last_2_min": 12.00,
+    "wind_dir_at_hi_speed_last_2_min": 17,
+    "wind_speed_avg_last_10_min": 4.62,
+    "wind_dir_scalar_avg_last_10_min": 52,
+    "wind_speed_hi_last_10_min": 12.00,
+    "wind_dir_at_hi_speed_last_10_min": 63,
+    "rain_size": 1,
+    "rain_rate_last": 0,
+    "rain_rate_hi": 0,
+    "rainfall_last_15_min": 0,
+    "rain_rate_hi_last_15_min": 0,
+    "rainfall_last_60_min": 0,
+    "rainfall_last_24_hr": 12,
+    "rain_storm": 12,
+    "rain_storm_start_at": 1746183780,
+    "solar_rad": 512,
+    "uv_index": 3.1,
+    "rx_state": 0,
+    "trans_battery_flag": 0,
+    "rainfall_daily": 4,
+    "rainfall_monthly": 10,
+    "rainfall_year": 663,
+    "rain_storm_last": 10,
+    "rain_storm_last_start_at": 1746183780,
+    "rain_storm_last_end_at": 1746273661,
+}
+
+MOISTURE_CONDITION = {
+    "lsid": 3187671188,
+    "data_structure_type": 2,
+    "txid": 5,
+    "temp_1": 11.1,
+    "temp_2": 22.2,
+    "temp_3": 33.3,
+    "temp_4": 44.4,
+    "moist_soil_1": 1111,
+    "moist_soil_2": 2222,
+    "moist_soil_3": 3333,
+    "moist_soil_4": 4444,
+    "wet_leaf_1": 111,
+    "wet_leaf_2": 222,
+    "rx_state": 0,
+    "trans_battery_flag": 0,
+}
+
+LSS_CONDITIONS = [
+    {
+        "lsid": 309780,
+        "data_structure_type": 4,
+        "temp_in": 73.9,
+        "hum_in": 42.8,
+        "dew_point_in": 49.9,
+        "heat_index_in": 73.1,
+    },
+    {
+        "lsid": 309779,
+        "data_structure_type": 3,
+        "bar_sea_level": 30.079,
+        "bar_trend": -0.026,
+        "bar_absolute": 30.012,
+    },
+]
+
+
+def build_payload(iss_transmitters: int) -> dict:
+    """Return a current_conditions payload with the given number of ISS transmitters."""
+    conditions = []
+    for txid in range(1, iss_transmitters + 1):
+        condition = copy.deepcopy(ISS_CONDITION)
+        condition["txid"] = txid
+        condition["lsid"] += txid
+        conditions.append(condition)
+    conditions.append(copy.deepcopy(MOISTURE_CONDITION))
+    conditions.extend(copy.deepcopy(LSS_CONDITIONS))
+    return {"data": {"did": "002E0B349999", "ts": 1746711828, "conditions": conditions}}
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    client = DavisWeatherLinkLive(None, None)
+
+    for transmitters in (1, 4, 8):
+        payload = build_payload(transmitters)
+        runs = 5_000
+        best = min(
+            timeit.repeat(
+                lambda: client.parse_weather_data(payload), number=runs, repeat=5
+            )
+        )
+        print(
+            f"{transmitters} ISS transmitter(s): {best / runs * 1e6:8.1f} us per poll"
+        )
+
+
+if __name__ == "__main__":
+    main()
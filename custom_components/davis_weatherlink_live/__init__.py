@@ -4,17 +4,20 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import DOMAIN
+from .const import DOMAIN, STORE_VERSION
 from .coordinator import WeatherCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -35,6 +38,9 @@ class RuntimeData:
 
     coordinator: DataUpdateCoordinator
     cancel_update_listener: Callable
+    # Sensors by key and the platform callback to add more, for warm reloads
+    sensors: dict[str, Entity] = field(default_factory=dict)
+    add_sensors: AddEntitiesCallback | None = None
 
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: MyConfigEntry) -> bool:
@@ -52,18 +58,35 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: MyConfigEntry) ->
     # Perform an initial data load from api.
     # async_config_entry_first_refresh() is special in that it does not log errors
     # if it fails.
+    # If a recent snapshot was stored, create the entities from it right away
+    # and let the first refresh replace its values in the background once
+    # the sensors exist.
     # ----------------------------------------------------------------------------
-    _LOGGER.debug("Performing first refresh")
-    await coordinator.async_config_entry_first_refresh()
+    restored = await coordinator.async_restore()
+    if not restored:
+        _LOGGER.debug("Performing first refresh")
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except ConfigEntryNotReady:
+            # Free the hub slot and the connection until setup is retried
+            await coordinator.async_shutdown()
+            raise
+
+        # ------------------------------------------------------------------------
+        # Test to see if api initialised correctly, else raise ConfigNotReady to
+        # make HA retry setup.
+        # Change this to match how your api will know if connected or successful
+        # update.
+        # ------------------------------------------------------------------------
+        if not coordinator.data:
+            await coordinator.async_shutdown()
+            raise ConfigEntryNotReady
 
     # ----------------------------------------------------------------------------
-    # Test to see if api initialised correctly, else raise ConfigNotReady to make
-    # HA retry setup.
-    # Change this to match how your api will know if connected or successful
-    # update.
+    # Start listening for UDP real-time wind and rain broadcasts if enabled.
+    # Falls back to HTTP polling only if the device does not support it.
     # ----------------------------------------------------------------------------
-    if not coordinator.data:
-        raise ConfigEntryNotReady
+    await coordinator.async_start_realtime()
 
     # ----------------------------------------------------------------------------
     # Initialise a listener for config flow options changes.
@@ -91,6 +114,20 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: MyConfigEntry) ->
     # ----------------------------------------------------------------------------
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
+    # A device that reports a different topology than the stored snapshot
+    # warm reloads, which needs the runtime data and the sensor platform
+    if restored:
+        _LOGGER.debug("Performing first refresh in the background")
+        config_entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+        )
+
+    # ----------------------------------------------------------------------------
+    # Register the reload service once for all entries of this integration
+    # ----------------------------------------------------------------------------
+    if not hass.services.has_service(DOMAIN, "reload"):
+        hass.services.async_register(DOMAIN, "reload", _async_handle_reload)
+
     # Return true to denote a successful setup.
     return True
 
@@ -98,12 +135,28 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: MyConfigEntry) ->
 async def _async_update_listener(hass: HomeAssistant, config_entry: ConfigEntry):
     """Handle config options update.
 
-    Reload the integration when the options change.
+    Apply the new options to the running coordinator. The coordinator
+    reloads the integration itself if a new device reports a different
+    set of sensors.
     Called from our listener created above.
     """
 
-    _LOGGER.info("Received Reload Request")
-    await hass.config_entries.async_reload(config_entry.entry_id)
+    _LOGGER.info("Applying updated options")
+    await config_entry.runtime_data.coordinator.async_apply_options(
+        config_entry.options
+    )
+
+
+async def _async_handle_reload(call: ServiceCall) -> None:
+    """Reload every loaded entry without making its sensors unavailable.
+
+    An entry whose device does not respond keeps running as it was.
+    """
+
+    for config_entry in call.hass.config_entries.async_entries(DOMAIN):
+        if config_entry.state is ConfigEntryState.LOADED:
+            _LOGGER.info("Reloading %s", config_entry.title)
+            await config_entry.runtime_data.coordinator.async_warm_reload()
 
 
 async def async_remove_config_entry_device(
@@ -118,6 +171,12 @@ async def async_remove_config_entry_device(
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Remove the stored snapshot when the integration is deleted."""
+
+    await Store(hass, STORE_VERSION, f"{DOMAIN}.{config_entry.entry_id}").async_remove()
+
+
 async def async_unload_entry(hass: HomeAssistant, config_entry: MyConfigEntry) -> bool:
     """Unload a config entry.
 
@@ -127,9 +186,14 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: MyConfigEntry) -
 
     _LOGGER.info("Unloading everything! bye bye")
 
-    # Unload services
-    for service in hass.services.async_services_for_domain(DOMAIN):
-        hass.services.async_remove(DOMAIN, service)
+    # Unload services with the last loaded entry
+    if not any(
+        entry.state is ConfigEntryState.LOADED
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.entry_id != config_entry.entry_id
+    ):
+        for service in hass.services.async_services_for_domain(DOMAIN):
+            hass.services.async_remove(DOMAIN, service)
 
     # Unload platforms and return result
     # return await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
@@ -147,8 +211,9 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: MyConfigEntry) -
         if coordinator:
             await coordinator.async_shutdown()  # Ensure background updates stop
 
-    # If no more entries exist, remove the domain key from hass.data
-    if not hass.data.get(DOMAIN):
-        hass.data.pop(DOMAIN, None)
+    # If no more entries exist, remove the poll hub from hass.data
+    hub = hass.data.get(DOMAIN)
+    if hub is not None and len(hub) == 0:
+        hass.data.pop(DOMAIN)
 
     return unload_ok
\ No newline at end of file
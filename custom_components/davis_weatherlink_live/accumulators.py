@@ -0,0 +1,304 @@
+"""Daily reference evapotranspiration and degree days of ISS transmitters."""
+
+from __future__ import annotations
+
+import math
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from .const import ACCUMULATOR_ANEMOMETER_HEIGHT, ACCUMULATOR_MAX_GAP
+from .records import ConditionRecord, WeatherSnapshot
+from .registry import accumulator_key
+
+# FAO-56 constants, per hour where they depend on the time step
+SOLAR_CONSTANT = 0.0820 * 60  # MJ m-2 h-1
+STEFAN_BOLTZMANN = 2.043e-10  # MJ K-4 m-2 h-1
+ALBEDO = 0.23
+# Rs/Rso assumed until the first reading with the sun high enough
+DEFAULT_CLOUDINESS = 0.7
+# Sine of the sun elevation above which Rs/Rso is measured, not carried over
+MIN_SUN_ELEVATION = 0.3
+
+
+def saturation_vapour_pressure(celsius: float) -> float:
+    """Return the saturation vapour pressure in kPa (FAO-56 eq. 11)."""
+    return 0.6108 * math.exp(17.27 * celsius / (celsius + 237.3))
+
+
+def wind_at_2m(speed: float, height: float) -> float:
+    """Return the wind speed at 2 m from one measured at height m (FAO-56 eq. 47)."""
+    return speed * 4.87 / math.log(67.8 * height - 5.42)
+
+
+def sun_elevation(
+    latitude: float, longitude: float, when: datetime
+) -> tuple[float, float]:
+    """Return the sine of the sun elevation and the inverse Earth-Sun distance.
+
+    FAO-56 eq. 23 to 33 with the equation of time, latitude and longitude
+    in degrees east.
+    """
+    utc = when.astimezone(UTC)
+    day = utc.timetuple().tm_yday
+    b = 2 * math.pi * (day - 81) / 364
+    equation_of_time = (
+        0.1645 * math.sin(2 * b) - 0.1255 * math.cos(b) - 0.025 * math.sin(b)
+    )
+    solar_time = utc.hour + utc.minute / 60 + utc.second / 3600
+    solar_time += longitude / 15 + equation_of_time
+    hour_angle = math.pi / 12 * (solar_time - 12)
+
+    declination = 0.409 * math.sin(2 * math.pi * day / 365 - 1.39)
+    inverse_distance = 1 + 0.033 * math.cos(2 * math.pi * day / 365)
+    phi = math.radians(latitude)
+    sine = math.sin(phi) * math.sin(declination) + math.cos(phi) * math.cos(
+        declination
+    ) * math.cos(hour_angle)
+    return sine, inverse_distance
+
+
+class Evapotranspiration:
+    """Hourly FAO-56 Penman-Monteith reference evapotranspiration rate.
+
+    Net radiation is derived from the measured solar radiation and the
+    clear-sky radiation of the location. At night, and with the sun low,
+    the cloudiness (Rs/Rso) of the last daylight reading is carried over
+    as FAO-56 recommends.
+    """
+
+    __slots__ = ("latitude", "longitude", "elevation", "gamma", "cloudiness")
+
+    def __init__(self, latitude: float, longitude: float, elevation: float) -> None:
+        self.latitude = latitude
+        self.longitude = longitude
+        self.elevation = elevation
+        pressure = 101.3 * ((293 - 0.0065 * elevation) / 293) ** 5.26
+        self.gamma = 0.000665 * pressure
+        self.cloudiness = DEFAULT_CLOUDINESS
+
+    def rate(
+        self,
+        celsius: float,
+        humidity: float,
+        wind: float,
+        solar: float,
+        when: datetime,
+    ) -> float:
+        """Return ET0 in mm per hour.
+
+        Temperature in °C, relative humidity in %, wind speed at 2 m in
+        m/s and solar radiation in W/m².
+        """
+        sine, inverse_distance = sun_elevation(self.latitude, self.longitude, when)
+        shortwave = solar * 0.0036  # MJ m-2 h-1
+        clear_sky = (0.75 + 2e-5 * self.elevation) * (
+            SOLAR_CONSTANT * inverse_distance * max(sine, 0.0)
+        )
+        if sine > MIN_SUN_ELEVATION and clear_sky > 0:
+            self.cloudiness = min(max(shortwave / clear_sky, 0.25), 1.0)
+
+        saturation = saturation_vapour_pressure(celsius)
+        actual = saturation * min(max(humidity, 0.0), 100.0) / 100
+        kelvin = celsius + 273.16
+        longwave = (
+            STEFAN_BOLTZMANN
+            * kelvin**4
+            * (0.34 - 0.14 * math.sqrt(actual))
+            * (1.35 * self.cloudiness - 0.35)
+        )
+        net = (1 - ALBEDO) * shortwave - longwave
+        soil = (0.1 if sine > 0 else 0.5) * net
+
+        slope = 4098 * saturation / (celsius + 237.3) ** 2
+        gamma = self.gamma
+        return (
+            0.408 * slope * (net - soil)
+            + gamma * 37 / (celsius + 273) * wind * (saturation - actual)
+        ) / (slope + gamma * (1 + 0.34 * wind))
+
+
+class _Day:
+    """Running sums of one ISS for the current day."""
+
+    __slots__ = ("day", "since", "totals", "yesterday", "complete", "last", "rates")
+
+    def __init__(self, day: date, since: datetime) -> None:
+        self.day = day
+        self.since = since
+        self.totals: dict[str, float] = {}
+        self.yesterday: dict[str, float | None] = {}
+        # False for the day the sums started in, it was only partly observed
+        self.complete = False
+        self.last = since
+        self.rates: dict[str, float] = {}
+
+
+class DailyAccumulators:
+    """Daily ET0 and growing, heating and cooling degree days per ISS.
+
+    Every poll converts temp, hum, wind_speed_avg_last_10_min (measured
+    at anemometer_height m) and solar_rad into rates, and the time since
+    the previous poll is integrated with the trapezoidal rule. Only the running sums of the
+    day and the previous rates are kept, and stored so a restart on the
+    same day continues them. The day starts at reset_hour local time,
+    the finished day is kept as the yesterday attribute.
+    """
+
+    def __init__(
+        self,
+        evapotranspiration: Evapotranspiration,
+        reset_hour: int,
+        gdd_base: float,
+        degree_day_base: float,
+        anemometer_height: float = ACCUMULATOR_ANEMOMETER_HEIGHT,
+    ) -> None:
+        self.evapotranspiration = evapotranspiration
+        self.reset_hour = reset_hour
+        # Base temperatures (°F) of growing, and of heating and cooling degree days
+        self.gdd_base = gdd_base
+        self.degree_day_base = degree_day_base
+        self.anemometer_height = anemometer_height
+        self.values: dict[str, float | None] = {}
+        self.attributes: dict[str, dict[str, Any]] = {}
+        self._days: dict[int | None, _Day] = {}
+        self._changed: set[str] = set()
+
+    def update(self, snapshot: WeatherSnapshot, now: datetime) -> None:
+        """Integrate the readings of every ISS up to now, in local time."""
+
+        day = (now - timedelta(hours=self.reset_hour)).date()
+        for device, record in zip(snapshot.topology, snapshot.records):
+            if record is None or device.data_structure_type != 1:
+                continue
+            rates = self._rates(record, now)
+            if not rates:
+                continue
+
+            state = self._days.get(device.txid)
+            if state is None:
+                state = self._days[device.txid] = _Day(day, now)
+            elif state.day != day:
+                # The interval across the reset is not split, it is dropped
+                finished = state.totals if state.complete else {}
+                state.yesterday = {name: finished.get(name) for name in rates}
+                state.day = day
+                state.since = now
+                state.totals = {}
+                state.complete = True
+            else:
+                seconds = (now - state.last).total_seconds()
+                if 0 < seconds <= ACCUMULATOR_MAX_GAP:
+                    for name, rate in rates.items():
+                        previous = state.rates.get(name)
+                        if previous is None:
+                            continue
+                        state.totals[name] = state.totals.get(name, 0.0) + (
+                            (previous + rate) / 2 * seconds / 3600
+                        )
+            for name in rates:
+                state.totals.setdefault(name, 0.0)
+            state.last = now
+            state.rates = rates
+            self._set_values(device.txid, state)
+
+    def _rates(self, record: ConditionRecord, now: datetime) -> dict[str, float]:
+        """Return the rates per hour, mm for ET0 and °F days for degree days."""
+
+        temp = record.get("temp")
+        if not isinstance(temp, (int, float)):
+            return {}
+        rates = {
+            "gdd": max(temp - self.gdd_base, 0.0) / 24,
+            "hdd": max(self.degree_day_base - temp, 0.0) / 24,
+            "cdd": max(temp - self.degree_day_base, 0.0) / 24,
+        }
+
+        hum = record.get("hum")
+        wind = record.get("wind_speed_avg_last_10_min")
+        solar = record.get("solar_rad")
+        if all(isinstance(value, (int, float)) for value in (hum, wind, solar)):
+            rates["et0"] = self.evapotranspiration.rate(
+                (temp - 32) * 5 / 9,
+                hum,
+                wind_at_2m(wind * 0.44704, self.anemometer_height),
+                solar,
+                now,
+            )
+        return rates
+
+    def _set_values(self, txid: int | None, state: _Day) -> None:
+        for name, total in state.totals.items():
+            self._set(
+                accumulator_key(name, txid),
+                round(max(total, 0.0), 2),
+                {
+                    "since": state.since.isoformat(),
+                    "yesterday": (
+                        None
+                        if state.yesterday.get(name) is None
+                        else round(max(state.yesterday[name], 0.0), 2)
+                    ),
+                },
+            )
+
+    def _set(self, key: str, value: float | None, attributes: dict[str, Any]) -> None:
+        if (
+            key not in self.values
+            or self.values[key] != value
+            or self.attributes.get(key) != attributes
+        ):
+            self.values[key] = value
+            self.attributes[key] = attributes
+            self._changed.add(key)
+
+    def dump(self) -> list[dict[str, Any]]:
+        """Return the running sums of every ISS in a JSON serializable form."""
+
+        return [
+            {
+                "txid": txid,
+                "day": state.day.isoformat(),
+                "since": state.since.isoformat(),
+                "totals": state.totals,
+                "yesterday": state.yesterday,
+                "complete": state.complete,
+                "last": state.last.isoformat(),
+                "rates": state.rates,
+            }
+            for txid, state in self._days.items()
+        ]
+
+    def restore(self, stored: list[dict[str, Any]], now: datetime) -> None:
+        """Continue the dumped running sums that belong to the day of now."""
+
+        day = (now - timedelta(hours=self.reset_hour)).date()
+        for item in stored:
+            if date.fromisoformat(item["day"]) != day:
+                continue
+            state = _Day(day, datetime.fromisoformat(item["since"]))
+            state.totals = dict(item["totals"])
+            state.yesterday = dict(item["yesterday"])
+            state.complete = item["complete"]
+            state.last = datetime.fromisoformat(item["last"])
+            state.rates = dict(item["rates"])
+            self._days[item["txid"]] = state
+            self._set_values(item["txid"], state)
+
+    def pop_changed(self) -> set[str]:
+        """Return and reset the keys of accumulators that changed."""
+
+        changed = self._changed
+        self._changed = set()
+        return changed
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the settings and current sums for the diagnostics download."""
+
+        return {
+            "reset_hour": self.reset_hour,
+            "gdd_base": self.gdd_base,
+            "degree_day_base": self.degree_day_base,
+            "anemometer_height": self.anemometer_height,
+            "cloudiness": self.evapotranspiration.cloudiness,
+            "values": dict(self.values),
+        }
@@ -0,0 +1,248 @@
+"""EPA NowCast and Air Quality Index of AirLink particulate matter."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import Any, NamedTuple
+
+from .const import AQI_HOURS, AQI_MIN_COVERAGE
+from .records import WeatherSnapshot
+from .registry import aqi_key
+
+
+class Breakpoint(NamedTuple):
+    """One row of an EPA AQI breakpoint table."""
+
+    low: float
+    index_low: int
+    # AQI points per unit of concentration inside the row
+    slope: float
+    category: str
+
+
+class BreakpointTable(NamedTuple):
+    """Breakpoint rows and their upper concentrations, searched by bisection."""
+
+    highs: tuple[float, ...]
+    rows: tuple[Breakpoint, ...]
+
+
+def breakpoints(
+    rows: Sequence[tuple[float, float, int, int, str]],
+) -> BreakpointTable:
+    """Precompute a breakpoint table from (low, high, AQI low, AQI high, category)."""
+    return BreakpointTable(
+        tuple(high for _, high, _, _, _ in rows),
+        tuple(
+            Breakpoint(low, index_low, (index_high - index_low) / (high - low), name)
+            for low, high, index_low, index_high, name in rows
+        ),
+    )
+
+
+# EPA breakpoints as revised in 2024, concentrations in µg/m³
+PM_2P5_BREAKPOINTS = breakpoints(
+    (
+        (0.0, 9.0, 0, 50, "good"),
+        (9.1, 35.4, 51, 100, "moderate"),
+        (35.5, 55.4, 101, 150, "unhealthy_for_sensitive_groups"),
+        (55.5, 125.4, 151, 200, "unhealthy"),
+        (125.5, 225.4, 201, 300, "very_unhealthy"),
+        (225.5, 325.4, 301, 500, "hazardous"),
+    )
+)
+PM_10_BREAKPOINTS = breakpoints(
+    (
+        (0, 54, 0, 50, "good"),
+        (55, 154, 51, 100, "moderate"),
+        (155, 254, 101, 150, "unhealthy_for_sensitive_groups"),
+        (255, 354, 151, 200, "unhealthy"),
+        (355, 424, 201, 300, "very_unhealthy"),
+        (425, 604, 301, 500, "hazardous"),
+    )
+)
+
+# Pollutant, 1 minute average field, device NowCast field, table and the
+# decimals the NowCast is truncated to before the table lookup
+POLLUTANTS = (
+    ("pm_2p5", "pm_2p5", "pm_2p5_nowcast", PM_2P5_BREAKPOINTS, 1),
+    ("pm_10", "pm_10", "pm_10_nowcast", PM_10_BREAKPOINTS, 0),
+)
+
+
+def aqi(concentration: float, table: BreakpointTable, decimals: int) -> tuple[int, str]:
+    """Return the AQI and category of a concentration.
+
+    The concentration is truncated to the decimals of the table first, as
+    the EPA specifies, so it always falls inside one of its rows.
+    """
+    scale = 10**decimals
+    concentration = int(max(concentration, 0) * scale) / scale
+    position = bisect_left(table.highs, concentration)
+    if position == len(table.rows):
+        # Beyond the table, the index is capped at its top
+        return 500, table.rows[-1].category
+    row = table.rows[position]
+    return round(row.index_low + row.slope * (concentration - row.low)), row.category
+
+
+def nowcast(hours: Sequence[float | None]) -> float | None:
+    """Return the EPA NowCast of hourly averages, the most recent hour first.
+
+    At least two of the three most recent hours must be valid. Hours are
+    weighted by a factor that shrinks the more the concentration varied,
+    so the NowCast follows quick changes and smooths steady ones.
+    """
+    if sum(hour is not None for hour in hours[:3]) < 2:
+        return None
+    valid = [hour for hour in hours if hour is not None]
+    highest = max(valid)
+    weight = 1.0 if highest <= 0 else max(min(valid) / highest, 0.5)
+
+    total = weights = 0.0
+    factor = 1.0
+    for hour in hours:
+        if hour is not None:
+            total += factor * hour
+            weights += factor
+        factor *= weight
+    return total / weights
+
+
+class HourlyAverages:
+    """Averages of the last AQI_HOURS complete clock hours in fixed-size arrays.
+
+    The open hour keeps a running sum and a bitmask of the five minute
+    periods it has samples in. When a sample of a later hour arrives, the
+    open hour closes and is only kept if its samples covered at least
+    AQI_MIN_COVERAGE of it.
+    """
+
+    __slots__ = ("hour", "_sum", "_count", "_coverage", "averages", "slots")
+
+    def __init__(self) -> None:
+        self.hour: int | None = None
+        self._sum = 0.0
+        self._count = 0
+        self._coverage = 0
+        self.averages = array("d", [0.0] * AQI_HOURS)
+        self.slots = array("q", [-1] * AQI_HOURS)
+
+    def add(self, value: float, now: float) -> bool:
+        """Add a value sampled at now, in seconds. Returns True if an hour closed."""
+
+        hour = int(now // 3600)
+        closed = False
+        if self.hour is None or hour > self.hour:
+            if self.hour is not None:
+                self._close()
+                closed = True
+            self.hour = hour
+            self._sum = 0.0
+            self._count = 0
+            self._coverage = 0
+        self._sum += value
+        self._count += 1
+        self._coverage |= 1 << int(now % 3600 // 300)
+        return closed
+
+    def _close(self) -> None:
+        if self._coverage.bit_count() < AQI_MIN_COVERAGE * 12:
+            return
+        index = self.hour % AQI_HOURS
+        self.averages[index] = self._sum / self._count
+        self.slots[index] = self.hour
+
+    def last_hours(self) -> list[float | None]:
+        """Return the complete hours before the open one, the most recent first."""
+
+        if self.hour is None:
+            return []
+        hours = []
+        for slot in range(self.hour - 1, self.hour - AQI_HOURS - 1, -1):
+            index = slot % AQI_HOURS
+            hours.append(self.averages[index] if self.slots[index] == slot else None)
+        return hours
+
+
+class AirQuality:
+    """NowCast AQI of PM2.5 and PM10 for every AirLink.
+
+    The 1 minute averages of every poll are collected per clock hour and
+    the NowCast is calculated once per hour as the hour closes. Until two
+    of the last three hours are complete, the NowCast reported by the
+    device is used instead and the source attribute says so.
+    """
+
+    def __init__(self) -> None:
+        self.values: dict[str, int | None] = {}
+        self.attributes: dict[str, dict[str, Any]] = {}
+        self._hours: dict[tuple[int | None, str], HourlyAverages] = {}
+        self._nowcasts: dict[tuple[int | None, str], float | None] = {}
+        self._changed: set[str] = set()
+
+    def update(self, snapshot: WeatherSnapshot, now: float) -> None:
+        """Add the PM values of every AirLink, now in seconds since the epoch."""
+
+        for device, record in zip(snapshot.topology, snapshot.records):
+            if record is None or device.data_structure_type != 6:
+                continue
+            for pollutant, source, device_field, table, decimals in POLLUTANTS:
+                tracker = (device.lsid, pollutant)
+                value = record.get(source)
+                if isinstance(value, (int, float)):
+                    hours = self._hours.get(tracker)
+                    if hours is None:
+                        hours = self._hours[tracker] = HourlyAverages()
+                    if hours.add(float(value), now):
+                        self._nowcasts[tracker] = nowcast(hours.last_hours())
+
+                concentration = self._nowcasts.get(tracker)
+                source_name = "local"
+                if concentration is None:
+                    concentration = record.get(device_field)
+                    source_name = "device"
+                key = aqi_key(pollutant, device.lsid)
+                if not isinstance(concentration, (int, float)):
+                    self._set(key, None, {})
+                    continue
+                index, category = aqi(concentration, table, decimals)
+                self._set(
+                    key,
+                    index,
+                    {
+                        "category": category,
+                        "nowcast": round(concentration, decimals),
+                        "source": source_name,
+                    },
+                )
+
+    def _set(self, key: str, value: int | None, attributes: dict[str, Any]) -> None:
+        if (
+            key not in self.values
+            or self.values[key] != value
+            or self.attributes.get(key) != attributes
+        ):
+            self.values[key] = value
+            self.attributes[key] = attributes
+            self._changed.add(key)
+
+    def pop_changed(self) -> set[str]:
+        """Return and reset the keys of AQI values that changed."""
+
+        changed = self._changed
+        self._changed = set()
+        return changed
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the hourly averages and AQI values for the diagnostics download."""
+
+        return {
+            "hours": {
+                f"{lsid}/{pollutant}": hours.last_hours()
+                for (lsid, pollutant), hours in self._hours.items()
+            },
+            "values": dict(self.values),
+        }
@@ -0,0 +1,222 @@
+"""Barometric trends of LSS BAR devices from a pressure history."""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any
+
+from .const import TREND_MIN_SPACING, TREND_RAPID, TREND_STEADY
+from .records import WeatherSnapshot
+from .registry import bar_trend_key
+
+
+class _Fit:
+    """Least-squares sums of the samples inside one window.
+
+    Times are kept relative to the oldest sample of the window, which keeps
+    the sums small enough to subtract without losing precision.
+    """
+
+    __slots__ = ("window", "start", "origin", "n", "st", "sp", "stt", "stp")
+
+    def __init__(self, window: float) -> None:
+        self.window = window
+        # Sample number of the oldest sample inside the window
+        self.start = 0
+        self.origin = 0.0
+        self.n = 0
+        self.st = 0.0
+        self.sp = 0.0
+        self.stt = 0.0
+        self.stp = 0.0
+
+    def add(self, time: float, value: float) -> None:
+        if not self.n:
+            self.origin = time
+        t = time - self.origin
+        self.n += 1
+        self.st += t
+        self.sp += value
+        self.stt += t * t
+        self.stp += t * value
+
+    def remove(self, time: float, value: float) -> None:
+        t = time - self.origin
+        self.n -= 1
+        if not self.n:
+            # Start over exactly, without accumulated rounding errors
+            self.st = self.sp = self.stt = self.stp = 0.0
+            return
+        self.st -= t
+        self.sp -= value
+        self.stt -= t * t
+        self.stp -= t * value
+
+    def rebase(self, origin: float) -> None:
+        """Move the time origin, shifting the sums to match."""
+        shift = origin - self.origin
+        self.stt += -2 * shift * self.st + self.n * shift * shift
+        self.stp -= shift * self.sp
+        self.st -= self.n * shift
+        self.origin = origin
+
+    @property
+    def slope(self) -> float | None:
+        """Return the slope of the least-squares line, per second."""
+        denominator = self.n * self.stt - self.st * self.st
+        if self.n < 3 or denominator <= 0:
+            return None
+        return (self.n * self.stp - self.st * self.sp) / denominator
+
+
+class PressureHistory:
+    """Timestamped pressure samples in fixed-size arrays, fitted per window.
+
+    Samples closer than TREND_MIN_SPACING to the previous one are skipped,
+    so the arrays hold the longest window however often the device is
+    polled. Each window keeps running sums for a least-squares fit, a new
+    sample is added to them and expired samples are subtracted, so the
+    slope of every window is O(1) to update and read.
+    """
+
+    __slots__ = ("capacity", "times", "values", "count", "reference", "fits")
+
+    def __init__(self, windows: tuple[int, ...]) -> None:
+        self.capacity = int(max(windows) // TREND_MIN_SPACING) + 2
+        self.times = array("d", [0.0] * self.capacity)
+        self.values = array("d", [0.0] * self.capacity)
+        # Number of samples added so far, sample i is at i % capacity
+        self.count = 0
+        # Values are stored relative to the first, the fit only needs changes
+        self.reference: float | None = None
+        self.fits = [_Fit(window) for window in windows]
+
+    def add(self, value: float, now: float) -> bool:
+        """Add a pressure sampled at now, in monotonic seconds."""
+
+        capacity = self.capacity
+        if self.count and now - self.times[(self.count - 1) % capacity] < (
+            TREND_MIN_SPACING
+        ):
+            return False
+        if self.reference is None:
+            self.reference = value
+
+        for fit in self.fits:
+            # Expire before writing, the oldest slot is about to be reused
+            while fit.start < self.count and (
+                self.times[fit.start % capacity] <= now - fit.window
+                or self.count - fit.start >= capacity
+            ):
+                index = fit.start % capacity
+                fit.remove(self.times[index], self.values[index])
+                fit.start += 1
+            if fit.n:
+                fit.rebase(self.times[fit.start % capacity])
+
+        index = self.count % capacity
+        self.times[index] = now
+        self.values[index] = value - self.reference
+        self.count += 1
+        for fit in self.fits:
+            fit.add(now, value - self.reference)
+        return True
+
+    def span(self, fit: _Fit) -> float:
+        """Return the seconds covered by the samples of a window."""
+        if not fit.n:
+            return 0.0
+        return self.times[(self.count - 1) % self.capacity] - fit.origin
+
+
+class BarometricTrends:
+    """Sea level pressure trend of every LSS BAR over each configured window.
+
+    The value of a window is the pressure change over the window along the
+    least-squares line, in the unit of bar_sea_level, and its tendency
+    compares the rate per 3 hours with the thresholds the device's own
+    bar_trend is usually read with. A window reports None until its
+    samples cover at least half of it.
+    """
+
+    def __init__(self, windows: tuple[int, ...]) -> None:
+        self.windows = windows
+        self.values: dict[str, float | None] = {}
+        self.attributes: dict[str, dict[str, Any]] = {}
+        self._histories: dict[int | None, PressureHistory] = {}
+        self._changed: set[str] = set()
+
+    def update(self, snapshot: WeatherSnapshot, now: float) -> None:
+        """Add the sea level pressure of every LSS BAR, now in monotonic seconds."""
+
+        # Options saved before windows were required may have none selected
+        if not self.windows:
+            return
+        for device, record in zip(snapshot.topology, snapshot.records):
+            if record is None or device.data_structure_type != 3:
+                continue
+            pressure = record.get("bar_sea_level")
+            if not isinstance(pressure, (int, float)):
+                continue
+
+            history = self._histories.get(device.lsid)
+            if history is None:
+                history = self._histories[device.lsid] = PressureHistory(
+                    self.windows
+                )
+            if not history.add(float(pressure), now):
+                continue
+
+            for fit in history.fits:
+                key = bar_trend_key(device.lsid, fit.window)
+                slope = fit.slope
+                if slope is None or history.span(fit) < fit.window / 2:
+                    self._set(key, None, {})
+                    continue
+                self._set(
+                    key,
+                    round(slope * fit.window, 3),
+                    {"tendency": tendency(slope * 10800)},
+                )
+
+    def _set(self, key: str, value: float | None, attributes: dict[str, Any]) -> None:
+        if (
+            key not in self.values
+            or self.values[key] != value
+            or self.attributes.get(key) != attributes
+        ):
+            self.values[key] = value
+            self.attributes[key] = attributes
+            self._changed.add(key)
+
+    def pop_changed(self) -> set[str]:
+        """Return and reset the keys of trends that changed."""
+
+        changed = self._changed
+        self._changed = set()
+        return changed
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the windows and current trends for the diagnostics download."""
+
+        return {
+            "windows": list(self.windows),
+            "samples": {
+                lsid: min(history.count, history.capacity)
+                for lsid, history in self._histories.items()
+            },
+            "values": dict(self.values),
+        }
+
+
+def tendency(change: float) -> str:
+    """Return the tendency of a pressure change per 3 hours."""
+    if change >= TREND_RAPID:
+        return "rising_rapidly"
+    if change >= TREND_STEADY:
+        return "rising_slowly"
+    if change <= -TREND_RAPID:
+        return "falling_rapidly"
+    if change <= -TREND_STEADY:
+        return "falling_slowly"
+    return "steady"
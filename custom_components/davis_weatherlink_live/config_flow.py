@@ -18,11 +18,43 @@ from homeassistant.core import callback
 from homeassistant.data_entry_flow import section
 from homeassistant.helpers.selector import selector
 
-from .const import API_INITIAL_INTERVAL, API_INITIAL_MAX_CACHE_AGE, API_PATH, DOMAIN
+from .const import (
+    ACCUMULATOR_ANEMOMETER_HEIGHT,
+    ACCUMULATOR_DEGREE_DAY_BASE,
+    ACCUMULATOR_GDD_BASE,
+    ACCUMULATOR_RESET_HOUR,
+    ADAPTIVE_GUST,
+    ADAPTIVE_MAX_INTERVAL,
+    ADAPTIVE_MIN_INTERVAL,
+    ADAPTIVE_PRESSURE_TREND,
+    ADAPTIVE_RAIN_RATE,
+    API_INITIAL_INTERVAL,
+    API_INITIAL_MAX_CACHE_AGE,
+    API_PATH,
+    DEADBAND_HEARTBEAT,
+    DEADBAND_HUMIDITY,
+    DEADBAND_PM,
+    DEADBAND_PRESSURE,
+    DEADBAND_TEMPERATURE,
+    DOMAIN,
+    OUTLIER_THRESHOLD,
+    ROLLING_WINDOW_NAMES,
+    ROLLING_WINDOWS,
+    TREND_WINDOW_NAMES,
+    TREND_WINDOWS,
+    WIND_WINDOWS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Rolling statistics windows offered, keyed by their seconds as a string
+WINDOW_OPTIONS = {str(window): name for window, name in ROLLING_WINDOW_NAMES.items()}
+TREND_WINDOW_OPTIONS = {
+    str(window): name for window, name in TREND_WINDOW_NAMES.items()
+}
+
+
 def validate_api_host(api_host: str) -> str:
     """Ensure api_host does not contain 'http' or 'https'."""
     if "http" in api_host.lower():
@@ -36,6 +68,22 @@ def validate_update_interval(update_interval: int) -> int:
     return update_interval
 
 
+def validate_polling_section(polling: dict[str, Any]) -> dict[str, Any]:
+    """Ensure the adaptive interval bounds are usable."""
+    min_interval = polling.get("min_interval", ADAPTIVE_MIN_INTERVAL)
+    max_interval = polling.get("max_interval", ADAPTIVE_MAX_INTERVAL)
+    if min_interval < 10 or max_interval < min_interval:
+        raise vol.Invalid("adaptive_interval_range")
+    return polling
+
+
+def validate_trend_section(trend: dict[str, Any]) -> dict[str, Any]:
+    """Ensure barometric trends have at least one window to report."""
+    if trend.get("trend") and not trend.get("windows", TREND_WINDOWS):
+        raise vol.Invalid("trend_windows_required")
+    return trend
+
+
 class WeatherStationConfigFlow(ConfigFlow, domain=DOMAIN):
     async def async_step_zeroconf(self, discovery_info):
         _LOGGER.debug("Zeroconf discovery_info: %s", discovery_info)
@@ -68,6 +116,8 @@ class WeatherStationConfigFlow(ConfigFlow, domain=DOMAIN):
             try:
                 validate_api_host(user_input["api_host"])
                 validate_update_interval(user_input["update_interval"])
+                validate_polling_section(user_input.get("polling_section", {}))
+                validate_trend_section(user_input.get("trend_section", {}))
 
                 return self.async_create_entry(
                     title="Davis Device",
@@ -80,6 +130,10 @@ class WeatherStationConfigFlow(ConfigFlow, domain=DOMAIN):
                     errors["api_host"] = "api_host_http_not_allowed"
                 elif str(e) == "update_interval_too_low":
                     errors["update_interval"] = "update_interval_too_low"
+                elif str(e) == "adaptive_interval_range":
+                    errors["base"] = "adaptive_interval_range"
+                elif str(e) == "trend_windows_required":
+                    errors["base"] = "trend_windows_required"
 
         data_schema = vol.Schema(
             {
@@ -90,6 +144,7 @@ class WeatherStationConfigFlow(ConfigFlow, domain=DOMAIN):
                 vol.Required(
                     "update_interval", default=API_INITIAL_INTERVAL
                 ): cv.positive_int,
+                vol.Required("realtime", default=False): bool,
                 vol.Required("cache_section"): section(
                     vol.Schema(
                         {
@@ -101,6 +156,123 @@ class WeatherStationConfigFlow(ConfigFlow, domain=DOMAIN):
                     ),
                     {"collapsed": True},
                 ),
+                vol.Required("polling_section"): section(
+                    vol.Schema(
+                        {
+                            vol.Required("phase_lock", default=False): bool,
+                            vol.Required("adaptive", default=False): bool,
+                            vol.Required(
+                                "min_interval", default=ADAPTIVE_MIN_INTERVAL
+                            ): cv.positive_int,
+                            vol.Required(
+                                "max_interval", default=ADAPTIVE_MAX_INTERVAL
+                            ): cv.positive_int,
+                            vol.Required(
+                                "rain_rate_threshold", default=ADAPTIVE_RAIN_RATE
+                            ): cv.positive_float,
+                            vol.Required(
+                                "gust_threshold", default=ADAPTIVE_GUST
+                            ): cv.positive_float,
+                            vol.Required(
+                                "pressure_trend_threshold",
+                                default=ADAPTIVE_PRESSURE_TREND,
+                            ): cv.positive_float,
+                        }
+                    ),
+                    {"collapsed": True},
+                ),
+                vol.Required("filter_section"): section(
+                    vol.Schema(
+                        {
+                            vol.Required("deadband", default=False): bool,
+                            vol.Required(
+                                "temperature_deadband", default=DEADBAND_TEMPERATURE
+                            ): cv.positive_float,
+                            vol.Required(
+                                "humidity_deadband", default=DEADBAND_HUMIDITY
+                            ): cv.positive_float,
+                            vol.Required(
+                                "pressure_deadband", default=DEADBAND_PRESSURE
+                            ): cv.positive_float,
+                            vol.Required(
+                                "pm_deadband", default=DEADBAND_PM
+                            ): cv.positive_float,
+                            vol.Required(
+                                "heartbeat", default=DEADBAND_HEARTBEAT
+                            ): cv.positive_int,
+                            vol.Required("outliers", default=False): bool,
+                            vol.Required(
+                                "spike_threshold", default=OUTLIER_THRESHOLD
+                            ): cv.positive_float,
+                        }
+                    ),
+                    {"collapsed": True},
+                ),
+                vol.Required("statistics_section"): section(
+                    vol.Schema(
+                        {
+                            vol.Required("rolling", default=False): bool,
+                            vol.Required(
+                                "windows",
+                                default=[str(window) for window in ROLLING_WINDOWS],
+                            ): cv.multi_select(WINDOW_OPTIONS),
+                        }
+                    ),
+                    {"collapsed": True},
+                ),
+                vol.Required("wind_section"): section(
+                    vol.Schema(
+                        {
+                            vol.Required("wind", default=False): bool,
+                            vol.Required(
+                                "windows",
+                                default=[str(window) for window in WIND_WINDOWS],
+                            ): cv.multi_select(WINDOW_OPTIONS),
+                        }
+                    ),
+                    {"collapsed": True},
+                ),
+                vol.Required("rain_section"): section(
+                    vol.Schema({vol.Required("rain", default=False): bool}),
+                    {"collapsed": True},
+                ),
+                vol.Required("aqi_section"): section(
+                    vol.Schema({vol.Required("aqi", default=False): bool}),
+                    {"collapsed": True},
+                ),
+                vol.Required("accumulator_section"): section(
+                    vol.Schema(
+                        {
+                            vol.Required("accumulators", default=False): bool,
+                            vol.Required(
+                                "reset_hour", default=ACCUMULATOR_RESET_HOUR
+                            ): vol.All(cv.positive_int, vol.Range(max=23)),
+                            vol.Required(
+                                "gdd_base", default=ACCUMULATOR_GDD_BASE
+                            ): vol.Coerce(float),
+                            vol.Required(
+                                "degree_day_base", default=ACCUMULATOR_DEGREE_DAY_BASE
+                            ): vol.Coerce(float),
+                            vol.Required(
+                                "anemometer_height",
+                                default=ACCUMULATOR_ANEMOMETER_HEIGHT,
+                            ): vol.All(vol.Coerce(float), vol.Range(min=1, max=100)),
+                        }
+                    ),
+                    {"collapsed": True},
+                ),
+                vol.Required("trend_section"): section(
+                    vol.Schema(
+                        {
+                            vol.Required("trend", default=False): bool,
+                            vol.Required(
+                                "windows",
+                                default=[str(window) for window in TREND_WINDOWS],
+                            ): cv.multi_select(TREND_WINDOW_OPTIONS),
+                        }
+                    ),
+                    {"collapsed": True},
+                ),
             }
         )
 
@@ -112,8 +284,19 @@ class WeatherStationConfigFlow(ConfigFlow, domain=DOMAIN):
                 "api_host": "The hostname or IP address of the WeatherLink Live device.",
                 "api_path": "The API path for accessing the WeatherLink Live data.",
                 "update_interval": "The interval (in seconds) at which data should be updated.",
+                "realtime": "Listen for UDP real-time wind and rain broadcasts between polls.",
                 "cache": "Enable or disable caching of API responses for device connection issues.",
                 "cache_age": "The maximum age (in seconds) of cached data before it is considered expired.",
+                "phase_lock": "Time polls to land just after the device refreshes its conditions.",
+                "adaptive": "Adjust the update interval to the weather and device health.",
+                "deadband": "Round noisy readings and skip insignificant changes.",
+                "outliers": "Reject impossible readings and single-poll spikes.",
+                "rolling": "Add rolling low, high and average sensors.",
+                "wind": "Add vector-averaged wind direction and wind rose sensors.",
+                "rain": "Add rain totals per hour, day and rain event.",
+                "trend": "Add barometric trend sensors over short time windows.",
+                "aqi": "Add PM2.5 and PM10 air quality index sensors.",
+                "accumulators": "Add daily evapotranspiration and degree day sensors.",
             },
         )
 
@@ -133,6 +316,8 @@ class WeatherStationOptionsFlow(OptionsFlowWithConfigEntry):
             try:
                 validate_api_host(user_input["api_host"])
                 validate_update_interval(user_input["update_interval"])
+                validate_polling_section(user_input.get("polling_section", {}))
+                validate_trend_section(user_input.get("trend_section", {}))
 
                 # Update options with new values
                 return self.async_create_entry(title="", data=user_input)
@@ -142,6 +327,10 @@ class WeatherStationOptionsFlow(OptionsFlowWithConfigEntry):
                     errors["api_host"] = "api_host_http_not_allowed"
                 elif str(e) == "update_interval_too_low":
                     errors["update_interval"] = "update_interval_too_low"
+                elif str(e) == "adaptive_interval_range":
+                    errors["base"] = "adaptive_interval_range"
+                elif str(e) == "trend_windows_required":
+                    errors["base"] = "trend_windows_required"
 
         # Pre-fill form fields with current options
         data_schema = vol.Schema(
@@ -158,6 +347,10 @@ class WeatherStationOptionsFlow(OptionsFlowWithConfigEntry):
                         "update_interval", API_INITIAL_INTERVAL
                     ),
                 ): cv.positive_int,
+                vol.Required(
+                    "realtime",
+                    default=self.config_entry.options.get("realtime", False),
+                ): bool,
                 vol.Required("cache_section"): section(
                     vol.Schema(
                         {
@@ -177,6 +370,241 @@ class WeatherStationOptionsFlow(OptionsFlowWithConfigEntry):
                     ),
                     {"collapsed": True},
                 ),
+                vol.Required("polling_section"): section(
+                    vol.Schema(
+                        {
+                            vol.Required(
+                                "phase_lock",
+                                default=self.config_entry.options.get(
+                                    "polling_section", {}
+                                ).get("phase_lock", False),
+                            ): bool,
+                            vol.Required(
+                                "adaptive",
+                                default=self.config_entry.options.get(
+                                    "polling_section", {}
+                                ).get("adaptive", False),
+                            ): bool,
+                            vol.Required(
+                                "min_interval",
+                                default=self.config_entry.options.get(
+                                    "polling_section", {}
+                                ).get("min_interval", ADAPTIVE_MIN_INTERVAL),
+                            ): cv.positive_int,
+                            vol.Required(
+                                "max_interval",
+                                default=self.config_entry.options.get(
+                                    "polling_section", {}
+                                ).get("max_interval", ADAPTIVE_MAX_INTERVAL),
+                            ): cv.positive_int,
+                            vol.Required(
+                                "rain_rate_threshold",
+                                default=self.config_entry.options.get(
+                                    "polling_section", {}
+                                ).get("rain_rate_threshold", ADAPTIVE_RAIN_RATE),
+                            ): cv.positive_float,
+                            vol.Required(
+                                "gust_threshold",
+                                default=self.config_entry.options.get(
+                                    "polling_section", {}
+                                ).get("gust_threshold", ADAPTIVE_GUST),
+                            ): cv.positive_float,
+                            vol.Required(
+                                "pressure_trend_threshold",
+                                default=self.config_entry.options.get(
+                                    "polling_section", {}
+                                ).get("pressure_trend_threshold", ADAPTIVE_PRESSURE_TREND),
+                            ): cv.positive_float,
+                        }
+                    ),
+                    {"collapsed": True},
+                ),
+                vol.Required("filter_section"): section(
+                    vol.Schema(
+                        {
+                            vol.Required(
+                                "deadband",
+                                default=self.config_entry.options.get(
+                                    "filter_section", {}
+                                ).get("deadband", False),
+                            ): bool,
+                            vol.Required(
+                                "temperature_deadband",
+                                default=self.config_entry.options.get(
+                                    "filter_section", {}
+                                ).get("temperature_deadband", DEADBAND_TEMPERATURE),
+                            ): cv.positive_float,
+                            vol.Required(
+                                "humidity_deadband",
+                                default=self.config_entry.options.get(
+                                    "filter_section", {}
+                                ).get("humidity_deadband", DEADBAND_HUMIDITY),
+                            ): cv.positive_float,
+                            vol.Required(
+                                "pressure_deadband",
+                                default=self.config_entry.options.get(
+                                    "filter_section", {}
+                                ).get("pressure_deadband", DEADBAND_PRESSURE),
+                            ): cv.positive_float,
+                            vol.Required(
+                                "pm_deadband",
+                                default=self.config_entry.options.get(
+                                    "filter_section", {}
+                                ).get("pm_deadband", DEADBAND_PM),
+                            ): cv.positive_float,
+                            vol.Required(
+                                "heartbeat",
+                                default=self.config_entry.options.get(
+                                    "filter_section", {}
+                                ).get("heartbeat", DEADBAND_HEARTBEAT),
+                            ): cv.positive_int,
+                            vol.Required(
+                                "outliers",
+                                default=self.config_entry.options.get(
+                                    "filter_section", {}
+                                ).get("outliers", False),
+                            ): bool,
+                            vol.Required(
+                                "spike_threshold",
+                                default=self.config_entry.options.get(
+                                    "filter_section", {}
+                                ).get("spike_threshold", OUTLIER_THRESHOLD),
+                            ): cv.positive_float,
+                        }
+                    ),
+                    {"collapsed": True},
+                ),
+                vol.Required("statistics_section"): section(
+                    vol.Schema(
+                        {
+                            vol.Required(
+                                "rolling",
+                                default=self.config_entry.options.get(
+                                    "statistics_section", {}
+                                ).get("rolling", False),
+                            ): bool,
+                            vol.Required(
+                                "windows",
+                                default=self.config_entry.options.get(
+                                    "statistics_section", {}
+                                ).get(
+                                    "windows",
+                                    [str(window) for window in ROLLING_WINDOWS],
+                                ),
+                            ): cv.multi_select(WINDOW_OPTIONS),
+                        }
+                    ),
+                    {"collapsed": True},
+                ),
+                vol.Required("wind_section"): section(
+                    vol.Schema(
+                        {
+                            vol.Required(
+                                "wind",
+                                default=self.config_entry.options.get(
+                                    "wind_section", {}
+                                ).get("wind", False),
+                            ): bool,
+                            vol.Required(
+                                "windows",
+                                default=self.config_entry.options.get(
+                                    "wind_section", {}
+                                ).get(
+                                    "windows",
+                                    [str(window) for window in WIND_WINDOWS],
+                                ),
+                            ): cv.multi_select(WINDOW_OPTIONS),
+                        }
+                    ),
+                    {"collapsed": True},
+                ),
+                vol.Required("rain_section"): section(
+                    vol.Schema(
+                        {
+                            vol.Required(
+                                "rain",
+                                default=self.config_entry.options.get(
+                                    "rain_section", {}
+                                ).get("rain", False),
+                            ): bool,
+                        }
+                    ),
+                    {"collapsed": True},
+                ),
+                vol.Required("aqi_section"): section(
+                    vol.Schema(
+                        {
+                            vol.Required(
+                                "aqi",
+                                default=self.config_entry.options.get(
+                                    "aqi_section", {}
+                                ).get("aqi", False),
+                            ): bool,
+                        }
+                    ),
+                    {"collapsed": True},
+                ),
+                vol.Required("accumulator_section"): section(
+                    vol.Schema(
+                        {
+                            vol.Required(
+                                "accumulators",
+                                default=self.config_entry.options.get(
+                                    "accumulator_section", {}
+                                ).get("accumulators", False),
+                            ): bool,
+                            vol.Required(
+                                "reset_hour",
+                                default=self.config_entry.options.get(
+                                    "accumulator_section", {}
+                                ).get("reset_hour", ACCUMULATOR_RESET_HOUR),
+                            ): vol.All(cv.positive_int, vol.Range(max=23)),
+                            vol.Required(
+                                "gdd_base",
+                                default=self.config_entry.options.get(
+                                    "accumulator_section", {}
+                                ).get("gdd_base", ACCUMULATOR_GDD_BASE),
+                            ): vol.Coerce(float),
+                            vol.Required(
+                                "degree_day_base",
+                                default=self.config_entry.options.get(
+                                    "accumulator_section", {}
+                                ).get("degree_day_base", ACCUMULATOR_DEGREE_DAY_BASE),
+                            ): vol.Coerce(float),
+                            vol.Required(
+                                "anemometer_height",
+                                default=self.config_entry.options.get(
+                                    "accumulator_section", {}
+                                ).get(
+                                    "anemometer_height", ACCUMULATOR_ANEMOMETER_HEIGHT
+                                ),
+                            ): vol.All(vol.Coerce(float), vol.Range(min=1, max=100)),
+                        }
+                    ),
+                    {"collapsed": True},
+                ),
+                vol.Required("trend_section"): section(
+                    vol.Schema(
+                        {
+                            vol.Required(
+                                "trend",
+                                default=self.config_entry.options.get(
+                                    "trend_section", {}
+                                ).get("trend", False),
+                            ): bool,
+                            vol.Required(
+                                "windows",
+                                default=self.config_entry.options.get(
+                                    "trend_section", {}
+                                ).get(
+                                    "windows",
+                                    [str(window) for window in TREND_WINDOWS],
+                                ),
+                            ): cv.multi_select(TREND_WINDOW_OPTIONS),
+                        }
+                    ),
+                    {"collapsed": True},
+                ),
             }
         )
 
@@ -188,7 +616,18 @@ class WeatherStationOptionsFlow(OptionsFlowWithConfigEntry):
                 "api_host": "The hostname or IP address of the WeatherLink Live device.",
                 "api_path": "The API path for accessing the WeatherLink Live data.",
                 "update_interval": "The interval (in seconds) at which data should be updated.",
+                "realtime": "Listen for UDP real-time wind and rain broadcasts between polls.",
                 "cache": "Enable or disable caching of API responses for device connection issues.",
                 "cache_age": "The maximum age (in seconds) of cached data before it is considered expired.",
+                "phase_lock": "Time polls to land just after the device refreshes its conditions.",
+                "adaptive": "Adjust the update interval to the weather and device health.",
+                "deadband": "Round noisy readings and skip insignificant changes.",
+                "outliers": "Reject impossible readings and single-poll spikes.",
+                "rolling": "Add rolling low, high and average sensors.",
+                "wind": "Add vector-averaged wind direction and wind rose sensors.",
+                "rain": "Add rain totals per hour, day and rain event.",
+                "trend": "Add barometric trend sensors over short time windows.",
+                "aqi": "Add PM2.5 and PM10 air quality index sensors.",
+                "accumulators": "Add daily evapotranspiration and degree day sensors.",
             },
         )
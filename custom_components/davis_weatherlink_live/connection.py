@@ -0,0 +1,142 @@
+"""Dedicated HTTP connection to one Davis WeatherLink Live device."""
+
+from __future__ import annotations
+
+import logging
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+
+try:
+    from aiohttp_asyncmdnsresolver.api import AsyncDualMDNSResolver
+except ImportError:  # older Home Assistant, .local names use the system resolver
+    AsyncDualMDNSResolver = None
+
+from .const import CONNECTION_DNS_TTL, CONNECTION_KEEPALIVE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DeviceConnection:
+    """Own a single kept-alive connection to a device.
+
+    The device has a small socket budget and a slow embedded TCP stack, so
+    instead of the shared Home Assistant pool every device gets a session
+    limited to one connection, reused from poll to poll. Host lookups,
+    including zeroconf .local names, are cached for CONNECTION_DNS_TTL.
+    DavisWeatherLinkLive retries a request that fails on a connection the
+    device dropped, and forgets the cached address if connecting fails.
+    """
+
+    def __init__(self, hass: HomeAssistant, host: str) -> None:
+        self.hass = hass
+        self.host = host
+        self._session: aiohttp.ClientSession | None = None
+        # Not closed by the connector, which only closes resolvers it created
+        self._resolver: aiohttp.abc.AbstractResolver | None = None
+
+        self.requests = 0
+        self.connections_opened = 0
+        self.last_connect_time: float | None = None
+        self.last_response_time: float | None = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the session, creating it on first use."""
+
+        if self._session is None:
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_request_start.append(self._on_request_start)
+            trace_config.on_connection_create_start.append(self._on_connect_start)
+            trace_config.on_connection_create_end.append(self._on_connect_end)
+            trace_config.on_request_end.append(self._on_request_end)
+
+            self._resolver = self._make_resolver()
+            connector = aiohttp.TCPConnector(
+                limit=1,
+                limit_per_host=1,
+                keepalive_timeout=CONNECTION_KEEPALIVE,
+                use_dns_cache=True,
+                ttl_dns_cache=CONNECTION_DNS_TTL,
+                resolver=self._resolver,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, trace_configs=[trace_config]
+            )
+        return self._session
+
+    def _make_resolver(self) -> aiohttp.abc.AbstractResolver | None:
+        if AsyncDualMDNSResolver is None:
+            return None
+
+        # Resolve .local names through Home Assistant's zeroconf instance,
+        # the same way the shared Home Assistant session does
+        from homeassistant.components import zeroconf
+
+        return AsyncDualMDNSResolver(
+            async_zeroconf=zeroconf.async_get_async_zeroconf(self.hass)
+        )
+
+    async def async_close(self) -> None:
+        """Close the session, its connection and the resolver."""
+
+        if self._session is not None:
+            _LOGGER.debug("Closing connection to %s", self.host)
+            await self._session.close()
+            self._session = None
+        if self._resolver is not None:
+            await self._resolver.close()
+            self._resolver = None
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return connection statistics for the diagnostics download."""
+
+        return {
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "last_connect_time": self.last_connect_time,
+            "last_response_time": self.last_response_time,
+        }
+
+    async def _on_request_start(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestStartParams,
+    ) -> None:
+        self.requests += 1
+        context.start = time.monotonic()
+        context.connect_time = 0.0
+
+    async def _on_connect_start(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceConnectionCreateStartParams,
+    ) -> None:
+        context.connect_start = time.monotonic()
+
+    async def _on_connect_end(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceConnectionCreateEndParams,
+    ) -> None:
+        self.connections_opened += 1
+        context.connect_time = time.monotonic() - context.connect_start
+        self.last_connect_time = context.connect_time
+
+    async def _on_request_end(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestEndParams,
+    ) -> None:
+        # Time from sending the request to the response headers, without
+        # any time spent opening a new connection
+        self.last_response_time = (
+            time.monotonic() - context.start - context.connect_time
+        )
@@ -5,3 +5,99 @@ API_PATH = "/v1/current_conditions"
 API_TIMEOUT = 10
 API_INITIAL_INTERVAL = 30
 API_INITIAL_MAX_CACHE_AGE = 60
+# Seconds a finished request is shared with callers that arrive right after it
+API_FRESHNESS = 0.5
+
+# Dedicated per-device connection, kept alive between polls
+CONNECTION_KEEPALIVE = 600
+CONNECTION_DNS_TTL = 300
+
+# Requests in flight at once across all configured devices
+HUB_MAX_CONCURRENT_POLLS = 2
+
+# Deadband filter, smaller changes (in native units) are held back until the
+# heartbeat has passed since the value was last written
+DEADBAND_TEMPERATURE = 0.2
+DEADBAND_HUMIDITY = 1.0
+DEADBAND_PRESSURE = 0.003
+DEADBAND_PM = 1.0
+DEADBAND_HEARTBEAT = 900
+
+# Outlier filter, readings are compared with the median of the last
+# OUTLIER_WINDOW readings and rejected as spikes when they are further from
+# it than OUTLIER_THRESHOLD scaled median absolute deviations. The smallest
+# deviation per spike group (native units) keeps steady sensors, whose
+# deviation is near zero, from rejecting every small change.
+OUTLIER_WINDOW = 5
+OUTLIER_THRESHOLD = 3.0
+OUTLIER_MIN_DEVIATION = {"temperature": 2.0, "humidity": 3.0, "pressure": 0.01}
+
+# Rolling statistics windows in seconds, offered and enabled by default, and
+# the number of buckets each window is kept in
+ROLLING_WINDOW_NAMES = {600: "10 min", 3600: "1 h", 10800: "3 h", 86400: "24 h"}
+ROLLING_WINDOWS = (600, 3600, 86400)
+ROLLING_BUCKETS = 120
+
+# Vector-averaged wind direction windows enabled by default, and the window
+# and sectors of the speed-weighted wind rose
+WIND_WINDOWS = (600, 3600)
+WIND_ROSE_WINDOW = 86400
+WIND_ROSE_SECTORS = 16
+
+# Barometric trend windows in seconds, offered and enabled by default, the
+# seconds between kept pressure samples, and the change per 3 hours (inHg)
+# from which pressure is rising or falling slowly and rapidly
+TREND_WINDOW_NAMES = {1800: "30 min", 3600: "1 h", 10800: "3 h"}
+TREND_WINDOWS = (1800, 3600, 10800)
+TREND_MIN_SPACING = 60
+TREND_STEADY = 0.02
+TREND_RAPID = 0.06
+
+# NowCast hours of PM averages, and the share of an hour's five minute
+# periods that need a sample for the hour to count
+AQI_HOURS = 12
+AQI_MIN_COVERAGE = 0.75
+
+# Daily evapotranspiration and degree day accumulators, the local hour
+# they reset at, the base temperatures (°F) of growing and of heating and
+# cooling degree days, and the longest gap (seconds) integrated over
+ACCUMULATOR_RESET_HOUR = 0
+ACCUMULATOR_GDD_BASE = 50.0
+ACCUMULATOR_DEGREE_DAY_BASE = 65.0
+# Height (m) of the anemometer, its wind speed is converted to 2 m for ET0
+ACCUMULATOR_ANEMOMETER_HEIGHT = 10.0
+ACCUMULATOR_MAX_GAP = 900
+
+# Rain accounting buckets, 24 hours of five minute periods, a week of hours
+# and a month of days, and the dry seconds that end a rain event
+RAIN_FIVE_MIN_BUCKETS = 288
+RAIN_HOUR_BUCKETS = 168
+RAIN_DAY_BUCKETS = 31
+RAIN_EVENT_GAP = 21600
+
+# Last snapshot stored for startup, ignored once older than STORE_MAX_AGE seconds
+STORE_VERSION = 1
+STORE_SAVE_DELAY = 30
+STORE_MAX_AGE = 3600
+
+# Real-time UDP broadcast (WeatherLink Live only, AirLink does not support it)
+REALTIME_PATH = "/v1/real_time"
+REALTIME_DURATION = 1200
+REALTIME_RENEW_MARGIN = 60
+# Failed renewals are retried after 5 seconds, doubling up to the margin
+REALTIME_RETRY_MIN = 5
+REALTIME_RETRY_MAX = REALTIME_RENEW_MARGIN
+
+# Phase-locked polling, aligned to the device's own refresh of its conditions
+PHASE_LOCK_MARGIN = 1.5
+PHASE_LOCK_MIN_DELAY = 5
+PHASE_LOCK_SAMPLES = 20
+
+# Adaptive polling, faster during storms and slower on calm nights
+ADAPTIVE_MIN_INTERVAL = 10
+ADAPTIVE_MAX_INTERVAL = 300
+ADAPTIVE_RAIN_RATE = 0.01
+ADAPTIVE_GUST = 15.0
+ADAPTIVE_PRESSURE_TREND = 0.06
+ADAPTIVE_QUIET_GROWTH = 1.25
+ADAPTIVE_MAX_BACKOFF_STEPS = 10
@@ -1,59 +1,125 @@
 """DataUpdateCoordinator for Davis WeatherLink Live integration."""
 
+from __future__ import annotations
+
 import logging
+import time
+from collections.abc import Callable, Mapping
 from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import DOMAIN, HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-
-from .const import API_INITIAL_MAX_CACHE_AGE
+from homeassistant.util import dt as dt_util
+
+from .accumulators import DailyAccumulators, Evapotranspiration
+from .aqi import AirQuality
+from .barometer import BarometricTrends
+from .connection import DeviceConnection
+from .const import (
+    ACCUMULATOR_ANEMOMETER_HEIGHT,
+    ACCUMULATOR_DEGREE_DAY_BASE,
+    ACCUMULATOR_GDD_BASE,
+    ACCUMULATOR_RESET_HOUR,
+    ADAPTIVE_GUST,
+    ADAPTIVE_MAX_INTERVAL,
+    ADAPTIVE_MIN_INTERVAL,
+    ADAPTIVE_PRESSURE_TREND,
+    ADAPTIVE_RAIN_RATE,
+    API_INITIAL_MAX_CACHE_AGE,
+    DEADBAND_HEARTBEAT,
+    DEADBAND_HUMIDITY,
+    DEADBAND_PM,
+    DEADBAND_PRESSURE,
+    DEADBAND_TEMPERATURE,
+    DOMAIN,
+    OUTLIER_MIN_DEVIATION,
+    OUTLIER_THRESHOLD,
+    OUTLIER_WINDOW,
+    REALTIME_PATH,
+    ROLLING_WINDOWS,
+    STORE_MAX_AGE,
+    STORE_SAVE_DELAY,
+    STORE_VERSION,
+    TREND_WINDOWS,
+    WIND_WINDOWS,
+)
 from .davis_weatherlink_live import DavisWeatherLinkLive
+from .filters import DeadbandFilter, OutlierFilter
+from .hub import async_get_hub
+from .rain import RainAccounting
+from .realtime import RealtimeListener
+from .records import RX_STATE_SIGNAL_LOST, ConditionTopology, WeatherSnapshot
+from .rolling import RollingStatistics
+from .scheduler import AdaptiveInterval, PhaseLockedScheduler
+from .wind import WindStatistics
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class _KeyListener:
+    """Subscription of one update callback, movable between coordinators.
+
+    The entity only holds detach, which follows the listener to whichever
+    coordinator it is attached to, so a replaced coordinator is not kept
+    alive by the entities it used to serve.
+    """
+
+    __slots__ = ("update_callback", "context", "coordinator", "_remove")
+
+    def __init__(self, update_callback: CALLBACK_TYPE, context: Any) -> None:
+        self.update_callback = update_callback
+        self.context = context
+        self.coordinator: WeatherCoordinator | None = None
+        self._remove: CALLBACK_TYPE | None = None
+
+    def attach(self, coordinator: WeatherCoordinator) -> None:
+        self.coordinator = coordinator
+        self._remove = DataUpdateCoordinator.async_add_listener(
+            coordinator, self.update_callback, self.context
+        )
+        coordinator._key_listeners.setdefault(self.context, []).append(self)
+
+    @callback
+    def detach(self) -> None:
+        coordinator = self.coordinator
+        if coordinator is None:
+            return
+        self._remove()
+        listeners = coordinator._key_listeners[self.context]
+        listeners.remove(self)
+        if not listeners:
+            del coordinator._key_listeners[self.context]
+        self.coordinator = None
+        self._remove = None
+
+
 class WeatherCoordinator(DataUpdateCoordinator):
     """My example coordinator."""
 
-    data: list[dict[str, Any]]
+    data: WeatherSnapshot
 
     # Track when we last had fresh data
     last_data_received_time = None
 
+    # Device timestamp (data.ts) of the last parsed response, and the number
+    # of polls skipped because the device had not refreshed its conditions
+    last_device_ts = None
+    skipped_cycles = 0
+
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         """Initialize coordinator."""
 
         # Set variables from values entered in config flow and option flow setup
-        self.api_host = config_entry.options.get(
-            "api_host"
-        )  # ,config_entry.data["api_host"])
-        self.api_path = config_entry.options.get(
-            "api_path"
-        )  # ,config_entry.data["api_path"])
-        self.api_update_interval = config_entry.options.get(
-            "update_interval"
-        )  # ,config_entry.data["update_interval"])
-        self.api_cache = config_entry.options.get("cache_section", {}).get(
-            "cache", False
-        )
-        self.api_cache_age = config_entry.options.get("cache_section", {}).get(
-            "cache_age", API_INITIAL_MAX_CACHE_AGE
-        )
-
-        _LOGGER.debug("cache option: %s", self.api_cache)
-        _LOGGER.debug("cache age: %s", self.api_cache_age)
-
-        _LOGGER.debug("API Host: %s", self.api_host)
-        _LOGGER.debug("API Path: %s", self.api_path)
-        _LOGGER.debug("Update Interval: %s", self.api_update_interval)
+        self._read_options(config_entry.options)
 
         # Initialise DataUpdateCoordinator
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=config_entry,
             name=f"{DOMAIN}",
             # Method to call on every update interval.
             update_method=self.async_update_data,
@@ -67,16 +133,637 @@ class WeatherCoordinator(DataUpdateCoordinator):
             always_update=False,
         )
 
+        self.connection, self.wll_local = self._create_client()
+
+        # UDP listener for sub-3-second wind and rain, HTTP polling remains the slow path
+        self.realtime: RealtimeListener | None = None
+
+        # Shared by all coordinators, staggers their polls and limits how many overlap
+        self.hub = async_get_hub(hass)
+        self.hub.register(self, self.api_update_interval)
+
+        # Learns when the device refreshes its conditions to poll just after
+        self.phase_lock = PhaseLockedScheduler()
+
+        # Shortens the interval during storms, lengthens it when calm and
+        # backs off while the device is failing
+        self.adaptive = self._create_adaptive()
+
+        # Replaces impossible readings and spikes with the last accepted value
+        self.outliers = OutlierFilter(
+            self.api_spike_threshold, OUTLIER_MIN_DEVIATION, OUTLIER_WINDOW
+        )
+
+        # Rounds noisy measurements and holds back insignificant changes
+        self.deadband = self._create_deadband()
+
+        # Rolling minimum, maximum and mean sensors, fed by every fresh poll
+        self.rolling = RollingStatistics(self.api_rolling_windows)
+
+        # Vector-averaged wind direction and wind rose, fed by polls and frames
+        self.wind = WindStatistics(self.api_wind_windows)
+
+        # Pressure trends over short windows, fed with unfiltered pressures
+        self.trend = BarometricTrends(self.api_trend_windows)
+
+        # NowCast AQI from hourly PM averages, fed with unfiltered values
+        self.aqi = AirQuality()
+
+        # Daily ET0 and degree days, integrated from every poll
+        self.accumulators = self._create_accumulators()
+
+        # Rain per five minutes, hour and day from counter deltas of polls and frames
+        self.rain = RainAccounting()
+
+        # Last parsed snapshot, restored on startup before the device answers
+        self.store: Store[dict[str, Any]] = Store(
+            hass, STORE_VERSION, f"{DOMAIN}.{config_entry.entry_id}"
+        )
+        self._stored_snapshot = WeatherSnapshot()
+
+        # Last time each device reported without losing its signal, so one
+        # lost transmitter's last good values expire on their own
+        self.device_received: dict[ConditionTopology, datetime] = {}
+
+        # Listeners indexed by entity key, so an update only notifies the
+        # entities whose values changed since the last dispatch
+        self._key_listeners: dict[str | None, list[_KeyListener]] = {}
+        self._dispatched_data: WeatherSnapshot | None = None
+        self._dispatched_success = False
+        # Statistics that changed but were not dispatched yet
+        self._statistics_changed: set[str] = set()
+
+        # Initialise your api here and make available to your integration.
+        # self.api = API(host=self.host, user=self.user, pwd=self.pwd, mock=True)
+
+    def _read_options(self, options: Mapping[str, Any]) -> None:
+        """Set the api_* attributes from the config entry options."""
+
+        self.api_host = options.get("api_host")  # ,config_entry.data["api_host"])
+        self.api_path = options.get("api_path")  # ,config_entry.data["api_path"])
+        self.api_update_interval = options.get(
+            "update_interval"
+        )  # ,config_entry.data["update_interval"])
+        self.api_cache = options.get("cache_section", {}).get("cache", False)
+        self.api_cache_age = options.get("cache_section", {}).get(
+            "cache_age", API_INITIAL_MAX_CACHE_AGE
+        )
+        self.api_realtime = options.get("realtime", False)
+        self.api_polling = options.get("polling_section", {})
+        self.api_phase_lock = self.api_polling.get("phase_lock", False)
+        self.api_adaptive = self.api_polling.get("adaptive", False)
+        self.api_filter = options.get("filter_section", {})
+        self.api_deadband = self.api_filter.get("deadband", False)
+        self.api_outliers = self.api_filter.get("outliers", False)
+        self.api_spike_threshold = self.api_filter.get(
+            "spike_threshold", OUTLIER_THRESHOLD
+        )
+        statistics = options.get("statistics_section", {})
+        self.api_rolling = statistics.get("rolling", False)
+        self.api_rolling_windows = tuple(
+            sorted(int(window) for window in statistics.get("windows", ROLLING_WINDOWS))
+        )
+        wind = options.get("wind_section", {})
+        self.api_wind = wind.get("wind", False)
+        self.api_wind_windows = tuple(
+            sorted(int(window) for window in wind.get("windows", WIND_WINDOWS))
+        )
+        self.api_rain = options.get("rain_section", {}).get("rain", False)
+        self.api_aqi = options.get("aqi_section", {}).get("aqi", False)
+        accumulators = options.get("accumulator_section", {})
+        self.api_accumulators = accumulators.get("accumulators", False)
+        self.api_reset_hour = accumulators.get("reset_hour", ACCUMULATOR_RESET_HOUR)
+        self.api_gdd_base = accumulators.get("gdd_base", ACCUMULATOR_GDD_BASE)
+        self.api_degree_day_base = accumulators.get(
+            "degree_day_base", ACCUMULATOR_DEGREE_DAY_BASE
+        )
+        self.api_anemometer_height = accumulators.get(
+            "anemometer_height", ACCUMULATOR_ANEMOMETER_HEIGHT
+        )
+        trend = options.get("trend_section", {})
+        self.api_trend = trend.get("trend", False)
+        self.api_trend_windows = tuple(
+            sorted(int(window) for window in trend.get("windows", TREND_WINDOWS))
+        )
+
+        _LOGGER.debug("cache option: %s", self.api_cache)
+        _LOGGER.debug("cache age: %s", self.api_cache_age)
+
+        _LOGGER.debug("API Host: %s", self.api_host)
+        _LOGGER.debug("API Path: %s", self.api_path)
+        _LOGGER.debug("Update Interval: %s", self.api_update_interval)
+        _LOGGER.debug("Real-time option: %s", self.api_realtime)
+        _LOGGER.debug("Phase lock option: %s", self.api_phase_lock)
+        _LOGGER.debug("Adaptive interval option: %s", self.api_adaptive)
+        _LOGGER.debug("Deadband filter option: %s", self.api_deadband)
+        _LOGGER.debug(
+            "Outlier filter option: %s threshold %s",
+            self.api_outliers,
+            self.api_spike_threshold,
+        )
+        _LOGGER.debug(
+            "Rolling statistics option: %s %s",
+            self.api_rolling,
+            self.api_rolling_windows,
+        )
+        _LOGGER.debug(
+            "Wind statistics option: %s %s", self.api_wind, self.api_wind_windows
+        )
+        _LOGGER.debug("Rain accounting option: %s", self.api_rain)
+        _LOGGER.debug(
+            "Barometric trend option: %s %s", self.api_trend, self.api_trend_windows
+        )
+        _LOGGER.debug("Air quality index option: %s", self.api_aqi)
+        _LOGGER.debug(
+            "Daily accumulators option: %s reset at %s, bases %s/%s, anemometer %s m",
+            self.api_accumulators,
+            self.api_reset_hour,
+            self.api_gdd_base,
+            self.api_degree_day_base,
+            self.api_anemometer_height,
+        )
+
+    def _sensor_options(self) -> tuple:
+        """Return the options that decide which sensors are created."""
+
+        return (
+            self.api_rolling,
+            self.api_rolling_windows,
+            self.api_wind,
+            self.api_wind_windows,
+            self.api_rain,
+            self.api_trend,
+            self.api_trend_windows,
+            self.api_aqi,
+            self.api_accumulators,
+        )
+
+    def _create_client(self) -> tuple[DeviceConnection, DavisWeatherLinkLive]:
+        """Create the connection and API client for the configured host."""
+
         wll_url = "http://" + self.api_host + self.api_path
         _LOGGER.debug("WeatherLink Live URL %s", wll_url)
 
+        # Dedicated kept-alive connection, the device only has a few sockets
+        connection = DeviceConnection(self.hass, self.api_host)
+
         # Create an instance of the API using the provided URL and pass in websession for API object to use
-        self.wll_local = DavisWeatherLinkLive(
-            wll_url, async_get_clientsession(hass)
-        )  # @config_entry.runtime_data.websession)
+        client = DavisWeatherLinkLive(
+            wll_url,
+            connection.session,
+            realtime_url="http://" + self.api_host + REALTIME_PATH,
+        )
+        return connection, client
+
+    def _create_adaptive(self) -> AdaptiveInterval:
+        polling = self.api_polling
+        return AdaptiveInterval(
+            self.api_update_interval,
+            min_interval=polling.get("min_interval", ADAPTIVE_MIN_INTERVAL),
+            max_interval=polling.get("max_interval", ADAPTIVE_MAX_INTERVAL),
+            rain_rate=polling.get("rain_rate_threshold", ADAPTIVE_RAIN_RATE),
+            gust=polling.get("gust_threshold", ADAPTIVE_GUST),
+            pressure_trend=polling.get(
+                "pressure_trend_threshold", ADAPTIVE_PRESSURE_TREND
+            ),
+        )
 
-        # Initialise your api here and make available to your integration.
-        # self.api = API(host=self.host, user=self.user, pwd=self.pwd, mock=True)
+    def _create_deadband(self) -> DeadbandFilter:
+        options = self.api_filter
+        return DeadbandFilter(
+            {
+                "temperature": options.get(
+                    "temperature_deadband", DEADBAND_TEMPERATURE
+                ),
+                "humidity": options.get("humidity_deadband", DEADBAND_HUMIDITY),
+                "pressure": options.get("pressure_deadband", DEADBAND_PRESSURE),
+                "pm": options.get("pm_deadband", DEADBAND_PM),
+            },
+            heartbeat=options.get("heartbeat", DEADBAND_HEARTBEAT),
+        )
+
+    def _apply_filter_options(self) -> None:
+        """Apply the adaptive polling and deadband options in place.
+
+        New instances would forget the learned interval and the values last
+        written, and the next dispatch would notify every key again.
+        """
+
+        self.adaptive.reconfigure(self._create_adaptive())
+        deadband = self._create_deadband()
+        self.deadband.deadbands = deadband.deadbands
+        self.deadband.heartbeat = deadband.heartbeat
+
+    def _create_accumulators(self) -> DailyAccumulators:
+        config = self.hass.config
+        return DailyAccumulators(
+            Evapotranspiration(config.latitude, config.longitude, config.elevation),
+            reset_hour=self.api_reset_hour,
+            gdd_base=self.api_gdd_base,
+            degree_day_base=self.api_degree_day_base,
+            anemometer_height=self.api_anemometer_height,
+        )
+
+    def _apply_engine_options(self) -> None:
+        """Apply the options that the filters and statistics take in place.
+
+        The outlier filter keeps its recent readings and rejection counts,
+        the accumulators keep today's sums, new settings apply from now on.
+        """
+
+        self.outliers.threshold = self.api_spike_threshold
+        self.accumulators.reset_hour = self.api_reset_hour
+        self.accumulators.gdd_base = self.api_gdd_base
+        self.accumulators.degree_day_base = self.api_degree_day_base
+        self.accumulators.anemometer_height = self.api_anemometer_height
+
+    def _take_over(self, previous: WeatherCoordinator) -> None:
+        """Continue the filters and statistics of the coordinator this one replaces.
+
+        A warm reload must not lose the history collected so far, the 24 h
+        statistics, rain buckets, NowCast hours and today's sums. Engines
+        whose windows changed start over, their sensors are replaced anyway.
+        The history of another device is not continued. Only called once
+        previous is replaced, it keeps its engines until then.
+        """
+
+        if previous.wll_local.api_url != self.wll_local.api_url:
+            return
+        previous.device_received.update(self.device_received)
+        self.device_received = previous.device_received
+        self.outliers = previous.outliers
+        previous.deadband.deadbands = self.deadband.deadbands
+        previous.deadband.heartbeat = self.deadband.heartbeat
+        self.deadband = previous.deadband
+        self.rain = previous.rain
+        self.aqi = previous.aqi
+        self.accumulators = previous.accumulators
+        if previous.rolling.windows == self.rolling.windows:
+            self.rolling = previous.rolling
+        if previous.wind.windows == self.wind.windows:
+            self.wind = previous.wind
+        if previous.trend.windows == self.trend.windows:
+            self.trend = previous.trend
+        self._apply_engine_options()
+
+    async def async_apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply changed options to the running coordinator.
+
+        Changed statistics options and a new host or path replace the
+        coordinator with a warm reload, a new device starts with empty
+        filters and statistics. Other options are applied in place.
+        """
+
+        previous_address = (self.api_host, self.api_path)
+        previous_realtime = self.api_realtime
+        previous_sensors = self._sensor_options()
+        self._read_options(options)
+
+        if (self.api_host, self.api_path) != previous_address:
+            _LOGGER.info("Device address changed, connecting to %s", self.api_host)
+            self._schedule_warm_reload()
+            return
+        if self._sensor_options() != previous_sensors:
+            # Statistics sensors are added and removed with their options
+            _LOGGER.info("Statistics sensors changed, reloading sensors")
+            self._schedule_warm_reload()
+            return
+
+        self._apply_filter_options()
+        self._apply_engine_options()
+
+        if self.api_realtime != previous_realtime:
+            await self._async_stop_realtime()
+
+        self.hub.register(self, self.api_update_interval)
+        self.update_interval = timedelta(seconds=self.api_update_interval)
+        self._schedule_refresh()
+        await self.async_start_realtime()
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates of the entity key given as context."""
+
+        listener = _KeyListener(update_callback, context)
+        listener.attach(self)
+        return listener.detach
+
+    @callback
+    def async_move_listeners(self, coordinator: WeatherCoordinator) -> None:
+        """Move every listener to another coordinator of the same entry.
+
+        Used by a warm reload, entities keep their subscription and the
+        next dispatch of the other coordinator notifies all of them.
+        """
+
+        for listener in [
+            listener
+            for listeners in self._key_listeners.values()
+            for listener in listeners
+        ]:
+            listener.detach()
+            listener.attach(coordinator)
+        coordinator._dispatched_data = None
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners of the keys that changed since the last dispatch.
+
+        Availability changes and the first dispatch notify every listener.
+        Listeners without a key context are always notified, statistics
+        sensors are notified when their own value changed.
+        """
+
+        previous = self._dispatched_data
+        self._dispatched_data = self.data
+        statistics_changed = self._collect_statistics_changes()
+        self._statistics_changed = set()
+        if (
+            not previous
+            or not self.data
+            or self.last_update_success != self._dispatched_success
+        ):
+            self._dispatched_success = self.last_update_success
+            super().async_update_listeners()
+            return
+
+        changed = self.data.changed_keys(previous) | statistics_changed
+        _LOGGER.debug("Dispatching %d changed key(s)", len(changed))
+
+        listeners = list(self._key_listeners.get(None, ()))
+        for key in changed:
+            listeners.extend(self._key_listeners.get(key, ()))
+        for listener in listeners:
+            listener.update_callback()
+
+    def _collect_statistics_changes(self) -> set[str]:
+        """Return the keys of statistics that changed since the last dispatch."""
+
+        self._statistics_changed |= (
+            self.rolling.pop_changed()
+            | self.wind.pop_changed()
+            | self.rain.pop_changed()
+            | self.trend.pop_changed()
+            | self.aqi.pop_changed()
+            | self.accumulators.pop_changed()
+        )
+        return self._statistics_changed
+
+    def _fill_lost_devices(
+        self, new_data: WeatherSnapshot, conditions: list[dict]
+    ) -> WeatherSnapshot:
+        """Serve the last good values of transmitters that lost their signal.
+
+        With caching enabled, a transmitter reporting rx_state Signal Lost
+        keeps its last good value for every field it reports as null until
+        its own cache_age expires. The other devices update immediately.
+        """
+
+        now = datetime.now()
+        previous = self.data
+        if not previous or previous.topology != new_data.topology:
+            previous = None
+        records = list(new_data.records)
+        filled = False
+
+        for position, (device, record, condition) in enumerate(
+            zip(new_data.topology, new_data.records, conditions)
+        ):
+            if record is None:
+                continue
+            if condition.get("rx_state") != RX_STATE_SIGNAL_LOST:
+                self.device_received[device] = now
+                continue
+
+            last_received = self.device_received.get(device)
+            if (
+                not self.api_cache
+                or previous is None
+                or previous.records[position] is None
+                or last_received is None
+            ):
+                continue
+
+            age = (now - last_received).total_seconds()
+            if age > self.api_cache_age:
+                _LOGGER.debug(
+                    "Signal lost for %d seconds, cached values of %s expired",
+                    round(age),
+                    device,
+                )
+                continue
+
+            _LOGGER.debug("Signal lost, using cached values of %s", device)
+            records[position] = record.fill_missing(
+                previous.records[position], condition
+            )
+            filled = True
+
+        if not filled:
+            return new_data
+        return WeatherSnapshot(new_data.topology, tuple(records))
+
+    def _plan_next_refresh(self, fresh: WeatherSnapshot | None) -> None:
+        """Set the delay until the next scheduled poll.
+
+        Called before DataUpdateCoordinator schedules the next refresh, with
+        the data the device returned or None if the poll failed.
+        """
+
+        interval = self.api_update_interval
+        if self.api_adaptive:
+            if fresh is None:
+                interval = self.adaptive.record_failure()
+            else:
+                interval = self.adaptive.record_success(fresh)
+        if self.api_phase_lock:
+            interval = self.phase_lock.next_delay(interval, time.time())
+        elif fresh is not None:
+            # Failed polls keep their backoff, the others move onto their slot
+            interval = self.hub.next_delay(self, interval, self.hass.loop.time())
+        self.update_interval = timedelta(seconds=interval)
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return polling statistics for the diagnostics download."""
+
+        return {
+            "last_update_success": self.last_update_success,
+            "last_data_received_time": self.last_data_received_time,
+            "last_device_ts": self.last_device_ts,
+            "skipped_cycles": self.skipped_cycles,
+            "update_interval": self.update_interval.total_seconds(),
+            "phase_lock": (
+                self.phase_lock.diagnostics() if self.api_phase_lock else None
+            ),
+            "adaptive": self.adaptive.diagnostics() if self.api_adaptive else None,
+            "connection": self.connection.diagnostics(),
+            "hub": self.hub.diagnostics(),
+            "outliers": self.outliers.diagnostics() if self.api_outliers else None,
+            "deadband": self.deadband.diagnostics() if self.api_deadband else None,
+            "rolling": self.rolling.diagnostics() if self.api_rolling else None,
+            "wind": self.wind.diagnostics() if self.api_wind else None,
+            "rain": self.rain.diagnostics() if self.api_rain else None,
+            "trend": self.trend.diagnostics() if self.api_trend else None,
+            "aqi": self.aqi.diagnostics() if self.api_aqi else None,
+            "accumulators": (
+                self.accumulators.diagnostics() if self.api_accumulators else None
+            ),
+            "device_received": {
+                f"{device.data_structure_type}/{device.lsid}": received
+                for device, received in self.device_received.items()
+            },
+            "realtime_frames_received": (
+                None if self.realtime is None else self.realtime.frames_received
+            ),
+        }
+
+    async def async_restore(self) -> bool:
+        """Load the stored snapshot as the current data and the daily sums.
+
+        Returns False if there is no usable snapshot, in which case setup
+        has to wait for the first refresh.
+        """
+
+        stored = await self.store.async_load()
+        if not stored:
+            return False
+
+        # Daily sums stay valid for the rest of their day, unlike the snapshot
+        if self.api_accumulators:
+            try:
+                self.accumulators.restore(
+                    stored.get("accumulators", []), dt_util.now()
+                )
+            except (KeyError, TypeError, ValueError) as err:
+                _LOGGER.warning("Unable to restore stored daily sums: %s", err)
+
+        saved = datetime.fromisoformat(stored["saved"])
+        if (datetime.now() - saved).total_seconds() > STORE_MAX_AGE:
+            _LOGGER.debug("Stored snapshot from %s is too old to restore", saved)
+            return False
+
+        try:
+            self.data = self.wll_local.restore_snapshot(stored["snapshot"])
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Unable to restore stored snapshot: %s", err)
+            return False
+
+        self.last_device_ts = stored.get("device_ts")
+        self.last_data_received_time = saved
+        _LOGGER.debug("Restored snapshot from %s", saved)
+        return bool(self.data)
+
+    @callback
+    def _storage_data(self) -> dict[str, Any]:
+        return {
+            "saved": (self.last_data_received_time or datetime.now()).isoformat(),
+            "device_ts": self.last_device_ts,
+            "snapshot": self.wll_local.dump_snapshot(self._stored_snapshot),
+            "accumulators": self.accumulators.dump(),
+        }
+
+    async def async_warm_reload(self) -> bool:
+        """Replace this coordinator without making its sensors unavailable.
+
+        A new coordinator is built from the current options and refreshed
+        while this one keeps running. Once it has data, it takes over the
+        filters and statistics of this one, listeners and sensors move over
+        in one step and only sensors whose description changed are removed
+        and added again. If the refresh fails, the new coordinator is
+        discarded and this one keeps running unchanged.
+        """
+
+        # The sensor platform imports this module
+        from .sensor import async_swap_sensors
+
+        coordinator = WeatherCoordinator(self.hass, self.config_entry)
+        await coordinator.async_refresh()
+        if not coordinator.last_update_success or not coordinator.data:
+            _LOGGER.warning(
+                "Reload failed, the device did not respond. Keeping the running"
+                " coordinator"
+            )
+            await coordinator.async_shutdown()
+            return False
+        if self.config_entry.runtime_data.coordinator is not self:
+            _LOGGER.debug("Already replaced by another reload")
+            await coordinator.async_shutdown()
+            return False
+
+        # Not shared while both poll, a sample would be counted twice
+        coordinator._take_over(self)
+        self.async_move_listeners(coordinator)
+        self.config_entry.runtime_data.coordinator = coordinator
+        await async_swap_sensors(self.config_entry, coordinator)
+        coordinator.async_update_listeners()
+
+        await self.async_shutdown()
+        await coordinator.async_start_realtime()
+        _LOGGER.info("Reloaded without interrupting the sensors")
+        return True
+
+    def _schedule_warm_reload(self) -> None:
+        async def _async_reload() -> None:
+            replaced = await self.async_warm_reload()
+            if not replaced and self.config_entry.runtime_data.coordinator is self:
+                self.hass.config_entries.async_schedule_reload(
+                    self.config_entry.entry_id
+                )
+
+        self.config_entry.async_create_background_task(
+            self.hass, _async_reload(), f"{DOMAIN} warm reload"
+        )
+
+    async def async_start_realtime(self) -> None:
+        """Start the UDP real-time listener if enabled in options."""
+
+        if not self.api_realtime or self.realtime is not None:
+            return
+
+        listener = RealtimeListener(
+            self.hass, self.wll_local, self.api_host, self._async_handle_realtime_frame
+        )
+        if await listener.async_start():
+            self.realtime = listener
+
+    async def async_shutdown(self) -> None:
+        """Stop scheduled refreshes, the real-time listener and the connection."""
+
+        await self._async_stop_realtime()
+        self.hub.unregister(self)
+        await super().async_shutdown()
+        await self.connection.async_close()
+
+    async def _async_stop_realtime(self) -> None:
+        if self.realtime is not None:
+            await self.realtime.async_stop()
+            self.realtime = None
+
+    @callback
+    def _async_handle_realtime_frame(self, frame: dict) -> None:
+        """Merge a UDP real-time frame into the current data."""
+
+        # Wait for the HTTP slow path to provide the full data set first
+        if not self.data:
+            return
+
+        previous = self.data
+        data = self.wll_local.parse_realtime_data(frame, previous)
+        if data is previous:
+            return
+        if self.api_outliers:
+            data = self.outliers.apply(data, previous)
+        if self.api_wind:
+            self.wind.update(data, time.monotonic(), previous)
+        if self.api_rain:
+            self.rain.update(data, dt_util.now(), previous)
+
+        # Same as async_set_updated_data, but without resetting the poll timer.
+        # Frames arrive every 2.5 seconds and would otherwise starve HTTP polling.
+        self.data = data
+        self.async_update_listeners()
 
     async def async_update_data(self):
         """Fetch data from API endpoint.
@@ -85,6 +772,9 @@ class WeatherCoordinator(DataUpdateCoordinator):
         to be used to provide values for all your entities.
         """
         _LOGGER.debug("Fetching data from API")
+
+        # Data the device returned this poll, None while it is failing
+        fresh: WeatherSnapshot | None = None
         try:
             # ----------------------------------------------------------------------------
             # Get the data from your api
@@ -94,12 +784,34 @@ class WeatherCoordinator(DataUpdateCoordinator):
             # data = await self.hass.async_add_executor_job(self.wll_local.get_weather_data)
 
             # New injected websession based method
-            new_data = await self.wll_local.get_weather_data()
+            async with self.hub.poll() as poll:
+                payload = await self.wll_local.fetch_weather_data()
+                # Connection errors come back as an error response
+                poll.failed = not (payload.get("data") or {}).get("conditions")
+
+            # The device refreshes its conditions on its own cadence, so skip
+            # parsing and dispatch when its timestamp has not advanced
+            device_ts = (payload.get("data") or {}).get("ts")
+            if device_ts is not None:
+                self.phase_lock.observe(device_ts, time.time())
+
+            if self.data and device_ts is not None and device_ts == self.last_device_ts:
+                fresh = self.data
+                self.skipped_cycles += 1
+                self.last_data_received_time = datetime.now()
+                _LOGGER.debug(
+                    "Device timestamp %s has not advanced, skipped %d cycle(s) so far",
+                    device_ts,
+                    self.skipped_cycles,
+                )
+                return self.data
+
+            new_data = self.wll_local.parse_weather_data(payload)
 
             # Initialize data and last data timestamp if it's the first run
             if self.data is None:
                 _LOGGER.debug("first run, initializing data store")
-                self.data = {}
+                self.data = WeatherSnapshot()
                 self.last_data_received_time = datetime.min
 
             # Detect if we have full data or an error state
@@ -107,8 +819,54 @@ class WeatherCoordinator(DataUpdateCoordinator):
             _LOGGER.debug("Count of existing (cached) API data: %d", len(self.data))
 
             if len(new_data) > 0:
+                # First, so no statistic and no entity sees a rejected value
+                if self.api_outliers:
+                    new_data = self.outliers.apply(new_data)
+
                 # Update last_data_received_time to current datetime if we have real data
                 self.last_data_received_time = datetime.now()
+                self.last_device_ts = device_ts
+                fresh = new_data
+
+                # Entities are created from the topology, so new, removed or
+                # re-sized devices need a reload to update them
+                if self.data and new_data.topology != self.data.topology:
+                    _LOGGER.info("Device topology changed, reloading sensors")
+                    self._schedule_warm_reload()
+
+                new_data = self._fill_lost_devices(
+                    new_data, payload["data"]["conditions"]
+                )
+
+                # Before the deadband filter, held back pressures would
+                # flatten the slope into steps and PM averages would drift
+                if self.api_trend:
+                    self.trend.update(new_data, time.monotonic())
+                if self.api_aqi:
+                    self.aqi.update(new_data, time.time())
+                if self.api_deadband:
+                    new_data = self.deadband.apply(new_data, time.monotonic())
+                if self.api_rolling:
+                    self.rolling.update(new_data, time.monotonic())
+                if self.api_wind:
+                    self.wind.update(new_data, time.monotonic())
+                if self.api_rain:
+                    self.rain.update(new_data, dt_util.now())
+                if self.api_accumulators:
+                    self.accumulators.update(new_data, dt_util.now())
+
+                # The base class only dispatches changed data, statistics can
+                # move while every reading is held back or unchanged
+                if (
+                    self.last_update_success
+                    and new_data == self.data
+                    and self._collect_statistics_changes()
+                ):
+                    self.async_update_listeners()
+
+                # Written out debounced, a restart only needs a recent snapshot
+                self._stored_snapshot = new_data
+                self.store.async_delay_save(self._storage_data, STORE_SAVE_DELAY)
 
             # Depending if cache is enabled, expired, or disabled, return merged or new data
             if self.api_cache:
@@ -168,5 +926,8 @@ class WeatherCoordinator(DataUpdateCoordinator):
                 f"UpdateFailed - Error communicating with API: {err}"
             ) from err
 
+        finally:
+            self._plan_next_refresh(fresh)
+
         # What is returned here is stored in self.data by the DataUpdateCoordinator
         # return data
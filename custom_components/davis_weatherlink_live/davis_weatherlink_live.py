@@ -3,12 +3,31 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+from collections.abc import Callable
 from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any
 
 import aiohttp
 
-from .const import API_TIMEOUT
+try:
+    import orjson
+except ImportError:  # optional, Home Assistant ships it but fall back to stdlib
+    orjson = None
+
+from .const import API_FRESHNESS, API_TIMEOUT
+from .records import (
+    RECORD_TYPES,
+    REALTIME_ISS_FIELDS,
+    RX_STATES,
+    ConditionRecord,
+    ConditionTopology,
+    IssRecord,
+    WeatherSnapshot,
+)
+from .registry import DEVICE_ID_FIELDS, device_key_suffix
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,15 +37,46 @@ _LOGGER = logging.getLogger(__name__)
 # AirLink API Reference: https://weatherlink.github.io/airlink-local-api/
 # https://github.com/weatherlink/airlink-local-api/blob/master/index.md
 
+# JSON decoder for response bodies and UDP frames, both read as bytes
+decode_json: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
+
+# Rain cup size indicator to rain amount per bucket tip
+RAIN_CONVERSION_FACTORS = {1: 0.01, 2: 0.2, 3: 0.1, 4: 0.001}
+
+
+class _Flight:
+    """One shared request for current conditions and its parsed result."""
+
+    __slots__ = ("task", "done_at", "snapshot")
+
+    def __init__(self, task: asyncio.Task) -> None:
+        self.task = task
+        self.done_at: float | None = None
+        self.snapshot: WeatherSnapshot | None = None
+
 
 class DavisWeatherLinkLive:
-    def __init__(self, api_url, websession):
+    # Requests in flight or just finished, by URL and shared between clients
+    # so a reload or a second config entry for the same host joins them too
+    _flights: dict[str, _Flight] = {}
+
+    def __init__(
+        self, api_url, websession, realtime_url=None, freshness=API_FRESHNESS
+    ):
         self.api_url = api_url
+        self.realtime_url = realtime_url
         self.injected_websession = websession
+        self.freshness = freshness
+
+        # Last seen topology, reused while unchanged so comparisons stay cheap
+        self.topology: tuple[ConditionTopology, ...] = ()
 
     # POSIX / unix timestamp to datetime object
     @staticmethod
     def unix_to_datetime(unix_timestamp: int) -> datetime:
+        # Real-time frames send 0 instead of null when there is no storm
+        if not unix_timestamp:
+            return None
         try:
             return (
                 datetime.fromtimestamp(unix_timestamp, timezone.utc)
@@ -42,7 +92,7 @@ class DavisWeatherLinkLive:
 
     @staticmethod
     def rx_state_description(value: int) -> str | None:
-        return {0: "Receiving Data", 1: "Missing Packets", 2: "Signal Lost"}.get(value)
+        return RX_STATES.get(value)
 
     @staticmethod
     def wind_dir_to_rose(degrees: int) -> str | None:
@@ -83,8 +133,21 @@ class DavisWeatherLinkLive:
         if not isinstance(rain_amount, (int, float)) or rain_amount <= 0:
             return 0.0
 
-        conversion_factors = {1: 0.01, 2: 0.2, 3: 0.1, 4: 0.001}
-        return rain_amount * conversion_factors.get(rain_unit, 0)
+        return rain_amount * RAIN_CONVERSION_FACTORS.get(rain_unit, 0)
+
+    # Same as calculate_rain_amount with the cup size validated and bound once
+    @staticmethod
+    def rain_amount_converter(rain_unit: int) -> Callable[[int], float]:
+        if rain_unit not in range(1, 5):
+            raise ValueError("cup size indicator must be between 1 and 4")
+        factor = RAIN_CONVERSION_FACTORS[rain_unit]
+
+        def convert(rain_amount: int) -> float:
+            if not isinstance(rain_amount, (int, float)) or rain_amount <= 0:
+                return 0.0
+            return rain_amount * factor
+
+        return convert
 
     @staticmethod
     def zero_if_none(value: int | None) -> int:
@@ -94,18 +157,16 @@ class DavisWeatherLinkLive:
     def zero_float_if_none(value: float | None) -> float:
         return 0.0 if value is None else value
 
-    def parse_weather_data(self, data: dict) -> dict:
+    def parse_weather_data(self, data: dict) -> WeatherSnapshot:
         _LOGGER.debug("Parsing weather data: %s", data)
 
-        weather_data = {}
-
         # Check if the API response has errors first
         if data.get("data", {}).get("error") is not None:
             _LOGGER.error(
                 "Parsed Response API error: %s",
                 data.get("data", {}).get("error"),
             )
-            return weather_data
+            return WeatherSnapshot()
 
         # Check if the API response is all wrong
         if data.get("data", {}) is None:
@@ -113,304 +174,320 @@ class DavisWeatherLinkLive:
                 "Parsed Response API response missing data object: %s",
                 data.get("error"),
             )
-            return weather_data
+            return WeatherSnapshot()
         elif data.get("data", {}).get("conditions") is None:
             _LOGGER.error(
                 "Parsed Response API response missing conditions object: %s",
                 data.get("error"),
             )
-            return weather_data
+            return WeatherSnapshot()
 
-        weather_data.update(
-            {
-                "raw_api": data,
-            }
-        )
+        topology = []
+        records = []
         for condition in data.get("data", {}).get("conditions", []):
-            data_type = condition.get("data_structure_type")
-
-            if data_type == 1:  # ISS Current Conditions record (outside)
-                unique_key = f"_tx{condition.get('txid')}"
-                weather_data.update(
-                    {
-                        "lsid" + unique_key: condition.get("lsid"),
-                        "txid" + unique_key: condition.get("txid"),
-                        "temp" + unique_key: condition.get("temp"),
-                        "hum" + unique_key: condition.get("hum"),
-                        "dew_point" + unique_key: condition.get("dew_point"),
-                        "wet_bulb" + unique_key: condition.get("wet_bulb"),
-                        "heat_index" + unique_key: condition.get("heat_index"),
-                        "wind_chill" + unique_key: condition.get("wind_chill"),
-                        "thw_index" + unique_key: condition.get("thw_index"),
-                        "thsw_index" + unique_key: condition.get("thsw_index"),
-                        "wind_speed_last" + unique_key: condition.get(
-                            "wind_speed_last"
-                        ),
-                        "wind_dir_last" + unique_key: condition.get("wind_dir_last"),
-                        "wind_dir_last_rose"
-                        + unique_key: DavisWeatherLinkLive.wind_dir_to_rose(
-                            condition.get("wind_dir_last")
-                        ),
-                        "wind_speed_avg_last_1_min" + unique_key: condition.get(
-                            "wind_speed_avg_last_1_min"
-                        ),
-                        "wind_dir_scalar_avg_last_1_min" + unique_key: condition.get(
-                            "wind_dir_scalar_avg_last_1_min"
-                        ),
-                        "wind_speed_avg_last_2_min" + unique_key: condition.get(
-                            "wind_speed_avg_last_2_min"
-                        ),
-                        "wind_dir_scalar_avg_last_2_min" + unique_key: condition.get(
-                            "wind_dir_scalar_avg_last_2_min"
-                        ),
-                        "wind_speed_hi_last_2_min"
-                        + unique_key: DavisWeatherLinkLive.zero_float_if_none(
-                            condition.get(
-                                "wind_speed_hi_last_2_min"
-                            )  # bug in API sometimes throws a null when zero wind
-                        ),
-                        "wind_dir_at_hi_speed_last_2_min"
-                        + unique_key: DavisWeatherLinkLive.zero_if_none(
-                            condition.get(
-                                "wind_dir_at_hi_speed_last_2_min"
-                            )  # bug in API sometimes throws a null when zero wind
-                        ),
-                        "wind_speed_avg_last_10_min" + unique_key: condition.get(
-                            "wind_speed_avg_last_10_min"
-                        ),
-                        "wind_dir_scalar_avg_last_10_min" + unique_key: condition.get(
-                            "wind_dir_scalar_avg_last_10_min"
-                        ),
-                        "wind_dir_scalar_avg_last_10_min_rose"
-                        + unique_key: DavisWeatherLinkLive.wind_dir_to_rose(
-                            condition.get("wind_dir_scalar_avg_last_10_min")
-                        ),
-                        "wind_speed_hi_last_10_min" + unique_key: condition.get(
-                            "wind_speed_hi_last_10_min"
-                        ),
-                        "wind_dir_at_hi_speed_last_10_min" + unique_key: condition.get(
-                            "wind_dir_at_hi_speed_last_10_min"
-                        ),
-                        "rain_size" + unique_key: condition.get("rain_size"),
-                        "rain_size_desc"
-                        + unique_key: DavisWeatherLinkLive.rain_size_description(
-                            condition.get("rain_size")
-                        ),
-                        "rain_rate_last"
-                        + unique_key: DavisWeatherLinkLive.calculate_rain_amount(
-                            condition.get("rain_rate_last"), condition.get("rain_size")
-                        ),
-                        "rain_rate_hi"
-                        + unique_key: DavisWeatherLinkLive.calculate_rain_amount(
-                            condition.get("rain_rate_hi"), condition.get("rain_size")
-                        ),
-                        "rainfall_last_15_min"
-                        + unique_key: DavisWeatherLinkLive.calculate_rain_amount(
-                            condition.get("rainfall_last_15_min"),
-                            condition.get("rain_size"),
-                        ),
-                        "rain_rate_hi_last_15_min"
-                        + unique_key: DavisWeatherLinkLive.calculate_rain_amount(
-                            condition.get("rain_rate_hi_last_15_min"),
-                            condition.get("rain_size"),
-                        ),
-                        "rainfall_last_60_min"
-                        + unique_key: DavisWeatherLinkLive.calculate_rain_amount(
-                            condition.get("rainfall_last_60_min"),
-                            condition.get("rain_size"),
-                        ),
-                        "rainfall_last_24_hr"
-                        + unique_key: DavisWeatherLinkLive.calculate_rain_amount(
-                            condition.get("rainfall_last_24_hr"),
-                            condition.get("rain_size"),
-                        ),
-                        "rain_storm"
-                        + unique_key: DavisWeatherLinkLive.calculate_rain_amount(
-                            condition.get("rain_storm"), condition.get("rain_size")
-                        ),
-                        "rain_storm_start_at"
-                        + unique_key: DavisWeatherLinkLive.unix_to_datetime(
-                            condition.get("rain_storm_start_at")
-                        ),
-                        "solar_rad" + unique_key: condition.get("solar_rad"),
-                        "uv_index" + unique_key: condition.get("uv_index"),
-                        "rx_state"
-                        + unique_key: DavisWeatherLinkLive.rx_state_description(
-                            condition.get("rx_state")
-                        ),
-                        "trans_battery_flag"
-                        + unique_key: DavisWeatherLinkLive.battery_low_status(
-                            condition.get("trans_battery_flag")
-                        ),
-                        "rainfall_daily"
-                        + unique_key: DavisWeatherLinkLive.calculate_rain_amount(
-                            condition.get("rainfall_daily"), condition.get("rain_size")
-                        ),
-                        "rainfall_monthly"
-                        + unique_key: DavisWeatherLinkLive.calculate_rain_amount(
-                            condition.get("rainfall_monthly"),
-                            condition.get("rain_size"),
-                        ),
-                        "rainfall_year"
-                        + unique_key: DavisWeatherLinkLive.calculate_rain_amount(
-                            condition.get("rainfall_year"), condition.get("rain_size")
-                        ),
-                        "rain_storm_last"
-                        + unique_key: DavisWeatherLinkLive.calculate_rain_amount(
-                            condition.get("rain_storm_last"), condition.get("rain_size")
-                        ),
-                        "rain_storm_last_start_at"
-                        + unique_key: DavisWeatherLinkLive.unix_to_datetime(
-                            condition.get("rain_storm_last_start_at")
-                        ),
-                        "rain_storm_last_end_at"
-                        + unique_key: DavisWeatherLinkLive.unix_to_datetime(
-                            condition.get("rain_storm_last_end_at")
-                        ),
-                    }
+            get = condition.get
+            topology.append(
+                ConditionTopology(
+                    get("lsid"),
+                    get("data_structure_type"),
+                    get("txid"),
+                    get("rain_size"),
                 )
+            )
 
-            elif data_type == 2:  # Moisture Current Conditions record
-                unique_key = f"_tx{condition.get('txid')}"
-                weather_data.update(
-                    {
-                        "lsid" + unique_key: condition.get("lsid"),
-                        "txid" + unique_key: condition.get("txid"),
-                        "temp_1" + unique_key: condition.get("temp_1"),
-                        "temp_2" + unique_key: condition.get("temp_2"),
-                        "temp_3" + unique_key: condition.get("temp_3"),
-                        "temp_4" + unique_key: condition.get("temp_4"),
-                        "moist_soil_1" + unique_key: condition.get("moist_soil_1"),
-                        "moist_soil_2" + unique_key: condition.get("moist_soil_2"),
-                        "moist_soil_3" + unique_key: condition.get("moist_soil_3"),
-                        "moist_soil_4" + unique_key: condition.get("moist_soil_4"),
-                        "wet_leaf_1" + unique_key: condition.get("wet_leaf_1"),
-                        "wet_leaf_2" + unique_key: condition.get("wet_leaf_2"),
-                        "rx_state"
-                        + unique_key: DavisWeatherLinkLive.rx_state_description(
-                            condition.get("rx_state")
-                        ),
-                        "trans_battery_flag"
-                        + unique_key: DavisWeatherLinkLive.battery_low_status(
-                            condition.get("trans_battery_flag")
-                        ),
-                    }
-                )
+            id_field = DEVICE_ID_FIELDS.get(get("data_structure_type"))
+            if id_field is None:
+                records.append(None)
+                continue
 
-            elif data_type == 3:  # LSS BAR Current Conditions record
-                unique_id = condition.get("lsid")
-                unique_key = f"_ls{unique_id}"
-                weather_data.update(
-                    {
-                        "lsid" + unique_key: condition.get("lsid"),
-                        "bar_sea_level" + unique_key: condition.get("bar_sea_level"),
-                        "bar_trend" + unique_key: condition.get("bar_trend"),
-                        "bar_absolute" + unique_key: condition.get("bar_absolute"),
-                    }
-                )
+            record_type, keys, sources, converters = compiled_fields(
+                get("data_structure_type"), get(id_field), get("rain_size")
+            )
+            values = list(map(get, sources))
+            for index, convert in converters:
+                values[index] = convert(values[index])
+            records.append(record_type(keys, values))
+
+        # Keep the topology instead of the raw payload, which is dropped here
+        topology = tuple(topology)
+        if topology != self.topology:
+            _LOGGER.debug("Device topology changed: %s", topology)
+            self.topology = topology
+        weather_data = WeatherSnapshot(self.topology, tuple(records))
 
-            elif data_type == 4:  # LSS Temp/Hum Current Conditions record (inside)
-                unique_id = condition.get("lsid")
-                unique_key = f"_ls{unique_id}"
-                weather_data.update(
-                    {
-                        "lsid" + unique_key: condition.get("lsid"),
-                        "temp_in" + unique_key: condition.get("temp_in"),
-                        "hum_in" + unique_key: condition.get("hum_in"),
-                        "dew_point_in" + unique_key: condition.get("dew_point_in"),
-                        "heat_index_in" + unique_key: condition.get("heat_index_in"),
-                    }
+        _LOGGER.debug("Formatted weather data: %s", weather_data)
+
+        return weather_data
+
+    def parse_realtime_data(
+        self, data: dict, snapshot: WeatherSnapshot
+    ) -> WeatherSnapshot:
+        """Merge a UDP real-time broadcast frame into a snapshot.
+
+        Frames only carry wind and rain for ISS transmitters. Returns a new
+        snapshot sharing the untouched records, or snapshot itself if the
+        frame did not match any of its transmitters.
+        """
+        records = None
+
+        for condition in data.get("conditions") or []:
+            get = condition.get
+            if get("data_structure_type") != 1:
+                continue
+
+            for position, device in enumerate(snapshot.topology):
+                if device.data_structure_type == 1 and device.txid == get("txid"):
+                    break
+            else:
+                continue
+
+            record = snapshot.records[position]
+            values = record.values.copy()
+            for index, source, convert in compiled_realtime_fields(get("rain_size")):
+                value = get(source)
+                values[index] = value if convert is None else convert(value)
+
+            if records is None:
+                records = list(snapshot.records)
+            records[position] = IssRecord(record.keys, values)
+
+        if records is None:
+            return snapshot
+        return WeatherSnapshot(snapshot.topology, tuple(records))
+
+    async def _read(self, url: str, params: dict | None = None) -> tuple[int, bytes]:
+        """GET url and return the status code and raw body.
+
+        A kept-alive connection the device dropped, for example by rebooting,
+        fails on first use, so the request is retried once on a new one.
+        """
+
+        try:
+            return await self._read_once(url, params)
+        except aiohttp.ClientConnectorError as e:
+            # The device may have come back on a different address
+            connector = self.injected_websession.connector
+            if isinstance(connector, aiohttp.TCPConnector):
+                connector.clear_dns_cache(e.host, e.port)
+            raise
+        except (aiohttp.ServerDisconnectedError, aiohttp.ClientOSError) as e:
+            _LOGGER.debug("Connection to device was reset (%s), reconnecting", e)
+            return await self._read_once(url, params)
+
+    async def _read_once(self, url: str, params: dict | None) -> tuple[int, bytes]:
+        async with self.injected_websession.get(
+            url, params=params, timeout=API_TIMEOUT
+        ) as response:
+            return response.status, await response.read()
+
+    @staticmethod
+    def dump_snapshot(snapshot: WeatherSnapshot) -> dict[str, Any]:
+        """Return a snapshot as JSON serializable data for storage."""
+
+        return {
+            "topology": [list(device) for device in snapshot.topology],
+            "records": [
+                None
+                if record is None
+                else [
+                    value.isoformat() if isinstance(value, datetime) else value
+                    for value in record.values
+                ]
+                for record in snapshot.records
+            ],
+        }
+
+    def restore_snapshot(self, data: dict[str, Any]) -> WeatherSnapshot:
+        """Rebuild a snapshot saved by dump_snapshot.
+
+        Records get the same shared entity keys a parsed response would, so
+        the first live poll is compared field by field as usual.
+        """
+
+        topology = tuple(ConditionTopology(*device) for device in data["topology"])
+        records = []
+        for device, values in zip(topology, data["records"]):
+            id_field = DEVICE_ID_FIELDS.get(device.data_structure_type)
+            if values is None or id_field is None:
+                records.append(None)
+                continue
+
+            record_type, keys, _, _ = compiled_fields(
+                device.data_structure_type,
+                getattr(device, id_field),
+                device.rain_size,
+            )
+            if len(values) != len(keys):
+                raise ValueError(
+                    f"stored record does not match {record_type.__name__}"
                 )
+            values = [
+                datetime.fromisoformat(value)
+                if converter == "unix_to_datetime" and value is not None
+                else value
+                for value, (_, _, converter) in zip(values, record_type.field_table)
+            ]
+            records.append(record_type(keys, values))
+
+        self.topology = topology
+        return WeatherSnapshot(topology, tuple(records))
 
-            elif data_type == 6:  # Air Quality Monitor
-                unique_id = condition.get("lsid")
-                unique_key = f"_ls{unique_id}"
-                weather_data.update(
-                    {
-                        "lsid" + unique_key: condition.get("lsid"),
-                        "temp" + unique_key: condition.get("temp"),
-                        "hum" + unique_key: condition.get("hum"),
-                        "dew_point" + unique_key: condition.get("dew_point"),
-                        "wet_bulb" + unique_key: condition.get("wet_bulb"),
-                        "heat_index" + unique_key: condition.get("heat_index"),
-                        "pm_1_last" + unique_key: condition.get("pm_1_last"),
-                        "pm_2p5_last" + unique_key: condition.get("pm_2p5_last"),
-                        "pm_10_last" + unique_key: condition.get("pm_10_last"),
-                        "pm_1" + unique_key: condition.get("pm_1"),
-                        "pm_2p5" + unique_key: condition.get("pm_2p5"),
-                        "pm_10" + unique_key: condition.get("pm_10"),
-                        "pm_2p5_last_1_hour" + unique_key: condition.get(
-                            "pm_2p5_last_1_hour"
-                        ),
-                        "pm_2p5_last_3_hours" + unique_key: condition.get(
-                            "pm_2p5_last_3_hours"
-                        ),
-                        "pm_2p5_nowcast" + unique_key: condition.get("pm_2p5_nowcast"),
-                        "pm_2p5_last_24_hours" + unique_key: condition.get(
-                            "pm_2p5_last_24_hours"
-                        ),
-                        "pm_10_last_1_hour" + unique_key: condition.get(
-                            "pm_10_last_1_hour"
-                        ),
-                        "pm_10_last_3_hours" + unique_key: condition.get(
-                            "pm_10_last_3_hours"
-                        ),
-                        "pm_10_nowcast" + unique_key: condition.get("pm_10_nowcast"),
-                        "pm_10_last_24_hours" + unique_key: condition.get(
-                            "pm_10_last_24_hours"
-                        ),
-                        "last_report_time"
-                        + unique_key: DavisWeatherLinkLive.unix_to_datetime(
-                            condition.get("last_report_time")
-                        ),
-                        "pct_pm_data_last_1_hour" + unique_key: condition.get(
-                            "pct_pm_data_last_1_hour"
-                        ),
-                        "pct_pm_data_last_3_hours" + unique_key: condition.get(
-                            "pct_pm_data_last_3_hours"
-                        ),
-                        "pct_pm_data_nowcast" + unique_key: condition.get(
-                            "pct_pm_data_nowcast"
-                        ),
-                        "pct_pm_data_last_24_hours" + unique_key: condition.get(
-                            "pct_pm_data_last_24_hours"
-                        ),
-                    }
+    async def start_realtime_broadcast(self, duration: int) -> int | None:
+        """Ask the device to broadcast UDP real-time frames for duration seconds.
+
+        Returns the broadcast port, or None if the request failed.
+        """
+
+        try:
+            status, body = await self._read(
+                self.realtime_url, params={"duration": duration}
+            )
+            if status != 200:
+                _LOGGER.warning(
+                    "received unsuccessful real-time API status code %s", status
                 )
+                return None
+            payload = decode_json(body)
 
-        _LOGGER.debug("Formatted weather data: %s", weather_data)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            _LOGGER.warning("Unable to start real-time broadcast: %s", e)
+            return None
 
-        return weather_data
+        return (payload.get("data") or {}).get("broadcast_port")
 
-    async def get_weather_data(self):
-        """Fetch weather data from API and parse JSON response."""
+    def _join_flight(self) -> _Flight:
+        """Return the request to share, starting one if none is in flight.
+
+        The WeatherLink Live handles concurrent requests badly, so callers
+        for the same URL share one request, and its result for freshness
+        seconds after it finished.
+        """
+
+        loop = asyncio.get_running_loop()
+        flight = self._flights.get(self.api_url)
+        if flight is not None and (
+            not flight.task.done()
+            or (
+                flight.done_at is not None
+                and loop.time() - flight.done_at <= self.freshness
+            )
+        ):
+            _LOGGER.debug("Joining request in flight for %s", self.api_url)
+            return flight
 
+        flight = _Flight(loop.create_task(self._fetch_weather_data()))
+        self._flights[self.api_url] = flight
+
+        def finished(task: asyncio.Task) -> None:
+            flight.done_at = loop.time()
+            if not task.cancelled():
+                # Retrieve the error so it is not logged if no caller is left
+                task.exception()
+            # Drop the shared result, and the raw payload with it, once stale
+            loop.call_later(self.freshness, self._end_flight, self.api_url, flight)
+
+        flight.task.add_done_callback(finished)
+        return flight
+
+    @classmethod
+    def _end_flight(cls, url: str, flight: _Flight) -> None:
+        if cls._flights.get(url) is flight:
+            del cls._flights[url]
+
+    async def fetch_weather_data(self) -> dict:
+        """Fetch and decode weather data from API without parsing it.
+
+        Concurrent callers share one request. Connection errors are returned
+        as an API error response, which parse_weather_data turns into an
+        empty snapshot.
+        """
+
+        # Shielded so a cancelled caller does not cancel the others
+        return await asyncio.shield(self._join_flight().task)
+
+    async def _fetch_weather_data(self) -> dict:
         try:
-            async with self.injected_websession.get(
-                self.api_url, timeout=API_TIMEOUT
-            ) as response:
-                if response.status != 200:
-                    _LOGGER.error(
-                        "received unsuccessful API status code %s",
-                        response.status,
-                    )
-
-                    raise Exception(
-                        f"Davis API responded with unsuccessful status code {response.status}"
-                    )
-                return self.parse_weather_data(await response.json())
+            status, body = await self._read(self.api_url)
+            if status != 200:
+                _LOGGER.error(
+                    "received unsuccessful API status code %s",
+                    status,
+                )
+
+                raise Exception(
+                    f"Davis API responded with unsuccessful status code {status}"
+                )
+            # Read the body once as bytes and decode it without the
+            # intermediate text decoding response.json() would do
+            return decode_json(body)
 
         except aiohttp.ClientConnectorError as e:
-            return self.parse_weather_data(
-                {"data": {"error": "aiohttp.ClientConnectorError connecting to API"}}
-            )
+            return {"data": {"error": "aiohttp.ClientConnectorError connecting to API"}}
 
         except asyncio.TimeoutError as e:
-            return self.parse_weather_data(
-                {"data": {"error": "asyncio.TimeoutError connecting to API"}}
-            )
+            return {"data": {"error": "asyncio.TimeoutError connecting to API"}}
 
         except aiohttp.ClientError as e:
-            return self.parse_weather_data(
-                {"data": {"error": "aiohttp.ClientError connecting to API"}}
-            )
+            return {"data": {"error": "aiohttp.ClientError connecting to API"}}
+
+    async def get_weather_data(self) -> WeatherSnapshot:
+        """Fetch weather data from API and parse JSON response.
+
+        Concurrent callers share the request and the parsed result.
+        """
+
+        flight = self._join_flight()
+        payload = await asyncio.shield(flight.task)
+        if flight.snapshot is None:
+            flight.snapshot = self.parse_weather_data(payload)
+        return flight.snapshot
+
+
+def field_converter(converter: str | None, rain_size: int | None) -> Callable | None:
+    """Resolve a field table converter name for a device's rain cup size."""
+    if converter is None:
+        return None
+    if converter == "calculate_rain_amount":
+        return DavisWeatherLinkLive.rain_amount_converter(rain_size)
+    return getattr(DavisWeatherLinkLive, converter)
+
+
+@lru_cache(maxsize=None)
+def compiled_fields(
+    data_type: int, device_id: int | None, rain_size: int | None
+) -> tuple[
+    type[ConditionRecord],
+    tuple[str, ...],
+    tuple[str, ...],
+    tuple[tuple[int, Callable], ...],
+]:
+    """Compile the field table of one device.
+
+    Entity keys and converters are resolved once per device and rain cup size.
+    Returns the record type, its entity keys, the source field of each value
+    and (value index, converter) pairs for the values that need converting.
+    """
+    record_type = RECORD_TYPES[data_type]
+    unique_key = device_key_suffix(data_type, device_id)
+
+    keys = []
+    sources = []
+    converters = []
+    for index, (source, name, converter) in enumerate(record_type.field_table):
+        keys.append(name + unique_key)
+        sources.append(source)
+        if converter is not None:
+            converters.append((index, field_converter(converter, rain_size)))
+
+    return record_type, tuple(keys), tuple(sources), tuple(converters)
+
+
+@lru_cache(maxsize=None)
+def compiled_realtime_fields(
+    rain_size: int | None,
+) -> tuple[tuple[int, str, Callable | None], ...]:
+    """Compile the real-time field table into (ISS value index, source, converter)."""
+    return tuple(
+        (IssRecord.field_index[name], source, field_converter(converter, rain_size))
+        for source, name, converter in REALTIME_ISS_FIELDS
+    )
@@ -0,0 +1,24 @@
+"""Diagnostics support for Davis WeatherLink Live integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from . import MyConfigEntry
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: MyConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+
+    coordinator = config_entry.runtime_data.coordinator
+
+    return {
+        "options": dict(config_entry.options),
+        "coordinator": coordinator.diagnostics(),
+        "topology": [condition._asdict() for condition in coordinator.data.topology],
+        "data": coordinator.data.as_dict(),
+    }
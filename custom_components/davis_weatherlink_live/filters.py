@@ -0,0 +1,239 @@
+"""Value filters applied to parsed snapshots before they are dispatched."""
+
+from __future__ import annotations
+
+import logging
+from array import array
+from collections import Counter
+from collections.abc import Mapping
+from statistics import median
+from typing import Any
+
+from .records import ConditionRecord, ConditionTopology, WeatherSnapshot
+from .registry import deadband_table, validation_table
+
+_LOGGER = logging.getLogger(__name__)
+
+# Scales the median absolute deviation to a standard deviation
+MAD_SCALE = 1.4826
+
+
+class DeadbandFilter:
+    """Round noisy measurements and hold back changes too small to matter.
+
+    Temperature, humidity, pressure and particulate values jitter in their
+    last digit, and every jitter is a state write and a recorder row. Each
+    value is rounded to the decimals of its device class, then a change
+    smaller than the group's deadband keeps the value last written. A held
+    back value is written anyway once heartbeat seconds have passed since
+    the last write, so the state never lags the device for long.
+    """
+
+    def __init__(self, deadbands: Mapping[str, float], heartbeat: float) -> None:
+        self.deadbands = deadbands
+        self.heartbeat = heartbeat
+        self.suppressed = 0
+
+        # Value last written and when, by device and value index
+        self._written: dict[ConditionTopology, dict[int, tuple[float, float]]] = {}
+
+    def apply(self, snapshot: WeatherSnapshot, now: float) -> WeatherSnapshot:
+        """Return the snapshot with filtered values, now in monotonic seconds."""
+
+        records = []
+        for device, record in zip(snapshot.topology, snapshot.records):
+            if record is not None:
+                record = self._apply_record(device, record, now)
+            records.append(record)
+        return WeatherSnapshot(snapshot.topology, tuple(records))
+
+    def _apply_record(
+        self, device: ConditionTopology, record: ConditionRecord, now: float
+    ) -> ConditionRecord:
+        table = deadband_table(record.data_structure_type)
+        if not table:
+            return record
+
+        written = self._written.setdefault(device, {})
+        values = record.values
+        for index, group, decimals in table:
+            value = values[index]
+            if not isinstance(value, (int, float)):
+                continue
+
+            value = round(value, decimals)
+            last = written.get(index)
+            if (
+                last is not None
+                and abs(value - last[0]) < self.deadbands[group]
+                and now - last[1] < self.heartbeat
+            ):
+                if value != last[0]:
+                    self.suppressed += 1
+                value = last[0]
+            else:
+                written[index] = (value, now)
+
+            if value != values[index]:
+                if values is record.values:
+                    values = list(values)
+                values[index] = value
+
+        if values is record.values:
+            return record
+        return type(record)(record.keys, values)
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the filter settings and counts for the diagnostics download."""
+
+        return {
+            "deadbands": dict(self.deadbands),
+            "heartbeat": self.heartbeat,
+            "suppressed": self.suppressed,
+        }
+
+
+class _Window:
+    """Last readings of one value, a ring in a fixed-size array."""
+
+    __slots__ = ("samples", "position", "count")
+
+    def __init__(self, size: int) -> None:
+        self.samples = array("d", [0.0] * size)
+        self.position = 0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        self.samples[self.position] = value
+        self.position = (self.position + 1) % len(self.samples)
+        self.count = min(self.count + 1, len(self.samples))
+
+    def readings(self) -> array:
+        return self.samples[: self.count]
+
+
+class OutlierFilter:
+    """Reject impossible readings and single-poll spikes before anything sees them.
+
+    Every value with a range in the registry is checked against it, so a
+    garbled wind speed of 42606 mph never reaches an entity. Temperature,
+    humidity and pressure then go through a Hampel filter: each reading
+    joins a ring of the last window readings and is rejected if it is
+    further from their median than threshold times their scaled median
+    absolute deviation, or the group's minimum deviation if that is
+    larger. A rejected value is replaced with the last accepted one.
+
+    Spikes stay in the ring, so a genuine step change is accepted as soon
+    as it makes up most of the window, a couple of polls late.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        min_deviations: Mapping[str, float],
+        window: int,
+    ) -> None:
+        self.threshold = threshold
+        self.min_deviations = min_deviations
+        self.window = window
+        # Rejected readings by entity key
+        self.out_of_range: Counter[str] = Counter()
+        self.spikes: Counter[str] = Counter()
+
+        # Recent readings and the value last accepted, by device and value index
+        self._windows: dict[ConditionTopology, dict[int, _Window]] = {}
+        self._accepted: dict[ConditionTopology, dict[int, float]] = {}
+
+    def apply(
+        self, snapshot: WeatherSnapshot, previous: WeatherSnapshot | None = None
+    ) -> WeatherSnapshot:
+        """Return the snapshot with rejected values replaced.
+
+        previous is the snapshot a real-time frame was merged into. Values
+        unchanged since then were already checked and are skipped, so they
+        do not fill the windows with repeats.
+        """
+
+        if previous is not None and previous.topology != snapshot.topology:
+            previous = None
+        records = []
+        replaced = False
+        for position, (device, record) in enumerate(
+            zip(snapshot.topology, snapshot.records)
+        ):
+            old = None if previous is None else previous.records[position]
+            if record is not None and record is not old:
+                checked = self._apply_record(device, record, old)
+                replaced |= checked is not record
+                record = checked
+            records.append(record)
+
+        if not replaced:
+            return snapshot
+        return WeatherSnapshot(snapshot.topology, tuple(records))
+
+    def _apply_record(
+        self,
+        device: ConditionTopology,
+        record: ConditionRecord,
+        old: ConditionRecord | None,
+    ) -> ConditionRecord:
+        table = validation_table(record.data_structure_type)
+        if not table:
+            return record
+
+        accepted = self._accepted.setdefault(device, {})
+        values = record.values
+        for index, lowest, highest, group in table:
+            value = values[index]
+            if not isinstance(value, (int, float)) or (
+                old is not None and value == old.values[index]
+            ):
+                continue
+
+            key = record.keys[index]
+            if not lowest <= value <= highest:
+                self.out_of_range[key] += 1
+                _LOGGER.debug("Rejected %s of %s, out of range", value, key)
+            elif group is not None and self._is_spike(device, index, value, group):
+                self.spikes[key] += 1
+                _LOGGER.debug("Rejected %s of %s as a spike", value, key)
+            else:
+                accepted[index] = value
+                continue
+
+            if values is record.values:
+                values = list(values)
+            values[index] = accepted.get(index)
+
+        if values is record.values:
+            return record
+        return type(record)(record.keys, values)
+
+    def _is_spike(
+        self, device: ConditionTopology, index: int, value: float, group: str
+    ) -> bool:
+        windows = self._windows.setdefault(device, {})
+        window = windows.get(index)
+        if window is None:
+            window = windows[index] = _Window(self.window)
+        window.add(value)
+        if window.count < 3:
+            return False
+
+        readings = window.readings()
+        center = median(readings)
+        deviation = median(abs(reading - center) for reading in readings)
+        scale = max(MAD_SCALE * deviation, self.min_deviations[group])
+        return abs(value - center) > self.threshold * scale
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the filter settings and rejections for the diagnostics download."""
+
+        return {
+            "threshold": self.threshold,
+            "window": self.window,
+            "min_deviations": dict(self.min_deviations),
+            "out_of_range": dict(self.out_of_range),
+            "spikes": dict(self.spikes),
+        }
@@ -0,0 +1,142 @@
+"""Poll hub shared by all Davis WeatherLink Live config entries."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Hashable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, HUB_MAX_CONCURRENT_POLLS
+
+
+class _Poll:
+    """One poll holding a slot, failed if it raised or its member says so."""
+
+    __slots__ = ("failed",)
+
+    def __init__(self) -> None:
+        # Set by the member for error responses, which are not raised
+        self.failed = False
+
+
+class PollHub:
+    """Spread the polls of every configured device and limit how many overlap.
+
+    Every config entry polls on its own timer, so devices set to the same
+    interval tend to poll together and contend for the same Wi-Fi segment.
+    The hub gives each member (a coordinator) a slot, spaced evenly across
+    the shortest interval of all members on a clock they share, so members
+    with longer intervals still land on their own slot, and lets at most
+    HUB_MAX_CONCURRENT_POLLS requests run at the same time. The others wait
+    for a free slot instead of timing out together.
+    """
+
+    def __init__(self, max_concurrent: int = HUB_MAX_CONCURRENT_POLLS) -> None:
+        self.max_concurrent = max_concurrent
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._members: list[Hashable] = []
+        self._intervals: dict[Hashable, float] = {}
+
+        self.polls = 0
+        self.failures = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_duration = 0.0
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def register(self, member: Hashable, interval: float) -> None:
+        """Give a member a slot, or update the interval it polls at."""
+
+        if member not in self._members:
+            self._members.append(member)
+        self._intervals[member] = interval
+
+    def unregister(self, member: Hashable) -> None:
+        """Free the slot of a member, the others spread out again."""
+
+        if member in self._members:
+            self._members.remove(member)
+            del self._intervals[member]
+
+    @property
+    def period(self) -> float:
+        """Return the period the slots are spread across, the shortest interval."""
+
+        return min(self._intervals.values())
+
+    def next_delay(self, member: Hashable, interval: float, now: float) -> float:
+        """Return seconds from now until the member's slot closest to interval."""
+
+        if member not in self._members or len(self._members) < 2:
+            return interval
+
+        period = self.period
+        phase = self._members.index(member) / len(self._members) * period
+        # Move the poll by at most half a period either way onto its slot
+        shift = (phase - now - interval) % period
+        if shift > period / 2:
+            shift -= period
+        # An interval shortened below the period is only ever delayed
+        if shift < -interval / 2:
+            shift += period
+        return interval + shift
+
+    @asynccontextmanager
+    async def poll(self) -> AsyncIterator[_Poll]:
+        """Hold one of the concurrent request slots and record the poll."""
+
+        queued = time.monotonic()
+        async with self._semaphore:
+            started = time.monotonic()
+            wait = started - queued
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            poll = _Poll()
+            try:
+                yield poll
+            except BaseException:
+                poll.failed = True
+                raise
+            finally:
+                self.in_flight -= 1
+                self.polls += 1
+                if poll.failed:
+                    self.failures += 1
+                self.total_duration += time.monotonic() - started
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return aggregate poll statistics for the diagnostics download."""
+
+        return {
+            "members": len(self._members),
+            "period": self.period if self._members else None,
+            "max_concurrent": self.max_concurrent,
+            "polls": self.polls,
+            "failures": self.failures,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "mean_wait": self.total_wait / self.polls if self.polls else None,
+            "max_wait": self.max_wait,
+            "mean_duration": (
+                self.total_duration / self.polls if self.polls else None
+            ),
+        }
+
+
+def async_get_hub(hass: HomeAssistant) -> PollHub:
+    """Return the hub shared by all coordinators, creating it on first use."""
+
+    hub = hass.data.get(DOMAIN)
+    if hub is None:
+        hub = hass.data[DOMAIN] = PollHub()
+    return hub
@@ -0,0 +1,309 @@
+"""Incremental rain accounting of ISS transmitters."""
+
+from __future__ import annotations
+
+from array import array
+from datetime import datetime
+from typing import Any
+
+from .const import (
+    RAIN_DAY_BUCKETS,
+    RAIN_EVENT_GAP,
+    RAIN_FIVE_MIN_BUCKETS,
+    RAIN_HOUR_BUCKETS,
+)
+from .davis_weatherlink_live import RAIN_CONVERSION_FACTORS, DavisWeatherLinkLive
+from .records import ConditionRecord, WeatherSnapshot
+from .registry import rain_key
+
+
+class RainBuckets:
+    """Bucket tips per time slot in a fixed-size ring.
+
+    Slots are consecutive integers (five minute periods, hours or days).
+    Each ring position remembers the slot it holds, so a position left
+    over from an earlier lap counts as empty without ever being cleared.
+    """
+
+    __slots__ = ("size", "counts", "slots")
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.counts = array("l", [0] * size)
+        self.slots = array("q", [-1] * size)
+
+    def add(self, slot: int, count: int) -> None:
+        index = slot % self.size
+        if self.slots[index] != slot:
+            self.slots[index] = slot
+            self.counts[index] = 0
+        self.counts[index] += count
+
+    def get(self, slot: int) -> int:
+        index = slot % self.size
+        return self.counts[index] if self.slots[index] == slot else 0
+
+    def total(self, first: int, last: int) -> int:
+        """Return the tips of the slots first to last, both included."""
+        return sum(self.get(slot) for slot in range(first, last + 1))
+
+
+class _Gauge:
+    """Counters and buckets of one transmitter."""
+
+    __slots__ = (
+        "factor",
+        "daily",
+        "year",
+        "day",
+        "five_min",
+        "hours",
+        "days",
+        "first_five_min",
+        "first_hour",
+        "first_day",
+        "newest",
+        "event_tips",
+        "event_start",
+        "last_tip",
+        "peak_rate",
+    )
+
+    def __init__(self, factor: float) -> None:
+        self.factor = factor
+        # Last daily and year counters, in bucket tips, and the day of them
+        self.daily: int | None = None
+        self.year: int | None = None
+        self.day = 0
+        self.five_min = RainBuckets(RAIN_FIVE_MIN_BUCKETS)
+        self.hours = RainBuckets(RAIN_HOUR_BUCKETS)
+        self.days = RainBuckets(RAIN_DAY_BUCKETS)
+        # Slots of the first sample, earlier slots were never observed
+        self.first_five_min = 0
+        self.first_hour = 0
+        self.first_day = 0
+        # Newest (five minute, hour, day) slot, clocks turned back stay on it
+        self.newest = (0, 0, 0)
+        self.event_tips = 0
+        self.event_start: datetime | None = None
+        self.last_tip: datetime | None = None
+        self.peak_rate = 0.0
+
+
+class RainAccounting:
+    """Rain per five minutes, hour and day, kept from the device's counters.
+
+    The device reports running totals (rainfall_daily, rainfall_year),
+    converted to rain amounts by calculate_rain_amount. They are turned
+    back into bucket tips and only the difference to the previous poll or
+    real-time frame is added to the current five minute, hour and local
+    day bucket. Counters only reset at the device's midnight or year
+    rollover, so a counter that went down on another day, or to at most
+    half its value, was reset and the other counter is used instead, or
+    the new value itself if both were reset. Any other decrease is an
+    older reading, a poll answered just before a newer real-time frame,
+    and is ignored. Buckets live in fixed-size rings, so reading a total
+    never scans history.
+
+    The first sample seeds today with rainfall_daily, rain before the
+    first sample in earlier slots is unknown and reported as None.
+    """
+
+    def __init__(self) -> None:
+        self.values: dict[str, float | None] = {}
+        self.attributes: dict[str, dict[str, Any]] = {}
+        self._gauges: dict[int | None, _Gauge] = {}
+        self._changed: set[str] = set()
+
+    def update(
+        self,
+        snapshot: WeatherSnapshot,
+        now: datetime,
+        previous: WeatherSnapshot | None = None,
+    ) -> None:
+        """Add the rain of every ISS record not shared with previous.
+
+        now is the local time of the sample, its day is the day of the
+        daily buckets.
+        """
+
+        for position, (device, record) in enumerate(
+            zip(snapshot.topology, snapshot.records)
+        ):
+            if record is None or device.data_structure_type != 1:
+                continue
+            # A real-time merge shares the records of the other transmitters
+            if (
+                previous is not None
+                and position < len(previous.records)
+                and previous.records[position] is record
+            ):
+                continue
+            factor = RAIN_CONVERSION_FACTORS.get(device.rain_size)
+            if factor is None:
+                continue
+
+            gauge = self._gauges.get(device.txid)
+            if gauge is None or gauge.factor != factor:
+                gauge = self._gauges[device.txid] = _Gauge(factor)
+            self._add(gauge, record, now)
+            self._set_values(device.txid, device.rain_size, gauge, now)
+
+    def _add(self, gauge: _Gauge, record: ConditionRecord, now: datetime) -> None:
+        daily = self._tips(gauge, record.get("rainfall_daily"))
+        year = self._tips(gauge, record.get("rainfall_year"))
+        if daily is None and year is None:
+            return
+        slots = self._slots(gauge, now)
+
+        if gauge.daily is None and gauge.year is None:
+            # First sample, today so far is known from the daily counter
+            gauge.first_five_min, gauge.first_hour, gauge.first_day = slots
+            gauge.days.add(slots[2], daily or 0)
+            tips = 0
+        elif not daily and not year:
+            # Both counters blank while the signal is lost, keep the last ones
+            return
+        else:
+            rollover = slots[2] != gauge.day
+            tips = None
+            for last, current in ((gauge.year, year), (gauge.daily, daily)):
+                if last is None or current is None:
+                    continue
+                if current >= last:
+                    tips = current - last
+                    break
+                if not rollover and current * 2 > last:
+                    # Older than the last reading, keep the counters at their maximum
+                    return
+            if tips is None:
+                # Both reset at once, midnight of the rain year's first day
+                tips = daily if daily is not None else year
+            gauge.five_min.add(slots[0], tips)
+            gauge.hours.add(slots[1], tips)
+            gauge.days.add(slots[2], tips)
+        gauge.daily = daily
+        gauge.year = year
+        gauge.day = slots[2]
+
+        if gauge.event_start is not None and (
+            (now - gauge.last_tip).total_seconds() > RAIN_EVENT_GAP
+        ):
+            gauge.event_start = None
+        if tips > 0:
+            if gauge.event_start is None:
+                gauge.event_start = now
+                gauge.event_tips = 0
+                gauge.peak_rate = 0.0
+            gauge.event_tips += tips
+            gauge.last_tip = now
+        rate = record.get("rain_rate_last")
+        if gauge.event_start is not None and isinstance(rate, (int, float)):
+            gauge.peak_rate = max(gauge.peak_rate, rate)
+
+    @staticmethod
+    def _tips(gauge: _Gauge, amount: Any) -> int | None:
+        if not isinstance(amount, (int, float)):
+            return None
+        return round(amount / gauge.factor)
+
+    @staticmethod
+    def _slots(gauge: _Gauge, now: datetime) -> tuple[int, int, int]:
+        offset = now.utcoffset()
+        seconds = int(now.timestamp()) + (
+            int(offset.total_seconds()) if offset is not None else 0
+        )
+        slots = (seconds // 300, seconds // 3600, now.toordinal())
+        # The hour repeated when summer time ends is added to the later one
+        gauge.newest = tuple(map(max, slots, gauge.newest))
+        return gauge.newest
+
+    def _set_values(
+        self, txid: int | None, rain_size: int, gauge: _Gauge, now: datetime
+    ) -> None:
+        if gauge.daily is None and gauge.year is None:
+            return
+        five_min, hour, day = self._slots(gauge, now)
+
+        def amount(buckets: RainBuckets, first: int, last: int, known: int):
+            if first < known:
+                return None
+            return round(
+                DavisWeatherLinkLive.calculate_rain_amount(
+                    buckets.total(first, last), rain_size
+                ),
+                3,
+            )
+
+        # Days are seeded, hours and five minute periods start partial
+        self._set(
+            rain_key("rain_today", txid),
+            amount(gauge.days, day, day, gauge.first_day),
+        )
+        self._set(
+            rain_key("rain_yesterday", txid),
+            amount(gauge.days, day - 1, day - 1, gauge.first_day),
+        )
+        self._set(
+            rain_key("rain_last_7_days", txid),
+            amount(gauge.days, day - 6, day, gauge.first_day),
+        )
+        self._set(
+            rain_key("rain_this_hour", txid),
+            amount(gauge.hours, hour, hour, gauge.first_hour + 1),
+        )
+        self._set(
+            rain_key("rain_last_hour", txid),
+            amount(gauge.hours, hour - 1, hour - 1, gauge.first_hour + 1),
+        )
+        self._set(
+            rain_key("rain_last_3_hr", txid),
+            amount(gauge.five_min, five_min - 35, five_min, gauge.first_five_min + 1),
+        )
+
+        if gauge.event_start is None:
+            self._set(rain_key("rain_event", txid), 0.0, {})
+        else:
+            self._set(
+                rain_key("rain_event", txid),
+                round(
+                    DavisWeatherLinkLive.calculate_rain_amount(
+                        gauge.event_tips, rain_size
+                    ),
+                    3,
+                ),
+                {
+                    "start": gauge.event_start.isoformat(),
+                    "last_rain": gauge.last_tip.isoformat(),
+                    "peak_rate": round(gauge.peak_rate, 3),
+                },
+            )
+
+    def _set(
+        self, key: str, value: float | None, attributes: dict[str, Any] | None = None
+    ) -> None:
+        if key not in self.values or self.values[key] != value or (
+            attributes is not None and self.attributes.get(key) != attributes
+        ):
+            self.values[key] = value
+            if attributes is not None:
+                self.attributes[key] = attributes
+            self._changed.add(key)
+
+    def pop_changed(self) -> set[str]:
+        """Return and reset the keys of rain totals that changed."""
+
+        changed = self._changed
+        self._changed = set()
+        return changed
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the counters and current totals for the diagnostics download."""
+
+        return {
+            "counters": {
+                txid: {"daily": gauge.daily, "year": gauge.year}
+                for txid, gauge in self._gauges.items()
+            },
+            "values": dict(self.values),
+        }
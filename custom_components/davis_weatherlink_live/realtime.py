@@ -0,0 +1,152 @@
+"""UDP real-time broadcast listener for Davis WeatherLink Live."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import socket
+from collections.abc import Callable
+from datetime import timedelta
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+
+from .const import (
+    REALTIME_DURATION,
+    REALTIME_RENEW_MARGIN,
+    REALTIME_RETRY_MAX,
+    REALTIME_RETRY_MIN,
+)
+from .davis_weatherlink_live import DavisWeatherLinkLive, decode_json
+
+_LOGGER = logging.getLogger(__name__)
+
+# Real-time API Reference:
+# https://weatherlink.github.io/weatherlink-live-local-api/#real-time-broadcast
+
+
+class RealtimeProtocol(asyncio.DatagramProtocol):
+    """Decode broadcast datagrams from one device and pass them on."""
+
+    def __init__(
+        self, addresses: set[str], frame_callback: Callable[[dict], None]
+    ) -> None:
+        self.addresses = addresses
+        self.frame_callback = frame_callback
+
+    def datagram_received(self, data: bytes, addr: tuple) -> None:
+        # Every WeatherLink Live on the network broadcasts to the same port
+        if addr[0] not in self.addresses:
+            return
+
+        try:
+            frame = decode_json(data)
+        except ValueError:
+            _LOGGER.debug("Ignoring malformed real-time frame from %s", addr[0])
+            return
+
+        self.frame_callback(frame)
+
+    def error_received(self, exc: Exception) -> None:
+        _LOGGER.debug("Real-time socket error: %s", exc)
+
+
+class RealtimeListener:
+    """Keep a real-time broadcast lease alive and listen for its frames."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: DavisWeatherLinkLive,
+        host: str,
+        frame_callback: Callable[[dict], None],
+    ) -> None:
+        self.hass = hass
+        self.client = client
+        self.host = host
+        self.frame_callback = frame_callback
+        self.frames_received = 0
+
+        self._transport: asyncio.DatagramTransport | None = None
+        self._cancel_renew: CALLBACK_TYPE | None = None
+        self._cancel_retry: CALLBACK_TYPE | None = None
+        self._retry_delay = REALTIME_RETRY_MIN
+
+    async def async_start(self) -> bool:
+        """Request a broadcast lease and bind the UDP socket."""
+
+        port = await self.client.start_realtime_broadcast(REALTIME_DURATION)
+        if port is None:
+            _LOGGER.warning(
+                "Device %s did not start a real-time broadcast, using HTTP polling only",
+                self.host,
+            )
+            return False
+
+        try:
+            infos = await self.hass.loop.getaddrinfo(
+                self.host, None, type=socket.SOCK_DGRAM
+            )
+            self._transport, _ = await self.hass.loop.create_datagram_endpoint(
+                lambda: RealtimeProtocol(
+                    {info[4][0] for info in infos}, self._handle_frame
+                ),
+                local_addr=("0.0.0.0", port),
+                reuse_port=True,
+            )
+        except OSError as err:
+            _LOGGER.warning(
+                "Unable to listen for real-time broadcasts on port %s: %s", port, err
+            )
+            return False
+
+        _LOGGER.debug("Listening for real-time broadcasts on port %s", port)
+
+        # Renew the lease before the device stops broadcasting
+        self._cancel_renew = async_track_time_interval(
+            self.hass,
+            self._async_renew,
+            timedelta(seconds=REALTIME_DURATION - REALTIME_RENEW_MARGIN),
+        )
+        return True
+
+    async def async_stop(self) -> None:
+        """Stop renewing the lease and close the socket."""
+
+        if self._cancel_renew is not None:
+            self._cancel_renew()
+            self._cancel_renew = None
+        if self._cancel_retry is not None:
+            self._cancel_retry()
+            self._cancel_retry = None
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    async def _async_renew(self, _now=None) -> None:
+        if self._cancel_retry is not None:
+            self._cancel_retry()
+            self._cancel_retry = None
+
+        port = await self.client.start_realtime_broadcast(REALTIME_DURATION)
+        if self._transport is None:
+            return
+        if port is not None:
+            self._retry_delay = REALTIME_RETRY_MIN
+            return
+
+        # The lease runs out a minute after a failed renewal, so retry soon
+        # instead of waiting for the next interval and missing frames
+        if self._retry_delay == REALTIME_RETRY_MIN:
+            _LOGGER.warning(
+                "Unable to renew real-time broadcast lease, retrying until it succeeds"
+            )
+        self._cancel_retry = async_call_later(
+            self.hass, self._retry_delay, self._async_renew
+        )
+        self._retry_delay = min(self._retry_delay * 2, REALTIME_RETRY_MAX)
+
+    @callback
+    def _handle_frame(self, frame: dict) -> None:
+        self.frames_received += 1
+        self.frame_callback(frame)
@@ -0,0 +1,202 @@
+"""Typed condition records and snapshots for Davis WeatherLink Live data."""
+
+from __future__ import annotations
+
+from typing import Any, ClassVar, NamedTuple
+
+from .registry import parse_table
+
+# UDP real-time frames only carry ISS wind and rain, and use shorter names
+# for the rolling rain counters
+REALTIME_ISS_FIELDS = (
+    ("wind_speed_last", "wind_speed_last", None),
+    ("wind_dir_last", "wind_dir_last", None),
+    ("wind_dir_last", "wind_dir_last_rose", "wind_dir_to_rose"),
+    ("wind_speed_hi_last_10_min", "wind_speed_hi_last_10_min", None),
+    ("wind_dir_at_hi_speed_last_10_min", "wind_dir_at_hi_speed_last_10_min", None),
+    ("rain_rate_last", "rain_rate_last", "calculate_rain_amount"),
+    ("rain_15_min", "rainfall_last_15_min", "calculate_rain_amount"),
+    ("rain_60_min", "rainfall_last_60_min", "calculate_rain_amount"),
+    ("rain_24_hr", "rainfall_last_24_hr", "calculate_rain_amount"),
+    ("rain_storm", "rain_storm", "calculate_rain_amount"),
+    ("rain_storm_start_at", "rain_storm_start_at", "unix_to_datetime"),
+    ("rainfall_daily", "rainfall_daily", "calculate_rain_amount"),
+    ("rainfall_monthly", "rainfall_monthly", "calculate_rain_amount"),
+    ("rainfall_year", "rainfall_year", "calculate_rain_amount"),
+)
+
+# Transmitter receive state (rx_state) descriptions
+RX_STATES = {0: "Receiving Data", 1: "Missing Packets", 2: "Signal Lost"}
+RX_STATE_SIGNAL_LOST = 2
+
+
+class ConditionTopology(NamedTuple):
+    """Identity of one condition record, all that is needed to create its entities."""
+
+    lsid: int | None
+    data_structure_type: int | None
+    txid: int | None
+    rain_size: int | None
+
+
+class ConditionRecord:
+    """Parsed values of one condition, stored in field table order.
+
+    keys holds the entity keys for this device (temp_tx1, ...), shared by
+    every record of the same device, so a record only owns its values list.
+    """
+
+    __slots__ = ("keys", "values")
+
+    data_structure_type: ClassVar[int]
+    field_table: ClassVar[tuple[tuple[str, str, str | None], ...]]
+    fields: ClassVar[tuple[str, ...]]
+    field_index: ClassVar[dict[str, int]]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.fields = tuple(name for _, name, _ in cls.field_table)
+        cls.field_index = {name: index for index, name in enumerate(cls.fields)}
+
+    def __init__(self, keys: tuple[str, ...], values: list[Any]) -> None:
+        self.keys = keys
+        self.values = values
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Return a value by field name (temp, not temp_tx1)."""
+        index = self.field_index.get(name)
+        return default if index is None else self.values[index]
+
+    def changed_keys(self, previous: ConditionRecord) -> list[str]:
+        """Return the entity keys of fields that differ from a previous record."""
+        return [
+            key
+            for key, old, new in zip(self.keys, previous.values, self.values)
+            if old != new
+        ]
+
+    def fill_missing(
+        self, previous: ConditionRecord, condition: dict[str, Any]
+    ) -> ConditionRecord:
+        """Return a record with previous values for fields condition left null.
+
+        Converters turn some nulls into zeros, so a field counts as missing
+        if its source field in the raw condition is null.
+        """
+        values = [
+            old if condition.get(source) is None else new
+            for (source, _, _), new, old in zip(
+                self.field_table, self.values, previous.values
+            )
+        ]
+        return type(self)(self.keys, values)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ConditionRecord):
+            return NotImplemented
+        return self.keys == other.keys and self.values == other.values
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(zip(self.keys, self.values))})"
+
+
+class IssRecord(ConditionRecord):
+    """ISS Current Conditions record (outside)."""
+
+    __slots__ = ()
+    data_structure_type = 1
+    field_table = parse_table(1)
+
+
+class MoistureRecord(ConditionRecord):
+    """Leaf/Soil Moisture Current Conditions record."""
+
+    __slots__ = ()
+    data_structure_type = 2
+    field_table = parse_table(2)
+
+
+class LssBarRecord(ConditionRecord):
+    """LSS BAR Current Conditions record."""
+
+    __slots__ = ()
+    data_structure_type = 3
+    field_table = parse_table(3)
+
+
+class LssTempHumRecord(ConditionRecord):
+    """LSS Temp/Hum Current Conditions record (inside)."""
+
+    __slots__ = ()
+    data_structure_type = 4
+    field_table = parse_table(4)
+
+
+class AirLinkRecord(ConditionRecord):
+    """AirLink Air Quality Monitor record."""
+
+    __slots__ = ()
+    data_structure_type = 6
+    field_table = parse_table(6)
+
+
+RECORD_TYPES: dict[int, type[ConditionRecord]] = {
+    record_type.data_structure_type: record_type
+    for record_type in (
+        IssRecord,
+        MoistureRecord,
+        LssBarRecord,
+        LssTempHumRecord,
+        AirLinkRecord,
+    )
+}
+
+
+class WeatherSnapshot:
+    """Parsed data of one poll.
+
+    records is aligned with topology, with None for conditions of an
+    unsupported data_structure_type.
+    """
+
+    __slots__ = ("topology", "records")
+
+    def __init__(
+        self,
+        topology: tuple[ConditionTopology, ...] = (),
+        records: tuple[ConditionRecord | None, ...] = (),
+    ) -> None:
+        self.topology = topology
+        self.records = records
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, WeatherSnapshot):
+            return NotImplemented
+        return self.topology == other.topology and self.records == other.records
+
+    def __repr__(self) -> str:
+        return f"WeatherSnapshot({self.as_dict()})"
+
+    def changed_keys(self, previous: WeatherSnapshot) -> set[str]:
+        """Return the entity keys whose values differ from a previous snapshot."""
+        if self.topology != previous.topology:
+            return set(previous.as_dict()) | set(self.as_dict())
+
+        changed = set()
+        for record, old in zip(self.records, previous.records):
+            # Records untouched by a real-time merge are shared, skip them
+            if record is old or record is None or old is None:
+                continue
+            changed.update(record.changed_keys(old))
+        return changed
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all values keyed by entity key, for logging and diagnostics."""
+        data = {}
+        for record in self.records:
+            if record is not None:
+                data.update(zip(record.keys, record.values))
+        return data
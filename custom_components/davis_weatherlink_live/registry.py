@@ -0,0 +1,639 @@
+"""Declarative catalogue of condition fields and the sensors that show them.
+
+Every value of a condition is declared once, with the raw field it is read
+from, the converter applied while parsing and the sensor description of its
+entity. The parser's field tables and the entity descriptions are both
+compiled from this catalogue, so they cannot drift apart.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import (
+    CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+    DEGREE,
+    PERCENTAGE,
+    UnitOfIrradiance,
+    UnitOfLength,
+    UnitOfPressure,
+    UnitOfSpeed,
+    UnitOfTemperature,
+    UnitOfVolumetricFlux,
+)
+from homeassistant.helpers.entity import EntityCategory
+
+from .const import ROLLING_WINDOW_NAMES, TREND_WINDOW_NAMES, WIND_ROSE_WINDOW
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ConditionField(NamedTuple):
+    """One value of a condition and the sensor that shows it, if any."""
+
+    key: str
+    source: str
+    converter: str | None
+    description: SensorEntityDescription | None
+    # "rate" or "amount" if the unit follows the rain cup size
+    rain_unit: str | None
+    # Rolling statistics ("min", "max", "mean") offered as extra sensors
+    rolling: tuple[str, ...] = ()
+    # Range of possible values, overriding the range of the device class
+    bounds: tuple[float, float] | None = None
+
+
+def field(
+    key: str,
+    converter: str | None = None,
+    *,
+    source: str | None = None,
+    rain_unit: str | None = None,
+    rolling: tuple[str, ...] = (),
+    bounds: tuple[float, float] | None = None,
+    sensor: bool = True,
+    **description: Any,
+) -> ConditionField:
+    """Declare a field, read from source (default key) and shown as a sensor.
+
+    Converters name a DavisWeatherLinkLive static method, None passes the
+    value through. bounds is the range of values the sensor can report,
+    if its device class does not imply one. Remaining keyword arguments
+    make up the sensor description, translation_key defaults to key.
+    """
+    description.setdefault("translation_key", key)
+    return ConditionField(
+        key,
+        source or key,
+        converter,
+        SensorEntityDescription(key=key, **description) if sensor else None,
+        rain_unit,
+        rolling,
+        bounds,
+    )
+
+
+# ----------------------------------------------------------------------------
+# Sensor description presets
+# ----------------------------------------------------------------------------
+HIDDEN_DIAGNOSTIC = {
+    "entity_category": EntityCategory.DIAGNOSTIC,
+    "entity_registry_visible_default": False,
+    "entity_registry_enabled_default": False,
+}
+DIAGNOSTIC = {"entity_category": EntityCategory.DIAGNOSTIC}
+HIDDEN = {
+    "entity_registry_visible_default": False,
+    "entity_registry_enabled_default": False,
+}
+TEMPERATURE = {
+    "native_unit_of_measurement": UnitOfTemperature.FAHRENHEIT,
+    "device_class": SensorDeviceClass.TEMPERATURE,
+    "state_class": SensorStateClass.MEASUREMENT,
+}
+HUMIDITY = {
+    "native_unit_of_measurement": PERCENTAGE,
+    "device_class": SensorDeviceClass.HUMIDITY,
+    "state_class": SensorStateClass.MEASUREMENT,
+}
+WIND_SPEED = {
+    "native_unit_of_measurement": UnitOfSpeed.MILES_PER_HOUR,
+    "device_class": SensorDeviceClass.WIND_SPEED,
+    "state_class": SensorStateClass.MEASUREMENT,
+}
+WIND_DIRECTION = {
+    "native_unit_of_measurement": DEGREE,
+    "device_class": SensorDeviceClass.WIND_DIRECTION,
+    "state_class": SensorStateClass.MEASUREMENT_ANGLE,
+}
+WIND_ROSE = {"icon": "mdi:compass-outline"}
+RAIN_RATE = {
+    "rain_unit": "rate",
+    "device_class": SensorDeviceClass.PRECIPITATION_INTENSITY,
+    "state_class": SensorStateClass.MEASUREMENT,
+    "suggested_display_precision": 2,
+}
+RAIN_AMOUNT = {
+    "rain_unit": "amount",
+    "device_class": SensorDeviceClass.PRECIPITATION,
+    "state_class": SensorStateClass.MEASUREMENT,
+    "suggested_display_precision": 2,
+}
+RAIN_TOTAL = {**RAIN_AMOUNT, "state_class": SensorStateClass.TOTAL}
+TIMESTAMP = {"device_class": SensorDeviceClass.TIMESTAMP}
+PRESSURE = {
+    "native_unit_of_measurement": UnitOfPressure.INHG,
+    "device_class": SensorDeviceClass.PRESSURE,
+    "state_class": SensorStateClass.MEASUREMENT,
+}
+PM_1 = {
+    "native_unit_of_measurement": CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+    "device_class": SensorDeviceClass.PM1,
+    "state_class": SensorStateClass.MEASUREMENT,
+}
+PM_2P5 = {**PM_1, "device_class": SensorDeviceClass.PM25}
+PM_10 = {**PM_1, "device_class": SensorDeviceClass.PM10}
+PM_DATA = {
+    "bounds": (0, 100),
+    "native_unit_of_measurement": PERCENTAGE,
+    "state_class": SensorStateClass.MEASUREMENT,
+    **DIAGNOSTIC,
+}
+
+# Rolling statistics presets
+MIN_MAX = ("min", "max")
+MIN_MAX_MEAN = ("min", "max", "mean")
+MAX_MEAN = ("max", "mean")
+MAX = ("max",)
+MEAN = ("mean",)
+
+# Every device reports its own data_structure_type
+DATA_STRUCTURE_TYPE = field(
+    "data_structure_type", translation_key="dst", **HIDDEN_DIAGNOSTIC
+)
+
+# ----------------------------------------------------------------------------
+# Fields per data_structure_type, in parsing and entity creation order
+# ----------------------------------------------------------------------------
+ISS_FIELDS = (
+    field("lsid", **HIDDEN_DIAGNOSTIC),
+    field("txid", **HIDDEN_DIAGNOSTIC),
+    field("temp", rolling=MIN_MAX_MEAN, **TEMPERATURE),
+    field("hum", rolling=MIN_MAX, **HUMIDITY),
+    field("dew_point", **TEMPERATURE),
+    field("wet_bulb", **TEMPERATURE),
+    field("heat_index", **TEMPERATURE),
+    field("wind_chill", **TEMPERATURE),
+    field("thw_index", **TEMPERATURE),
+    field("thsw_index", **TEMPERATURE, **HIDDEN),
+    field("wind_speed_last", **WIND_SPEED),
+    field("wind_dir_last", **WIND_DIRECTION),
+    field(
+        "wind_dir_last_rose", "wind_dir_to_rose", source="wind_dir_last", **WIND_ROSE
+    ),
+    field("wind_speed_avg_last_1_min", **WIND_SPEED),
+    field("wind_dir_scalar_avg_last_1_min", **WIND_DIRECTION),
+    field("wind_speed_avg_last_2_min", **WIND_SPEED),
+    field("wind_dir_scalar_avg_last_2_min", **WIND_DIRECTION),
+    # bug in API sometimes throws a null when zero wind
+    field(
+        "wind_speed_hi_last_2_min", "zero_float_if_none", rolling=MAX, **WIND_SPEED
+    ),
+    field("wind_dir_at_hi_speed_last_2_min", "zero_if_none", **WIND_DIRECTION),
+    field("wind_speed_avg_last_10_min", rolling=MEAN, **WIND_SPEED),
+    field("wind_dir_scalar_avg_last_10_min", **WIND_DIRECTION),
+    field(
+        "wind_dir_scalar_avg_last_10_min_rose",
+        "wind_dir_to_rose",
+        source="wind_dir_scalar_avg_last_10_min",
+        **WIND_ROSE,
+    ),
+    field("wind_speed_hi_last_10_min", **WIND_SPEED),
+    field("wind_dir_at_hi_speed_last_10_min", **WIND_DIRECTION),
+    field("rain_size", **HIDDEN_DIAGNOSTIC),
+    field(
+        "rain_size_desc",
+        "rain_size_description",
+        source="rain_size",
+        **HIDDEN_DIAGNOSTIC,
+    ),
+    field("rain_rate_last", "calculate_rain_amount", **RAIN_RATE),
+    field("rain_rate_hi", "calculate_rain_amount", **RAIN_RATE),
+    field("rainfall_last_15_min", "calculate_rain_amount", **RAIN_AMOUNT),
+    field("rain_rate_hi_last_15_min", "calculate_rain_amount", **RAIN_RATE),
+    field("rainfall_last_60_min", "calculate_rain_amount", **RAIN_AMOUNT),
+    field("rainfall_last_24_hr", "calculate_rain_amount", **RAIN_AMOUNT),
+    field("rain_storm", "calculate_rain_amount", **RAIN_AMOUNT),
+    field("rain_storm_start_at", "unix_to_datetime", **TIMESTAMP),
+    field(
+        "solar_rad",
+        bounds=(0, 1800),
+        native_unit_of_measurement=UnitOfIrradiance.WATTS_PER_SQUARE_METER,
+        state_class=SensorStateClass.MEASUREMENT,
+        **HIDDEN,
+    ),
+    field(
+        "uv_index",
+        bounds=(0, 16),
+        state_class=SensorStateClass.MEASUREMENT,
+        **HIDDEN,
+    ),
+    field("rx_state", "rx_state_description", **DIAGNOSTIC),
+    field("trans_battery_flag", "battery_low_status", **DIAGNOSTIC),
+    field("rainfall_daily", "calculate_rain_amount", **RAIN_TOTAL),
+    field("rainfall_monthly", "calculate_rain_amount", **RAIN_TOTAL),
+    field("rainfall_year", "calculate_rain_amount", **RAIN_TOTAL),
+    field("rain_storm_last", "calculate_rain_amount", **RAIN_TOTAL),
+    field("rain_storm_last_start_at", "unix_to_datetime", **TIMESTAMP),
+    field("rain_storm_last_end_at", "unix_to_datetime", **TIMESTAMP),
+    DATA_STRUCTURE_TYPE,
+)
+
+MOISTURE_FIELDS = (
+    field("lsid", **HIDDEN_DIAGNOSTIC),
+    field("txid", sensor=False),
+    field("temp_1", translation_key="soil_temp_1", **TEMPERATURE),
+    field("temp_2", translation_key="soil_temp_2", **TEMPERATURE),
+    field("temp_3", translation_key="soil_temp_3", **TEMPERATURE),
+    field("temp_4", translation_key="soil_temp_4", **TEMPERATURE),
+    field("moist_soil_1", bounds=(0, 200), state_class=SensorStateClass.MEASUREMENT),
+    field("moist_soil_2", bounds=(0, 200), state_class=SensorStateClass.MEASUREMENT),
+    field("moist_soil_3", bounds=(0, 200), state_class=SensorStateClass.MEASUREMENT),
+    field("moist_soil_4", bounds=(0, 200), state_class=SensorStateClass.MEASUREMENT),
+    field("wet_leaf_1", bounds=(0, 15), state_class=SensorStateClass.MEASUREMENT),
+    field("wet_leaf_2", bounds=(0, 15), state_class=SensorStateClass.MEASUREMENT),
+    field("rx_state", "rx_state_description", **DIAGNOSTIC),
+    field("trans_battery_flag", "battery_low_status", **DIAGNOSTIC),
+    DATA_STRUCTURE_TYPE,
+)
+
+LSS_BAR_FIELDS = (
+    field("lsid", **HIDDEN_DIAGNOSTIC),
+    field("bar_sea_level", rolling=MIN_MAX, **PRESSURE),
+    # Change over 3 hours, not a pressure
+    field("bar_trend", bounds=(-1.0, 1.0), **PRESSURE),
+    field("bar_absolute", **PRESSURE),
+    DATA_STRUCTURE_TYPE,
+)
+
+LSS_TEMP_HUM_FIELDS = (
+    field("lsid", **HIDDEN_DIAGNOSTIC),
+    field("temp_in", rolling=MIN_MAX, **TEMPERATURE),
+    field("hum_in", **HUMIDITY),
+    field("dew_point_in", **{**TEMPERATURE, "state_class": None}),
+    field("heat_index_in", **TEMPERATURE),
+    DATA_STRUCTURE_TYPE,
+)
+
+AIRLINK_FIELDS = (
+    field("lsid", **HIDDEN_DIAGNOSTIC),
+    field("temp", rolling=MIN_MAX_MEAN, **TEMPERATURE),
+    field("hum", rolling=MIN_MAX, **HUMIDITY),
+    field("dew_point", **{**TEMPERATURE, "state_class": None}),
+    field("wet_bulb", **TEMPERATURE),
+    field("heat_index", **TEMPERATURE),
+    field("pm_1_last", **PM_1),
+    field("pm_2p5_last", **PM_2P5),
+    field("pm_10_last", **PM_10),
+    field("pm_1", **PM_1),
+    field("pm_2p5", rolling=MAX_MEAN, **PM_2P5),
+    field("pm_10", rolling=MAX_MEAN, **PM_10),
+    field("pm_2p5_last_1_hour", **PM_2P5),
+    field("pm_2p5_last_3_hours", **PM_2P5),
+    field("pm_2p5_nowcast", **PM_2P5),
+    field("pm_2p5_last_24_hours", **PM_2P5),
+    field("pm_10_last_1_hour", **PM_10),
+    field("pm_10_last_3_hours", **PM_10),
+    field("pm_10_nowcast", **PM_10),
+    field("pm_10_last_24_hours", **PM_10),
+    field("last_report_time", "unix_to_datetime", **TIMESTAMP, **DIAGNOSTIC),
+    field("pct_pm_data_last_1_hour", **PM_DATA),
+    field("pct_pm_data_last_3_hours", **PM_DATA),
+    field("pct_pm_data_nowcast", **PM_DATA),
+    field("pct_pm_data_last_24_hours", **PM_DATA),
+    DATA_STRUCTURE_TYPE,
+)
+
+CONDITION_FIELDS: dict[int, tuple[ConditionField, ...]] = {
+    1: ISS_FIELDS,
+    2: MOISTURE_FIELDS,
+    3: LSS_BAR_FIELDS,
+    4: LSS_TEMP_HUM_FIELDS,
+    6: AIRLINK_FIELDS,
+}
+
+# Transmitter based devices are keyed by txid, the rest by logical sensor id
+DEVICE_ID_FIELDS = {1: "txid", 2: "txid", 3: "lsid", 4: "lsid", 6: "lsid"}
+DEVICE_KEY_PREFIXES = {"txid": "_tx", "lsid": "_ls"}
+
+# Deadband group and the decimals values are rounded to, by device class
+DEADBAND_GROUPS = {
+    SensorDeviceClass.TEMPERATURE: ("temperature", 1),
+    SensorDeviceClass.HUMIDITY: ("humidity", 0),
+    SensorDeviceClass.PRESSURE: ("pressure", 3),
+    SensorDeviceClass.PM1: ("pm", 1),
+    SensorDeviceClass.PM25: ("pm", 1),
+    SensorDeviceClass.PM10: ("pm", 1),
+}
+
+# Range of values the sensors can report in native units, by device class.
+# Anything outside is a transmission or parsing error, not weather.
+VALID_RANGES = {
+    SensorDeviceClass.TEMPERATURE: (-100.0, 200.0),
+    SensorDeviceClass.HUMIDITY: (0.0, 100.0),
+    SensorDeviceClass.PRESSURE: (15.0, 33.0),
+    SensorDeviceClass.WIND_SPEED: (0.0, 200.0),
+    SensorDeviceClass.WIND_DIRECTION: (0.0, 360.0),
+    SensorDeviceClass.PM1: (0.0, 1000.0),
+    SensorDeviceClass.PM25: (0.0, 1000.0),
+    SensorDeviceClass.PM10: (0.0, 1000.0),
+}
+
+# Spike group of device classes that change slowly enough for single
+# readings far from their recent median to be rejected. Wind and
+# particulate matter are gusty and smoky by nature and are not included.
+SPIKE_GROUPS = {
+    SensorDeviceClass.TEMPERATURE: "temperature",
+    SensorDeviceClass.HUMIDITY: "humidity",
+    SensorDeviceClass.PRESSURE: "pressure",
+}
+
+# Rain cup size indicator to (rain rate unit, rain amount unit)
+RAIN_UNITS = {
+    1: (UnitOfVolumetricFlux.INCHES_PER_HOUR, UnitOfLength.INCHES),
+    2: (UnitOfVolumetricFlux.MILLIMETERS_PER_HOUR, UnitOfLength.MILLIMETERS),
+    3: (UnitOfVolumetricFlux.MILLIMETERS_PER_HOUR, UnitOfLength.MILLIMETERS),
+    4: (UnitOfVolumetricFlux.INCHES_PER_HOUR, UnitOfLength.INCHES),
+}
+
+
+def parse_table(data_type: int) -> tuple[tuple[str, str, str | None], ...]:
+    """Return the (source field, output key, converter) table of a device type."""
+    return tuple(
+        (field.source, field.key, field.converter)
+        for field in CONDITION_FIELDS[data_type]
+    )
+
+
+@lru_cache(maxsize=None)
+def deadband_table(data_type: int) -> tuple[tuple[int, str, int], ...]:
+    """Return the (value index, deadband group, decimals) of filtered fields."""
+    return tuple(
+        (index, *DEADBAND_GROUPS[field.description.device_class])
+        for index, field in enumerate(CONDITION_FIELDS.get(data_type, ()))
+        if field.description is not None
+        and field.description.device_class in DEADBAND_GROUPS
+    )
+
+
+@lru_cache(maxsize=None)
+def validation_table(
+    data_type: int,
+) -> tuple[tuple[int, float, float, str | None], ...]:
+    """Return the (value index, lowest, highest, spike group) of checked fields."""
+    table = []
+    for index, field in enumerate(CONDITION_FIELDS.get(data_type, ())):
+        device_class = field.description and field.description.device_class
+        bounds = field.bounds or VALID_RANGES.get(device_class)
+        if bounds is not None:
+            table.append((index, *bounds, SPIKE_GROUPS.get(device_class)))
+    return tuple(table)
+
+
+def device_key_suffix(data_type: int, device_id: int | None) -> str:
+    """Return the entity key suffix of a device (_tx1, _ls123)."""
+    return f"{DEVICE_KEY_PREFIXES[DEVICE_ID_FIELDS[data_type]]}{device_id}"
+
+
+@lru_cache(maxsize=None)
+def sensor_descriptions(
+    data_type: int, device_id: int | None, rain_size: int | None
+) -> tuple[SensorEntityDescription, ...]:
+    """Return the sensor descriptions of one device.
+
+    Compiled once per device and rain cup size, reloads reuse them.
+    """
+    suffix = device_key_suffix(data_type, device_id)
+    rate_unit, amount_unit = RAIN_UNITS.get(rain_size, (None, None))
+    units = {"rate": rate_unit, "amount": amount_unit}
+
+    descriptions = []
+    for field in CONDITION_FIELDS[data_type]:
+        if field.description is None:
+            continue
+        changes: dict[str, Any] = {"key": field.key + suffix}
+        if field.rain_unit is not None:
+            changes["native_unit_of_measurement"] = units[field.rain_unit]
+        descriptions.append(dataclasses.replace(field.description, **changes))
+
+    _LOGGER.debug(
+        "Compiled %d sensor descriptions for device type %s%s",
+        len(descriptions),
+        data_type,
+        suffix,
+    )
+    return tuple(descriptions)
+
+
+def window_label(window: int) -> str:
+    """Return the key label of a rolling window in seconds (10m, 24h)."""
+    if window % 3600 == 0:
+        return f"{window // 3600}h"
+    return f"{window // 60}m"
+
+
+def rolling_key(key: str, stat: str, window: int) -> str:
+    """Return the entity key of a rolling statistic (temp_tx1_max_24h)."""
+    return f"{key}_{stat}_{window_label(window)}"
+
+
+@lru_cache(maxsize=None)
+def rolling_table(data_type: int) -> tuple[tuple[int, tuple[str, ...]], ...]:
+    """Return the (value index, statistics) of fields with rolling statistics."""
+    return tuple(
+        (index, field.rolling)
+        for index, field in enumerate(CONDITION_FIELDS.get(data_type, ()))
+        if field.rolling
+    )
+
+
+@lru_cache(maxsize=None)
+def rolling_descriptions(
+    data_type: int,
+    device_id: int | None,
+    rain_size: int | None,
+    windows: tuple[int, ...],
+) -> tuple[SensorEntityDescription, ...]:
+    """Return the rolling statistic sensor descriptions of one device.
+
+    Each statistic inherits the unit and device class of its field and is
+    named by the translation key <field>_<stat> with a window placeholder.
+    """
+    suffix = device_key_suffix(data_type, device_id)
+    descriptions = []
+    for field, description in zip(
+        (field for field in CONDITION_FIELDS[data_type] if field.description),
+        sensor_descriptions(data_type, device_id, rain_size),
+    ):
+        for window in windows:
+            for stat in field.rolling:
+                descriptions.append(
+                    dataclasses.replace(
+                        description,
+                        key=rolling_key(field.key + suffix, stat, window),
+                        translation_key=f"{description.translation_key}_{stat}",
+                        translation_placeholders={
+                            "window": ROLLING_WINDOW_NAMES.get(
+                                window, window_label(window)
+                            )
+                        },
+                        state_class=SensorStateClass.MEASUREMENT,
+                        entity_category=None,
+                    )
+                )
+    return tuple(descriptions)
+
+
+def wind_vector_key(device_id: int | None, window: int) -> str:
+    """Return the entity key of a vector-averaged wind direction."""
+    suffix = device_key_suffix(1, device_id)
+    return f"wind_dir_vector_avg{suffix}_{window_label(window)}"
+
+
+def wind_rose_key(device_id: int | None) -> str:
+    """Return the entity key of the wind rose of an ISS transmitter."""
+    return f"wind_rose{device_key_suffix(1, device_id)}"
+
+
+@lru_cache(maxsize=None)
+def wind_descriptions(
+    device_id: int | None, windows: tuple[int, ...]
+) -> tuple[SensorEntityDescription, ...]:
+    """Return the wind direction average and wind rose descriptions of an ISS."""
+    descriptions = [
+        SensorEntityDescription(
+            key=wind_vector_key(device_id, window),
+            translation_key="wind_dir_vector_avg",
+            translation_placeholders={
+                "window": ROLLING_WINDOW_NAMES.get(window, window_label(window))
+            },
+            **WIND_DIRECTION,
+        )
+        for window in windows
+    ]
+    descriptions.append(
+        SensorEntityDescription(
+            key=wind_rose_key(device_id),
+            translation_key="wind_rose",
+            translation_placeholders={
+                "window": ROLLING_WINDOW_NAMES.get(
+                    WIND_ROSE_WINDOW, window_label(WIND_ROSE_WINDOW)
+                )
+            },
+            icon="mdi:compass-rose",
+        )
+    )
+    return tuple(descriptions)
+
+
+def bar_trend_key(device_id: int | None, window: int) -> str:
+    """Return the entity key of the barometric trend of an LSS BAR."""
+    return f"bar_trend{device_key_suffix(3, device_id)}_{window_label(window)}"
+
+
+@lru_cache(maxsize=None)
+def bar_trend_descriptions(
+    device_id: int | None, windows: tuple[int, ...]
+) -> tuple[SensorEntityDescription, ...]:
+    """Return the barometric trend descriptions of an LSS BAR."""
+    return tuple(
+        SensorEntityDescription(
+            key=bar_trend_key(device_id, window),
+            translation_key="bar_trend_window",
+            translation_placeholders={
+                "window": TREND_WINDOW_NAMES.get(window, window_label(window))
+            },
+            suggested_display_precision=3,
+            **PRESSURE,
+        )
+        for window in windows
+    )
+
+
+def aqi_key(pollutant: str, device_id: int | None) -> str:
+    """Return the entity key of the AQI of an AirLink (aqi_pm_2p5_ls1)."""
+    return f"aqi_{pollutant}{device_key_suffix(6, device_id)}"
+
+
+@lru_cache(maxsize=None)
+def aqi_descriptions(device_id: int | None) -> tuple[SensorEntityDescription, ...]:
+    """Return the PM2.5 and PM10 AQI descriptions of an AirLink."""
+    return tuple(
+        SensorEntityDescription(
+            key=aqi_key(pollutant, device_id),
+            translation_key=f"aqi_{pollutant}",
+            device_class=SensorDeviceClass.AQI,
+            state_class=SensorStateClass.MEASUREMENT,
+        )
+        for pollutant in ("pm_2p5", "pm_10")
+    )
+
+
+def accumulator_key(name: str, device_id: int | None) -> str:
+    """Return the entity key of a daily accumulator of an ISS (et0_today_tx1)."""
+    return f"{name}_today{device_key_suffix(1, device_id)}"
+
+
+# Daily accumulators and their sensor description presets
+ACCUMULATORS = {
+    # Evaporated, not fallen water, so not a precipitation device class
+    "et0": {
+        "native_unit_of_measurement": UnitOfLength.MILLIMETERS,
+        "suggested_display_precision": 2,
+        "icon": "mdi:water-thermometer",
+    },
+    "gdd": {"native_unit_of_measurement": "°F·d", "icon": "mdi:sprout"},
+    "hdd": {"native_unit_of_measurement": "°F·d", "icon": "mdi:radiator"},
+    "cdd": {"native_unit_of_measurement": "°F·d", "icon": "mdi:snowflake"},
+}
+
+
+@lru_cache(maxsize=None)
+def accumulator_descriptions(
+    device_id: int | None,
+) -> tuple[SensorEntityDescription, ...]:
+    """Return the daily ET0 and degree day descriptions of an ISS."""
+    return tuple(
+        SensorEntityDescription(
+            key=accumulator_key(name, device_id),
+            translation_key=f"{name}_today",
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            **description,
+        )
+        for name, description in ACCUMULATORS.items()
+    )
+
+
+def rain_key(name: str, device_id: int | None) -> str:
+    """Return the entity key of a rain total of an ISS transmitter."""
+    return f"{name}{device_key_suffix(1, device_id)}"
+
+
+# Rain totals kept by the rain accounting of each ISS
+RAIN_TOTALS = (
+    "rain_today",
+    "rain_yesterday",
+    "rain_last_7_days",
+    "rain_this_hour",
+    "rain_last_hour",
+    "rain_last_3_hr",
+    "rain_event",
+)
+
+
+@lru_cache(maxsize=None)
+def rain_descriptions(
+    device_id: int | None, rain_size: int | None
+) -> tuple[SensorEntityDescription, ...]:
+    """Return the rain total descriptions of an ISS, in its rain cup unit."""
+    description = {
+        key: value for key, value in RAIN_AMOUNT.items() if key != "rain_unit"
+    }
+    unit = RAIN_UNITS.get(rain_size, (None, None))[1]
+    return tuple(
+        SensorEntityDescription(
+            key=rain_key(name, device_id),
+            translation_key=name,
+            native_unit_of_measurement=unit,
+            **description,
+        )
+        for name in RAIN_TOTALS
+    )
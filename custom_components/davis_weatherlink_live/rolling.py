@@ -0,0 +1,153 @@
+"""Rolling-window statistics of parsed condition values."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+from .const import ROLLING_BUCKETS
+from .records import WeatherSnapshot
+from .registry import rolling_key, rolling_table
+
+
+class RollingWindow:
+    """Minimum, maximum and mean of the values added over the last window.
+
+    Samples are grouped into ROLLING_BUCKETS buckets of window / buckets
+    seconds, which expire together, so memory stays bounded however often
+    the device is polled. The mean is a running sum and count over the
+    buckets. Minimum and maximum are kept in monotonic deques holding at
+    most one value per bucket, so every operation is amortised O(1).
+    """
+
+    __slots__ = ("window", "width", "_buckets", "_sum", "_count", "_min", "_max")
+
+    def __init__(self, window: float, buckets: int = ROLLING_BUCKETS) -> None:
+        self.window = window
+        self.width = window / buckets
+        # [bucket start, sum, count] oldest first
+        self._buckets: deque[list[float]] = deque()
+        self._sum = 0.0
+        self._count = 0
+        # (bucket start, value) with increasing minimums / decreasing maximums
+        self._min: deque[tuple[float, float]] = deque()
+        self._max: deque[tuple[float, float]] = deque()
+
+    def add(self, value: float, now: float) -> None:
+        """Add a value sampled at now, in monotonic seconds."""
+
+        self.expire(now)
+        start = now - now % self.width
+
+        buckets = self._buckets
+        if buckets and buckets[-1][0] == start:
+            buckets[-1][1] += value
+            buckets[-1][2] += 1
+        else:
+            buckets.append([start, value, 1])
+        self._sum += value
+        self._count += 1
+
+        # Values behind a smaller (larger) one never become the minimum
+        # (maximum) again. One per bucket is enough, they expire together.
+        extremes = self._min
+        while extremes and extremes[-1][1] >= value:
+            extremes.pop()
+        if not extremes or extremes[-1][0] != start:
+            extremes.append((start, value))
+
+        extremes = self._max
+        while extremes and extremes[-1][1] <= value:
+            extremes.pop()
+        if not extremes or extremes[-1][0] != start:
+            extremes.append((start, value))
+
+    def expire(self, now: float) -> None:
+        """Drop the buckets that ended more than a window before now."""
+
+        cutoff = now - self.window - self.width
+        buckets = self._buckets
+        while buckets and buckets[0][0] <= cutoff:
+            _, total, count = buckets.popleft()
+            self._sum -= total
+            self._count -= count
+        if not buckets:
+            # Start over exactly, without accumulated rounding errors
+            self._sum = 0.0
+            self._count = 0
+        for extremes in (self._min, self._max):
+            while extremes and extremes[0][0] <= cutoff:
+                extremes.popleft()
+
+    @property
+    def min(self) -> float | None:
+        return self._min[0][1] if self._min else None
+
+    @property
+    def max(self) -> float | None:
+        return self._max[0][1] if self._max else None
+
+    @property
+    def mean(self) -> float | None:
+        return self._sum / self._count if self._count else None
+
+
+class RollingStatistics:
+    """Rolling statistics of every field the registry declares them for.
+
+    Values are keyed by the entity key of the statistic. Keys whose value
+    changed since the last call to pop_changed are collected, so the
+    coordinator only notifies the entities of those statistics.
+    """
+
+    def __init__(self, windows: tuple[int, ...]) -> None:
+        self.windows = windows
+        self.values: dict[str, float | None] = {}
+        self._trackers: dict[tuple[str, int], RollingWindow] = {}
+        self._changed: set[str] = set()
+
+    def update(self, snapshot: WeatherSnapshot, now: float) -> None:
+        """Add the values of a snapshot, now in monotonic seconds."""
+
+        for record in snapshot.records:
+            if record is None:
+                continue
+            for index, stats in rolling_table(record.data_structure_type):
+                value = record.values[index]
+                if not isinstance(value, (int, float)) or isinstance(value, bool):
+                    continue
+                key = record.keys[index]
+                for window in self.windows:
+                    tracker = self._trackers.get((key, window))
+                    if tracker is None:
+                        tracker = self._trackers[(key, window)] = RollingWindow(
+                            window
+                        )
+                    tracker.add(value, now)
+                    for stat in stats:
+                        self._set(
+                            rolling_key(key, stat, window), getattr(tracker, stat)
+                        )
+
+    def _set(self, key: str, value: float | None) -> None:
+        if value is not None:
+            value = round(value, 3)
+        if self.values.get(key) != value:
+            self.values[key] = value
+            self._changed.add(key)
+
+    def pop_changed(self) -> set[str]:
+        """Return and reset the keys of statistics that changed."""
+
+        changed = self._changed
+        self._changed = set()
+        return changed
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the windows and tracked statistics for the diagnostics download."""
+
+        return {
+            "windows": list(self.windows),
+            "trackers": len(self._trackers),
+            "values": dict(self.values),
+        }
@@ -0,0 +1,182 @@
+"""Poll scheduling helpers for Davis WeatherLink Live integration."""
+
+from __future__ import annotations
+
+import math
+import random
+from collections import deque
+from typing import Any
+
+from .const import (
+    ADAPTIVE_GUST,
+    ADAPTIVE_MAX_BACKOFF_STEPS,
+    ADAPTIVE_MAX_INTERVAL,
+    ADAPTIVE_MIN_INTERVAL,
+    ADAPTIVE_PRESSURE_TREND,
+    ADAPTIVE_QUIET_GROWTH,
+    ADAPTIVE_RAIN_RATE,
+    PHASE_LOCK_MARGIN,
+    PHASE_LOCK_MIN_DELAY,
+    PHASE_LOCK_SAMPLES,
+)
+from .records import WeatherSnapshot
+
+
+class PhaseLockedScheduler:
+    """Align polls with the moment the device refreshes its conditions.
+
+    The device stamps each set of conditions with data.ts and refreshes them
+    on a fixed cadence. The cadence is learned as the smallest advance seen
+    between polls, which is the period itself or a multiple of it, so polls
+    still land on device updates. The device update instant in host time is
+    data.ts plus the smallest recent lag between data.ts and the time the
+    response arrived. Using a window of recent lags tracks clock drift
+    between the device and the host.
+    """
+
+    def __init__(self) -> None:
+        self.period: float | None = None
+        self.margin = PHASE_LOCK_MARGIN
+        self.last_device_ts: float | None = None
+        self._lags: deque[float] = deque(maxlen=PHASE_LOCK_SAMPLES)
+
+    def observe(self, device_ts: float, received_at: float) -> None:
+        """Record the device timestamp of a response and when it arrived."""
+
+        if self.last_device_ts is not None:
+            advance = device_ts - self.last_device_ts
+            if advance <= 0:
+                # Polled before the device refreshed, so the phase estimate is
+                # early. Widen the margin until polls land after updates again.
+                self.margin = min(
+                    self.margin * 2, (self.period or PHASE_LOCK_MARGIN * 4) / 2
+                )
+                return
+            if self.period is None or advance < self.period:
+                self.period = advance
+
+        # Settle back towards the default margin after a successful poll
+        self.margin = max(PHASE_LOCK_MARGIN, self.margin * 0.9)
+        self.last_device_ts = device_ts
+        self._lags.append(received_at - device_ts)
+
+    def next_delay(self, interval: float, now: float) -> float:
+        """Return seconds from now until the device update closest to interval."""
+
+        if self.period is None or self.last_device_ts is None:
+            return interval
+
+        # Host time the last seen conditions became available, plus margin
+        last_update = self.last_device_ts + min(self._lags) + self.margin
+        cycles = max(1, round((now + interval - last_update) / self.period))
+        delay = last_update + cycles * self.period - now
+        if delay < PHASE_LOCK_MIN_DELAY:
+            missed = math.ceil((PHASE_LOCK_MIN_DELAY - delay) / self.period)
+            delay += missed * self.period
+        return delay
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the learned phase for the diagnostics download."""
+
+        return {
+            "period": self.period,
+            "lag": min(self._lags) if self._lags else None,
+            "margin": self.margin,
+        }
+
+
+class AdaptiveInterval:
+    """Pick the poll interval from the weather and the health of the device.
+
+    Any ISS reporting a rain rate or a 2 minute gust at or above its
+    threshold, or a barometer whose 3 hour trend is at least the pressure
+    threshold, drops the interval to the minimum. Every quiet poll
+    lengthens it by ADAPTIVE_QUIET_GROWTH up to the maximum. Failed polls
+    back off exponentially from the base interval with jitter, so several
+    Home Assistant instances do not retry a busy device in lockstep.
+    """
+
+    def __init__(
+        self,
+        base_interval: float,
+        min_interval: float = ADAPTIVE_MIN_INTERVAL,
+        max_interval: float = ADAPTIVE_MAX_INTERVAL,
+        rain_rate: float = ADAPTIVE_RAIN_RATE,
+        gust: float = ADAPTIVE_GUST,
+        pressure_trend: float = ADAPTIVE_PRESSURE_TREND,
+    ) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.base_interval = min(max(base_interval, min_interval), max_interval)
+        self.rain_rate = rain_rate
+        self.gust = gust
+        self.pressure_trend = pressure_trend
+
+        self.interval = self.base_interval
+        self.active = False
+        self.failures = 0
+
+    def reconfigure(self, settings: AdaptiveInterval) -> None:
+        """Take over the bounds and thresholds of settings, keeping the state."""
+
+        self.min_interval = settings.min_interval
+        self.max_interval = settings.max_interval
+        self.base_interval = settings.base_interval
+        self.rain_rate = settings.rain_rate
+        self.gust = settings.gust
+        self.pressure_trend = settings.pressure_trend
+        self.interval = min(max(self.interval, self.min_interval), self.max_interval)
+
+    def is_active(self, snapshot: WeatherSnapshot) -> bool:
+        """Return True if any device reports weather above a threshold."""
+
+        for record in snapshot.records:
+            if record is None:
+                continue
+            rain_rate = record.get("rain_rate_last")
+            if rain_rate is not None and rain_rate >= self.rain_rate:
+                return True
+            gust = record.get("wind_speed_hi_last_2_min")
+            if gust is not None and gust >= self.gust:
+                return True
+            trend = record.get("bar_trend")
+            if trend is not None and abs(trend) >= self.pressure_trend:
+                return True
+        return False
+
+    def record_success(self, snapshot: WeatherSnapshot) -> float:
+        """Update the interval after a poll that returned data."""
+
+        recovered = self.failures > 0
+        self.failures = 0
+        self.active = self.is_active(snapshot)
+        if self.active:
+            self.interval = self.min_interval
+        elif recovered:
+            self.interval = self.base_interval
+        else:
+            # Once a storm passes, lengthen again starting from the base interval
+            quiet = max(self.interval, self.base_interval) * ADAPTIVE_QUIET_GROWTH
+            self.interval = min(self.max_interval, quiet)
+        return self.interval
+
+    def record_failure(self) -> float:
+        """Back off after a poll that failed."""
+
+        self.failures += 1
+        steps = min(self.failures, ADAPTIVE_MAX_BACKOFF_STEPS)
+        ceiling = min(self.max_interval, self.base_interval * 2**steps)
+        self.interval = max(self.min_interval, random.uniform(ceiling / 2, ceiling))
+        return self.interval
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the bounds and current state for the diagnostics download."""
+
+        return {
+            "min_interval": self.min_interval,
+            "max_interval": self.max_interval,
+            "base_interval": self.base_interval,
+            "interval": self.interval,
+            "active": self.active,
+            "failures": self.failures,
+        }
@@ -3,835 +3,222 @@
 from __future__ import annotations
 
 from homeassistant.components.sensor import (
-    SensorStateClass,
-    SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
 )
-from homeassistant.const import (
-    DEGREE,
-    PERCENTAGE,
-    CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-    UnitOfLength,
-    UnitOfPressure,
-    UnitOfSpeed,
-    UnitOfTemperature,
-    UnitOfVolumetricFlux,
-    UnitOfIrradiance,
-)
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import MyConfigEntry
 from .const import DOMAIN
 from .coordinator import WeatherCoordinator
+from .records import ConditionRecord, ConditionTopology
+from .registry import (
+    DEVICE_ID_FIELDS,
+    accumulator_descriptions,
+    aqi_descriptions,
+    bar_trend_descriptions,
+    rain_descriptions,
+    rolling_descriptions,
+    sensor_descriptions,
+    wind_descriptions,
+)
 
 import logging
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def get_device_name(condition: tuple):
-    match condition.get("data_structure_type"):
+def get_device_name(condition: ConditionTopology):
+    match condition.data_structure_type:
         case 1:
-            return "Davis ISS TX " + str(condition.get("txid"))
+            return "Davis ISS TX " + str(condition.txid)
         case 2:
-            return "Davis Leaf/Soil Moisture TX " + str(condition.get("txid"))
+            return "Davis Leaf/Soil Moisture TX " + str(condition.txid)
         case 3:
-            return "Davis LSS BAR"  # + str(condition.get("lsid"))
+            return "Davis LSS BAR"  # + str(condition.lsid)
         case 4:
-            return "Davis LSS"  # + str(condition.get("lsid"))
+            return "Davis LSS"  # + str(condition.lsid)
         case 6:
-            return "Davis AirLink AQM"  # + str(condition.get("lsid"))
+            return "Davis AirLink AQM"  # + str(condition.lsid)
 
 
 # Device Sensor type helper that returns the correct sensors based on the device type
-def get_device_sensors(condition: tuple):
-    device_type = condition.get("data_structure_type")
-
-    # Return the correct sensors based on the device type
-    _LOGGER.debug(
-        "get_device_sensors called with device_type: %s, condition value: %s",
-        device_type,
-        condition,
-    )
+def get_device_sensors(condition: ConditionTopology):
+    device_type = condition.data_structure_type
 
-    if device_type == 1:  # General weather outdoor sensors
-        unique_id = condition.get("txid")
-        unique_key = f"_tx{unique_id}"
-        api_rain_size_value = condition.get("rain_size")
-
-        # Get the unit for rain rate for
-        #    "rain_rate_last",
-        #    "rain_rate_hi",
-        #    "rain_rate_hi_last_15_min",
-
-        rain_rate_unit = None
-        match api_rain_size_value:
-            case 0:
-                rain_rate_unit = None
-            case 1:
-                _LOGGER.debug(
-                    "For condition type %s, and lsid %s, using imperial units with rain size id %s",
-                    device_type,
-                    condition.get("lsid"),
-                    api_rain_size_value,
-                )
-                rain_rate_unit = UnitOfVolumetricFlux.INCHES_PER_HOUR
-            case 2:
-                _LOGGER.debug(
-                    "For condition type %s, and lsid %s, using metric units with rain size id %s",
-                    device_type,
-                    condition.get("lsid"),
-                    api_rain_size_value,
-                )
-                rain_rate_unit = UnitOfVolumetricFlux.MILLIMETERS_PER_HOUR
-            case 3:
-                _LOGGER.debug(
-                    "For condition type %s, and lsid %s, using metric units with rain size id %s",
-                    device_type,
-                    condition.get("lsid"),
-                    api_rain_size_value,
-                )
-                rain_rate_unit = UnitOfVolumetricFlux.MILLIMETERS_PER_HOUR
-            case 4:
-                _LOGGER.debug(
-                    "For condition type %s, and lsid %s, using imperial units with rain size id %s",
-                    device_type,
-                    condition.get("lsid"),
-                    api_rain_size_value,
-                )
-                rain_rate_unit = UnitOfVolumetricFlux.INCHES_PER_HOUR
-            case _:
-                rain_rate_unit = None
-
-        # Get the unit for rain amount for
-        #    "rainfall_last_15_min",
-        #    "rainfall_last_60_min",
-        #    "rainfall_last_24_hr",
-        #    "rain_storm",
-        #    "rainfall_daily",
-        #    "rainfall_monthly",
-        #    "rainfall_year",
-        #    "rain_storm_last",
-
-        rain_amount_unit = None
-        match api_rain_size_value:
-            case 0:
-                rain_amount_unit = None
-            case 1:
-                rain_amount_unit = UnitOfLength.INCHES
-            case 2:
-                rain_amount_unit = UnitOfLength.MILLIMETERS
-            case 3:
-                rain_amount_unit = UnitOfLength.MILLIMETERS
-            case 4:
-                rain_amount_unit = UnitOfLength.INCHES
-            case _:
-                rain_amount_unit = None
-
-        DST_1: tuple[SensorEntityDescription, ...] = (
-            SensorEntityDescription(
-                key="lsid" + unique_key,
-                translation_key="lsid",
-                entity_category=EntityCategory.DIAGNOSTIC,
-                entity_registry_visible_default=False,
-                entity_registry_enabled_default=False,
-            ),
-            SensorEntityDescription(
-                key="data_structure_type" + unique_key,
-                translation_key="dst",
-                entity_category=EntityCategory.DIAGNOSTIC,
-                entity_registry_visible_default=False,
-                entity_registry_enabled_default=False,
-            ),
-            SensorEntityDescription(
-                key="txid" + unique_key,
-                translation_key="txid",
-                entity_category=EntityCategory.DIAGNOSTIC,
-                entity_registry_visible_default=False,
-                entity_registry_enabled_default=False,
-            ),
-            SensorEntityDescription(
-                key="temp" + unique_key,
-                translation_key="temp",
-                native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-                device_class=SensorDeviceClass.TEMPERATURE,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="hum" + unique_key,
-                translation_key="hum",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=SensorDeviceClass.HUMIDITY,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="dew_point" + unique_key,
-                translation_key="dew_point",
-                native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-                device_class=SensorDeviceClass.TEMPERATURE,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="wet_bulb" + unique_key,
-                translation_key="wet_bulb",
-                native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-                device_class=SensorDeviceClass.TEMPERATURE,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="heat_index" + unique_key,
-                translation_key="heat_index",
-                native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-                device_class=SensorDeviceClass.TEMPERATURE,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="wind_chill" + unique_key,
-                translation_key="wind_chill",
-                native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-                device_class=SensorDeviceClass.TEMPERATURE,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="thw_index" + unique_key,
-                translation_key="thw_index",
-                native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-                device_class=SensorDeviceClass.TEMPERATURE,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="thsw_index" + unique_key,
-                translation_key="thsw_index",
-                native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-                device_class=SensorDeviceClass.TEMPERATURE,
-                state_class=SensorStateClass.MEASUREMENT,
-                entity_registry_visible_default=False,
-                entity_registry_enabled_default=False,
-            ),
-            SensorEntityDescription(
-                key="wind_speed_last" + unique_key,
-                translation_key="wind_speed_last",
-                native_unit_of_measurement=UnitOfSpeed.MILES_PER_HOUR,
-                device_class=SensorDeviceClass.WIND_SPEED,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="wind_dir_last" + unique_key,
-                translation_key="wind_dir_last",
-                native_unit_of_measurement=DEGREE,
-                device_class=SensorDeviceClass.WIND_DIRECTION,
-                state_class=SensorStateClass.MEASUREMENT_ANGLE,
-            ),
-            SensorEntityDescription(
-                key="wind_dir_last_rose" + unique_key,
-                translation_key="wind_dir_last_rose",
-                icon="mdi:compass-outline",
-            ),
-            SensorEntityDescription(
-                key="wind_speed_avg_last_1_min" + unique_key,
-                translation_key="wind_speed_avg_last_1_min",
-                native_unit_of_measurement=UnitOfSpeed.MILES_PER_HOUR,
-                device_class=SensorDeviceClass.WIND_SPEED,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="wind_dir_scalar_avg_last_1_min" + unique_key,
-                translation_key="wind_dir_scalar_avg_last_1_min",
-                native_unit_of_measurement=DEGREE,
-                device_class=SensorDeviceClass.WIND_DIRECTION,
-                state_class=SensorStateClass.MEASUREMENT_ANGLE,
-            ),
-            SensorEntityDescription(
-                key="wind_speed_avg_last_2_min" + unique_key,
-                translation_key="wind_speed_avg_last_2_min",
-                native_unit_of_measurement=UnitOfSpeed.MILES_PER_HOUR,
-                device_class=SensorDeviceClass.WIND_SPEED,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="wind_dir_scalar_avg_last_2_min" + unique_key,
-                translation_key="wind_dir_scalar_avg_last_2_min",
-                native_unit_of_measurement=DEGREE,
-                device_class=SensorDeviceClass.WIND_DIRECTION,
-                state_class=SensorStateClass.MEASUREMENT_ANGLE,
-            ),
-            SensorEntityDescription(
-                key="wind_speed_hi_last_2_min" + unique_key,
-                translation_key="wind_speed_hi_last_2_min",
-                native_unit_of_measurement=UnitOfSpeed.MILES_PER_HOUR,
-                device_class=SensorDeviceClass.WIND_SPEED,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="wind_dir_at_hi_speed_last_2_min" + unique_key,
-                translation_key="wind_dir_at_hi_speed_last_2_min",
-                native_unit_of_measurement=DEGREE,
-                device_class=SensorDeviceClass.WIND_DIRECTION,
-                state_class=SensorStateClass.MEASUREMENT_ANGLE,
-            ),
-            SensorEntityDescription(
-                key="wind_speed_avg_last_10_min" + unique_key,
-                translation_key="wind_speed_avg_last_10_min",
-                native_unit_of_measurement=UnitOfSpeed.MILES_PER_HOUR,
-                device_class=SensorDeviceClass.WIND_SPEED,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="wind_dir_scalar_avg_last_10_min" + unique_key,
-                translation_key="wind_dir_scalar_avg_last_10_min",
-                native_unit_of_measurement=DEGREE,
-                device_class=SensorDeviceClass.WIND_DIRECTION,
-                state_class=SensorStateClass.MEASUREMENT_ANGLE,
-            ),
-            SensorEntityDescription(
-                key="wind_dir_scalar_avg_last_10_min_rose" + unique_key,
-                translation_key="wind_dir_scalar_avg_last_10_min_rose",
-                icon="mdi:compass-outline",
-            ),
-            SensorEntityDescription(
-                key="wind_speed_hi_last_10_min" + unique_key,
-                translation_key="wind_speed_hi_last_10_min",
-                native_unit_of_measurement=UnitOfSpeed.MILES_PER_HOUR,
-                device_class=SensorDeviceClass.WIND_SPEED,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="wind_dir_at_hi_speed_last_10_min" + unique_key,
-                translation_key="wind_dir_at_hi_speed_last_10_min",
-                native_unit_of_measurement=DEGREE,
-                device_class=SensorDeviceClass.WIND_DIRECTION,
-                state_class=SensorStateClass.MEASUREMENT_ANGLE,
-            ),
-            SensorEntityDescription(
-                key="rain_size" + unique_key,
-                translation_key="rain_size",
-                entity_category=EntityCategory.DIAGNOSTIC,
-                entity_registry_visible_default=False,
-                entity_registry_enabled_default=False,
-            ),
-            SensorEntityDescription(
-                key="rain_size_desc" + unique_key,
-                translation_key="rain_size_desc",
-                entity_category=EntityCategory.DIAGNOSTIC,
-                entity_registry_visible_default=False,
-                entity_registry_enabled_default=False,
-            ),
-            SensorEntityDescription(
-                key="rain_rate_last" + unique_key,
-                translation_key="rain_rate_last",
-                native_unit_of_measurement=rain_rate_unit,
-                device_class=SensorDeviceClass.PRECIPITATION_INTENSITY,
-                state_class=SensorStateClass.MEASUREMENT,
-                suggested_display_precision=2,
-            ),
-            SensorEntityDescription(
-                key="rain_rate_hi" + unique_key,
-                translation_key="rain_rate_hi",
-                native_unit_of_measurement=rain_rate_unit,
-                device_class=SensorDeviceClass.PRECIPITATION_INTENSITY,
-                state_class=SensorStateClass.MEASUREMENT,
-                suggested_display_precision=2,
-            ),
-            SensorEntityDescription(
-                key="rainfall_last_15_min" + unique_key,
-                translation_key="rainfall_last_15_min",
-                native_unit_of_measurement=rain_amount_unit,
-                device_class=SensorDeviceClass.PRECIPITATION,
-                state_class=SensorStateClass.MEASUREMENT,
-                suggested_display_precision=2,
-            ),
-            SensorEntityDescription(
-                key="rain_rate_hi_last_15_min" + unique_key,
-                translation_key="rain_rate_hi_last_15_min",
-                native_unit_of_measurement=rain_rate_unit,
-                device_class=SensorDeviceClass.PRECIPITATION_INTENSITY,
-                state_class=SensorStateClass.MEASUREMENT,
-                suggested_display_precision=2,
-            ),
-            SensorEntityDescription(
-                key="rainfall_last_60_min" + unique_key,
-                translation_key="rainfall_last_60_min",
-                native_unit_of_measurement=rain_amount_unit,
-                device_class=SensorDeviceClass.PRECIPITATION,
-                state_class=SensorStateClass.MEASUREMENT,
-                suggested_display_precision=2,
-            ),
-            SensorEntityDescription(
-                key="rainfall_last_24_hr" + unique_key,
-                translation_key="rainfall_last_24_hr",
-                native_unit_of_measurement=rain_amount_unit,
-                device_class=SensorDeviceClass.PRECIPITATION,
-                state_class=SensorStateClass.MEASUREMENT,
-                suggested_display_precision=2,
-            ),
-            SensorEntityDescription(
-                key="rain_storm" + unique_key,
-                translation_key="rain_storm",
-                native_unit_of_measurement=rain_amount_unit,
-                device_class=SensorDeviceClass.PRECIPITATION,
-                state_class=SensorStateClass.MEASUREMENT,
-                suggested_display_precision=2,
-            ),
-            SensorEntityDescription(
-                key="rain_storm_start_at" + unique_key,
-                translation_key="rain_storm_start_at",
-                device_class=SensorDeviceClass.TIMESTAMP,
-            ),
-            SensorEntityDescription(
-                key="solar_rad" + unique_key,
-                translation_key="solar_rad",
-                native_unit_of_measurement=UnitOfIrradiance.WATTS_PER_SQUARE_METER,
-                entity_registry_visible_default=False,
-                entity_registry_enabled_default=False,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="uv_index" + unique_key,
-                translation_key="uv_index",
-                entity_registry_visible_default=False,
-                entity_registry_enabled_default=False,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="rx_state" + unique_key,
-                translation_key="rx_state",
-                entity_category=EntityCategory.DIAGNOSTIC,
-            ),
-            SensorEntityDescription(
-                key="trans_battery_flag" + unique_key,
-                translation_key="trans_battery_flag",
-                entity_category=EntityCategory.DIAGNOSTIC,
-            ),
-            SensorEntityDescription(
-                key="rainfall_daily" + unique_key,
-                translation_key="rainfall_daily",
-                native_unit_of_measurement=rain_amount_unit,
-                device_class=SensorDeviceClass.PRECIPITATION,
-                state_class=SensorStateClass.TOTAL,
-                suggested_display_precision=2,
-            ),
-            SensorEntityDescription(
-                key="rainfall_monthly" + unique_key,
-                translation_key="rainfall_monthly",
-                native_unit_of_measurement=rain_amount_unit,
-                device_class=SensorDeviceClass.PRECIPITATION,
-                state_class=SensorStateClass.TOTAL,
-                suggested_display_precision=2,
-            ),
-            SensorEntityDescription(
-                key="rainfall_year" + unique_key,
-                translation_key="rainfall_year",
-                native_unit_of_measurement=rain_amount_unit,
-                device_class=SensorDeviceClass.PRECIPITATION,
-                state_class=SensorStateClass.TOTAL,
-                suggested_display_precision=2,
-            ),
-            SensorEntityDescription(
-                key="rain_storm_last" + unique_key,
-                translation_key="rain_storm_last",
-                native_unit_of_measurement=rain_amount_unit,
-                device_class=SensorDeviceClass.PRECIPITATION,
-                state_class=SensorStateClass.TOTAL,
-                suggested_display_precision=2,
-            ),
-            SensorEntityDescription(
-                key="rain_storm_last_start_at" + unique_key,
-                translation_key="rain_storm_last_start_at",
-                device_class=SensorDeviceClass.TIMESTAMP,
-            ),
-            SensorEntityDescription(
-                key="rain_storm_last_end_at" + unique_key,
-                translation_key="rain_storm_last_end_at",
-                device_class=SensorDeviceClass.TIMESTAMP,
-            ),
-        )
+    id_field = DEVICE_ID_FIELDS.get(device_type)
+    if id_field is None:
+        _LOGGER.warning("Unknown API device type %s", device_type)
+        return tuple()
 
-        # _LOGGER.debug("DST_1: %s", DST_1)
-        return DST_1
-
-    elif device_type == 2:  # Soil Moisture Sensors
-        unique_id = condition.get("txid")
-        unique_key = f"_tx{unique_id}"
-        DST_2: tuple[SensorEntityDescription, ...] = (
-            SensorEntityDescription(
-                key="lsid" + unique_key,
-                translation_key="lsid",
-                entity_category=EntityCategory.DIAGNOSTIC,
-                entity_registry_visible_default=False,
-                entity_registry_enabled_default=False,
-            ),
-            SensorEntityDescription(
-                key="data_structure_type" + unique_key,
-                translation_key="dst",
-                entity_category=EntityCategory.DIAGNOSTIC,
-                entity_registry_visible_default=False,
-                entity_registry_enabled_default=False,
-            ),
-            SensorEntityDescription(
-                key="temp_1" + unique_key,
-                translation_key="soil_temp_1",
-                native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-                device_class=SensorDeviceClass.TEMPERATURE,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="temp_2" + unique_key,
-                translation_key="soil_temp_2",
-                native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-                device_class=SensorDeviceClass.TEMPERATURE,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="temp_3" + unique_key,
-                translation_key="soil_temp_3",
-                native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-                device_class=SensorDeviceClass.TEMPERATURE,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="temp_4" + unique_key,
-                translation_key="soil_temp_4",
-                native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-                device_class=SensorDeviceClass.TEMPERATURE,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="moist_soil_1" + unique_key,
-                translation_key="moist_soil_1",
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="moist_soil_2" + unique_key,
-                translation_key="moist_soil_2",
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="moist_soil_3" + unique_key,
-                translation_key="moist_soil_3",
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="moist_soil_4" + unique_key,
-                translation_key="moist_soil_4",
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="wet_leaf_1" + unique_key,
-                translation_key="wet_leaf_1",
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="wet_leaf_2" + unique_key,
-                translation_key="wet_leaf_2",
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="rx_state" + unique_key,
-                translation_key="rx_state",
-                entity_category=EntityCategory.DIAGNOSTIC,
-            ),
-            SensorEntityDescription(
-                key="trans_battery_flag" + unique_key,
-                translation_key="trans_battery_flag",
-                entity_category=EntityCategory.DIAGNOSTIC,
-            ),
-        )
-        return DST_2
-
-    elif device_type == 3:  # Pressure Sensors
-        unique_id = condition.get("lsid")
-        unique_key = f"_ls{unique_id}"
-        # Device Sensor Type 3: Pressure Sensors
-        DST_3: tuple[SensorEntityDescription, ...] = (
-            SensorEntityDescription(
-                key="lsid" + unique_key,
-                translation_key="lsid",
-                entity_category=EntityCategory.DIAGNOSTIC,
-                entity_registry_visible_default=False,
-                entity_registry_enabled_default=False,
-            ),
-            SensorEntityDescription(
-                key="data_structure_type" + unique_key,
-                translation_key="dst",
-                entity_category=EntityCategory.DIAGNOSTIC,
-                entity_registry_visible_default=False,
-                entity_registry_enabled_default=False,
-            ),
-            SensorEntityDescription(
-                key="bar_sea_level" + unique_key,
-                translation_key="bar_sea_level",
-                native_unit_of_measurement=UnitOfPressure.INHG,
-                device_class=SensorDeviceClass.PRESSURE,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="bar_trend" + unique_key,
-                translation_key="bar_trend",
-                native_unit_of_measurement=UnitOfPressure.INHG,
-                device_class=SensorDeviceClass.PRESSURE,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="bar_absolute" + unique_key,
-                translation_key="bar_absolute",
-                native_unit_of_measurement=UnitOfPressure.INHG,
-                device_class=SensorDeviceClass.PRESSURE,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-        )
-        return DST_3
-
-    elif device_type == 4:  # Indoor WeatherLink Live Conditions
-        unique_id = condition.get("lsid")
-        unique_key = f"_ls{unique_id}"
-        # Device Sensor Type 4: Indoor WeatherLink Live Conditions
-        DST_4: tuple[SensorEntityDescription, ...] = (
-            SensorEntityDescription(
-                key="lsid" + unique_key,
-                translation_key="lsid",
-                entity_category=EntityCategory.DIAGNOSTIC,
-                entity_registry_visible_default=False,
-                entity_registry_enabled_default=False,
-            ),
-            SensorEntityDescription(
-                key="data_structure_type" + unique_key,
-                translation_key="dst",
-                entity_category=EntityCategory.DIAGNOSTIC,
-                entity_registry_visible_default=False,
-                entity_registry_enabled_default=False,
-            ),
-            SensorEntityDescription(
-                key="temp_in" + unique_key,
-                translation_key="temp_in",
-                native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-                device_class=SensorDeviceClass.TEMPERATURE,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="hum_in" + unique_key,
-                translation_key="hum_in",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=SensorDeviceClass.HUMIDITY,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="dew_point_in" + unique_key,
-                translation_key="dew_point_in",
-                native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-                device_class=SensorDeviceClass.TEMPERATURE,
-            ),
-            SensorEntityDescription(
-                key="heat_index_in" + unique_key,
-                translation_key="heat_index_in",
-                native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-                device_class=SensorDeviceClass.TEMPERATURE,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-        )
-        return DST_4
-
-    elif device_type == 6:  # WeatherLink Air Quality Monitors
-        unique_id = condition.get("lsid")
-        unique_key = f"_ls{unique_id}"
-        # Device Sensor Type 6: Weatherlink AQI Conditions
-        DST_6: tuple[SensorEntityDescription, ...] = (
-            SensorEntityDescription(
-                key="lsid" + unique_key,
-                translation_key="lsid",
-                entity_category=EntityCategory.DIAGNOSTIC,
-                entity_registry_visible_default=False,
-                entity_registry_enabled_default=False,
-            ),
-            SensorEntityDescription(
-                key="data_structure_type" + unique_key,
-                translation_key="dst",
-                entity_category=EntityCategory.DIAGNOSTIC,
-                entity_registry_visible_default=False,
-                entity_registry_enabled_default=False,
-            ),
-            SensorEntityDescription(
-                key="temp" + unique_key,
-                translation_key="temp",
-                native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-                device_class=SensorDeviceClass.TEMPERATURE,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="hum" + unique_key,
-                translation_key="hum",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=SensorDeviceClass.HUMIDITY,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="dew_point" + unique_key,
-                translation_key="dew_point",
-                native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-                device_class=SensorDeviceClass.TEMPERATURE,
-            ),
-            SensorEntityDescription(
-                key="wet_bulb" + unique_key,
-                translation_key="wet_bulb",
-                native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-                device_class=SensorDeviceClass.TEMPERATURE  ,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="heat_index" + unique_key,
-                translation_key="heat_index",
-                native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-                device_class=SensorDeviceClass.TEMPERATURE,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="pm_1_last" + unique_key,
-                translation_key="pm_1_last",
-                native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-                device_class=SensorDeviceClass.PM1,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="pm_2p5_last" + unique_key,
-                translation_key="pm_2p5_last",
-                native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-                device_class=SensorDeviceClass.PM25,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="pm_10_last" + unique_key,
-                translation_key="pm_10_last",
-                native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-                device_class=SensorDeviceClass.PM10,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="pm_1" + unique_key,
-                translation_key="pm_1",
-                native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-                device_class=SensorDeviceClass.PM1,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="pm_2p5" + unique_key,
-                translation_key="pm_2p5",
-                native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-                device_class=SensorDeviceClass.PM25,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="pm_10" + unique_key,
-                translation_key="pm_10",
-                native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-                device_class=SensorDeviceClass.PM10,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="pm_2p5_last_1_hour" + unique_key,
-                translation_key="pm_2p5_last_1_hour",
-                native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-                device_class=SensorDeviceClass.PM25,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="pm_2p5_last_3_hours" + unique_key,
-                translation_key="pm_2p5_last_3_hours",
-                native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-                device_class=SensorDeviceClass.PM25,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="pm_2p5_nowcast" + unique_key,
-                translation_key="pm_2p5_nowcast",
-                native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-                device_class=SensorDeviceClass.PM25,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="pm_2p5_last_24_hours" + unique_key,
-                translation_key="pm_2p5_last_24_hours",
-                native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-                device_class=SensorDeviceClass.PM25,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="pm_10_last_1_hour" + unique_key,
-                translation_key="pm_10_last_1_hour",
-                native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-                device_class=SensorDeviceClass.PM10,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="pm_10_last_3_hours" + unique_key,
-                translation_key="pm_10_last_3_hours",
-                native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-                device_class=SensorDeviceClass.PM10,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="pm_10_nowcast" + unique_key,
-                translation_key="pm_10_nowcast",
-                native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-                device_class=SensorDeviceClass.PM10,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="pm_10_last_24_hours" + unique_key,
-                translation_key="pm_10_last_24_hours",
-                native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-                device_class=SensorDeviceClass.PM10,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            SensorEntityDescription(
-                key="last_report_time" + unique_key,
-                translation_key="last_report_time",
-                device_class=SensorDeviceClass.TIMESTAMP,
-                entity_category=EntityCategory.DIAGNOSTIC,
-            ),
-            SensorEntityDescription(
-                key="pct_pm_data_last_1_hour" + unique_key,
-                translation_key="pct_pm_data_last_1_hour",
-                native_unit_of_measurement=PERCENTAGE,
-                state_class=SensorStateClass.MEASUREMENT,
-                entity_category=EntityCategory.DIAGNOSTIC,
-            ),
-            SensorEntityDescription(
-                key="pct_pm_data_last_3_hours" + unique_key,
-                translation_key="pct_pm_data_last_3_hours",
-                native_unit_of_measurement=PERCENTAGE,
-                state_class=SensorStateClass.MEASUREMENT,
-                entity_category=EntityCategory.DIAGNOSTIC,
-            ),
-            SensorEntityDescription(
-                key="pct_pm_data_nowcast" + unique_key,
-                translation_key="pct_pm_data_nowcast",
-                native_unit_of_measurement=PERCENTAGE,
-                state_class=SensorStateClass.MEASUREMENT,
-                entity_category=EntityCategory.DIAGNOSTIC,
-            ),
-            SensorEntityDescription(
-                key="pct_pm_data_last_24_hours" + unique_key,
-                translation_key="pct_pm_data_last_24_hours",
-                native_unit_of_measurement=PERCENTAGE,
-                state_class=SensorStateClass.MEASUREMENT,
-                entity_category=EntityCategory.DIAGNOSTIC,
-            ),
-            
-        )
-        return DST_6
+    # Compiled once per device and rain cup size from the field registry,
+    # which also drives parsing
+    return sensor_descriptions(
+        device_type, getattr(condition, id_field), condition.rain_size
+    )
 
 
-    else:
-        _LOGGER.warning("Unknown API device type %s", device_type)
+def get_rolling_sensors(condition: ConditionTopology, windows: tuple[int, ...]):
+    id_field = DEVICE_ID_FIELDS.get(condition.data_structure_type)
+    if id_field is None:
         return tuple()
 
+    return rolling_descriptions(
+        condition.data_structure_type,
+        getattr(condition, id_field),
+        condition.rain_size,
+        windows,
+    )
+
 
 # TODO - Device Sensor Type 2: Soil Moisture Sensors
 
 
+def build_sensors(
+    coordinator: WeatherCoordinator, entry_id: str
+) -> list[WeatherSensor]:
+    """Return the sensors for the topology of the coordinator's data."""
+
+    api_response = coordinator.data
+    sensors: list[WeatherSensor] = []
+
+    # Build the sensor list based on each condition topology and device type
+    for record_index, condition in enumerate(api_response.topology):
+        device_id = str(entry_id) + str(condition.lsid)
+        device_name = get_device_name(condition)
+        record = api_response.records[record_index]
+        sensors.extend(
+            WeatherSensor(
+                coordinator, description, device_id, device_name, record, record_index
+            )
+            for description in get_device_sensors(condition)
+        )
+        if coordinator.api_rolling:
+            sensors.extend(
+                RollingSensor(
+                    coordinator,
+                    description,
+                    device_id,
+                    device_name,
+                    record,
+                    record_index,
+                )
+                for description in get_rolling_sensors(
+                    condition, coordinator.api_rolling_windows
+                )
+            )
+        if coordinator.api_wind and condition.data_structure_type == 1:
+            sensors.extend(
+                WindSensor(
+                    coordinator,
+                    description,
+                    device_id,
+                    device_name,
+                    record,
+                    record_index,
+                )
+                for description in wind_descriptions(
+                    condition.txid, coordinator.api_wind_windows
+                )
+            )
+        if coordinator.api_trend and condition.data_structure_type == 3:
+            sensors.extend(
+                TrendSensor(
+                    coordinator,
+                    description,
+                    device_id,
+                    device_name,
+                    record,
+                    record_index,
+                )
+                for description in bar_trend_descriptions(
+                    condition.lsid, coordinator.api_trend_windows
+                )
+            )
+        if coordinator.api_aqi and condition.data_structure_type == 6:
+            sensors.extend(
+                AqiSensor(
+                    coordinator,
+                    description,
+                    device_id,
+                    device_name,
+                    record,
+                    record_index,
+                )
+                for description in aqi_descriptions(condition.lsid)
+            )
+        if coordinator.api_accumulators and condition.data_structure_type == 1:
+            sensors.extend(
+                AccumulatorSensor(
+                    coordinator,
+                    description,
+                    device_id,
+                    device_name,
+                    record,
+                    record_index,
+                )
+                for description in accumulator_descriptions(condition.txid)
+            )
+        if coordinator.api_rain and condition.data_structure_type == 1:
+            sensors.extend(
+                RainSensor(
+                    coordinator,
+                    description,
+                    device_id,
+                    device_name,
+                    record,
+                    record_index,
+                )
+                for description in rain_descriptions(
+                    condition.txid, condition.rain_size
+                )
+            )
+    return sensors
+
+
+async def async_swap_sensors(
+    config_entry: MyConfigEntry, coordinator: WeatherCoordinator
+) -> None:
+    """Move the sensors of an entry to a warmed up coordinator.
+
+    Sensors whose description and device are unchanged are rebound in place
+    and keep their entity. Only sensors that changed, appeared or are gone
+    are removed and added.
+    """
+
+    runtime_data = config_entry.runtime_data
+    current = runtime_data.sensors
+    sensors = {}
+    added = []
+    for sensor in build_sensors(coordinator, config_entry.entry_id):
+        key = sensor.entity_description.key
+        existing = current.pop(key, None)
+        if existing is not None and existing.same_as(sensor):
+            existing.rebind(sensor)
+            sensors[key] = existing
+            continue
+        if existing is not None:
+            current[key] = existing
+        sensors[key] = sensor
+        added.append(sensor)
+
+    # Remove first, a changed sensor is added again with the same unique ID
+    for sensor in current.values():
+        await sensor.async_remove()
+    runtime_data.sensors = sensors
+
+    _LOGGER.debug(
+        "Rebound %d sensor(s), removed %d, adding %d",
+        len(sensors) - len(added),
+        len(current),
+        len(added),
+    )
+    if added:
+        runtime_data.add_sensors(added)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: MyConfigEntry,
@@ -847,17 +234,14 @@ async def async_setup_entry(
     # Get api data from the coordinator
     api_response = coordinator.data
 
-    # Create a container for all sensors, and build the sensor list based on each condition in api response and device type
-    for condition in (
-        api_response.get("raw_api", {}).get("data", {}).get("conditions", [])
-    ):
-        device_id = str(config_entry.entry_id) + str(condition.get("lsid"))
-        device_name = get_device_name(condition)
-        sensors = [
-            WeatherSensor(coordinator, description, device_id, device_name)
-            for description in get_device_sensors(condition)
-        ]
-        async_add_entities(sensors)
+    # Create a container for all sensors, kept so a warm reload can move them
+    # to a new coordinator
+    sensors = build_sensors(coordinator, config_entry.entry_id)
+    config_entry.runtime_data.sensors = {
+        sensor.entity_description.key: sensor for sensor in sensors
+    }
+    config_entry.runtime_data.add_sensors = async_add_entities
+    async_add_entities(sensors)
 
     _LOGGER.debug("Sensory.py Coordinator API response: %s", api_response)
 
@@ -873,12 +257,17 @@ class WeatherSensor(CoordinatorEntity, SensorEntity):
         description: SensorEntityDescription,
         device_id: str,
         device_name: str,
+        record: ConditionRecord | None,
+        record_index: int,
     ):
-        super().__init__(coordinator)
+        # Key the coordinator listener so only changed values trigger a state write
+        super().__init__(coordinator, context=description.key)
         self.entity_description = description
         self._attr_unique_id = f"{description.key}"
         self._device_id = device_id  # Store the device ID to link together
         self._device_name = device_name
+
+        self._bind(record, record_index)
         _LOGGER.debug(
             "Sensor %s created with unique ID %s for device %s",
             description.key,
@@ -886,9 +275,46 @@ class WeatherSensor(CoordinatorEntity, SensorEntity):
             device_id,
         )
 
+    def _bind(self, record: ConditionRecord | None, record_index: int) -> None:
+        # Bind to the record position and field index once, so reading the
+        # value needs no key lookup. Keys tuples are shared per device, which
+        # lets native_value detect a record of another device cheaply.
+        self._record_index = record_index
+        self._record_keys = None if record is None else record.keys
+        self._field_index = (
+            None
+            if record is None or self.entity_description.key not in record.keys
+            else record.keys.index(self.entity_description.key)
+        )
+
+    def same_as(self, other: WeatherSensor) -> bool:
+        """Return True if other describes this entity for the same device."""
+        return (
+            type(self) is type(other)
+            and self.entity_description == other.entity_description
+            and self._device_id == other._device_id
+            and self._device_name == other._device_name
+        )
+
+    def rebind(self, other: WeatherSensor) -> None:
+        """Take over the coordinator and record binding of an equal sensor."""
+        self.coordinator = other.coordinator
+        self._record_index = other._record_index
+        self._record_keys = other._record_keys
+        self._field_index = other._field_index
+
     @property
     def native_value(self):
-        return self.coordinator.data.get(self.entity_description.key)
+        if self._field_index is None:
+            return None
+
+        records = self.coordinator.data.records
+        if self._record_index >= len(records):
+            return None
+        record = records[self._record_index]
+        if record is None or record.keys is not self._record_keys:
+            return None
+        return record.values[self._field_index]
 
     @property
     def device_info(self):
@@ -900,3 +326,73 @@ class WeatherSensor(CoordinatorEntity, SensorEntity):
             "model": "Davis WeatherLink Live / AirLink",
             "sw_version": "1.0",  # Add actual firmware version if Davis ever updates API
         }
+
+
+class RollingSensor(WeatherSensor):
+    """Rolling minimum, maximum or mean of a value, kept by the coordinator."""
+
+    @property
+    def native_value(self):
+        return self.coordinator.rolling.values.get(self.entity_description.key)
+
+
+class WindSensor(WeatherSensor):
+    """Vector-mean wind direction or wind rose, kept by the coordinator."""
+
+    @property
+    def native_value(self):
+        return self.coordinator.wind.values.get(self.entity_description.key)
+
+    @property
+    def extra_state_attributes(self):
+        return self.coordinator.wind.attributes.get(self.entity_description.key)
+
+
+class RainSensor(WeatherSensor):
+    """Rain total of a clock period or rain event, kept by the coordinator."""
+
+    @property
+    def native_value(self):
+        return self.coordinator.rain.values.get(self.entity_description.key)
+
+    @property
+    def extra_state_attributes(self):
+        return self.coordinator.rain.attributes.get(self.entity_description.key)
+
+
+class TrendSensor(WeatherSensor):
+    """Barometric trend over a window, kept by the coordinator."""
+
+    @property
+    def native_value(self):
+        return self.coordinator.trend.values.get(self.entity_description.key)
+
+    @property
+    def extra_state_attributes(self):
+        return self.coordinator.trend.attributes.get(self.entity_description.key)
+
+
+class AqiSensor(WeatherSensor):
+    """NowCast air quality index of PM2.5 or PM10, kept by the coordinator."""
+
+    @property
+    def native_value(self):
+        return self.coordinator.aqi.values.get(self.entity_description.key)
+
+    @property
+    def extra_state_attributes(self):
+        return self.coordinator.aqi.attributes.get(self.entity_description.key)
+
+
+class AccumulatorSensor(WeatherSensor):
+    """Daily ET0 or degree days, kept by the coordinator."""
+
+    @property
+    def native_value(self):
+        return self.coordinator.accumulators.values.get(self.entity_description.key)
+
+    @property
+    def extra_state_attributes(self):
+        return self.coordinator.accumulators.attributes.get(
+            self.entity_description.key
+        )
@@ -0,0 +1,201 @@
+"""Vector-averaged wind direction and wind rose of ISS transmitters."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from collections.abc import Sequence
+from typing import Any
+
+from .const import ROLLING_BUCKETS, WIND_ROSE_SECTORS, WIND_ROSE_WINDOW
+from .davis_weatherlink_live import DavisWeatherLinkLive
+from .records import WeatherSnapshot
+from .registry import wind_rose_key, wind_vector_key
+
+# Compass points of the wind rose sectors, clockwise from north
+SECTORS = tuple(
+    DavisWeatherLinkLive.wind_dir_to_rose(sector * 360 / WIND_ROSE_SECTORS)
+    for sector in range(WIND_ROSE_SECTORS)
+)
+
+
+class SumWindow:
+    """Running sums of the vectors added over the last window.
+
+    Like RollingWindow, samples are grouped into ROLLING_BUCKETS buckets that
+    expire together, so adding a sample and reading the totals are O(1)
+    however long the window is.
+    """
+
+    __slots__ = ("window", "width", "totals", "_buckets")
+
+    def __init__(self, window: float, size: int, buckets: int = ROLLING_BUCKETS):
+        self.window = window
+        self.width = window / buckets
+        self.totals = [0.0] * size
+        # (bucket start, sums) oldest first
+        self._buckets: deque[tuple[float, list[float]]] = deque()
+
+    def add(self, values: Sequence[float], now: float) -> None:
+        """Add a vector sampled at now, in monotonic seconds."""
+
+        self.expire(now)
+        start = now - now % self.width
+        if not self._buckets or self._buckets[-1][0] != start:
+            self._buckets.append((start, [0.0] * len(self.totals)))
+        sums = self._buckets[-1][1]
+        totals = self.totals
+        for index, value in enumerate(values):
+            sums[index] += value
+            totals[index] += value
+
+    def expire(self, now: float) -> None:
+        """Drop the buckets that ended more than a window before now."""
+
+        cutoff = now - self.window - self.width
+        buckets = self._buckets
+        totals = self.totals
+        while buckets and buckets[0][0] <= cutoff:
+            for index, value in enumerate(buckets.popleft()[1]):
+                totals[index] -= value
+        if not buckets:
+            # Start over exactly, without accumulated rounding errors
+            self.totals = [0.0] * len(totals)
+
+
+class WindStatistics:
+    """Vector-mean wind direction and speed-weighted wind rose per ISS.
+
+    Each sample of wind_speed_last and wind_dir_last, from a poll or a UDP
+    real-time frame, is split into east (u) and north (v) components scaled
+    by speed. The direction of the summed vector is the mean direction, so
+    winds swinging around north average to north instead of south, as the
+    device's scalar averages do. The rose sums speed per compass sector
+    over WIND_ROSE_WINDOW. Values are keyed by entity key, with extra
+    details as state attributes.
+    """
+
+    def __init__(self, windows: tuple[int, ...]) -> None:
+        self.windows = windows
+        self.values: dict[str, Any] = {}
+        self.attributes: dict[str, dict[str, Any]] = {}
+        # [u, v, speed, samples] per transmitter and window
+        self._vectors: dict[tuple[int | None, int], SumWindow] = {}
+        # [speed per sector..., calm samples, samples] per transmitter
+        self._roses: dict[int | None, SumWindow] = {}
+        self._changed: set[str] = set()
+
+    def update(
+        self,
+        snapshot: WeatherSnapshot,
+        now: float,
+        previous: WeatherSnapshot | None = None,
+    ) -> None:
+        """Add the wind of every ISS record not shared with previous."""
+
+        for position, (device, record) in enumerate(
+            zip(snapshot.topology, snapshot.records)
+        ):
+            if record is None or device.data_structure_type != 1:
+                continue
+            # A real-time merge shares the records of the other transmitters
+            if (
+                previous is not None
+                and position < len(previous.records)
+                and previous.records[position] is record
+            ):
+                continue
+
+            speed = record.get("wind_speed_last")
+            direction = record.get("wind_dir_last")
+            if not isinstance(speed, (int, float)) or not isinstance(
+                direction, (int, float)
+            ):
+                continue
+            self._add(device.txid, float(speed), float(direction), now)
+
+    def _add(
+        self, txid: int | None, speed: float, direction: float, now: float
+    ) -> None:
+        radians = math.radians(direction)
+        sample = (speed * math.sin(radians), speed * math.cos(radians), speed, 1)
+        for window in self.windows:
+            vectors = self._vectors.get((txid, window))
+            if vectors is None:
+                vectors = self._vectors[(txid, window)] = SumWindow(window, 4)
+            vectors.add(sample, now)
+            self._set_vector(wind_vector_key(txid, window), vectors.totals)
+
+        rose = self._roses.get(txid)
+        if rose is None:
+            rose = self._roses[txid] = SumWindow(
+                WIND_ROSE_WINDOW, WIND_ROSE_SECTORS + 2
+            )
+        sample = [0.0] * (WIND_ROSE_SECTORS + 2)
+        if speed > 0:
+            sample[round(direction * WIND_ROSE_SECTORS / 360) % WIND_ROSE_SECTORS] = (
+                speed
+            )
+        else:
+            sample[WIND_ROSE_SECTORS] = 1
+        sample[WIND_ROSE_SECTORS + 1] = 1
+        rose.add(sample, now)
+        self._set_rose(wind_rose_key(txid), rose.totals)
+
+    def _set_vector(self, key: str, totals: list[float]) -> None:
+        u, v, speed, samples = totals
+        magnitude = math.hypot(u, v)
+        if not samples or magnitude < 1e-9:
+            # Calm throughout the window, there is no direction
+            self._set(key, None, {})
+            return
+
+        direction = round(math.degrees(math.atan2(u, v))) % 360
+        self._set(
+            key,
+            direction,
+            {
+                "compass": DavisWeatherLinkLive.wind_dir_to_rose(direction),
+                "vector_speed": round(magnitude / samples, 1),
+                "scalar_speed": round(speed / samples, 1),
+                # 1 for a steady direction, near 0 for a variable one
+                "steadiness": round(magnitude / speed, 2),
+            },
+        )
+
+    def _set_rose(self, key: str, totals: list[float]) -> None:
+        sectors = totals[:WIND_ROSE_SECTORS]
+        calm, samples = totals[WIND_ROSE_SECTORS:]
+        total = sum(sectors)
+        if total <= 0:
+            self._set(key, None, {"calm": 100.0 if samples else None})
+            return
+
+        prevailing = max(range(WIND_ROSE_SECTORS), key=sectors.__getitem__)
+        attributes = {
+            name: round(value * 100 / total, 1)
+            for name, value in zip(SECTORS, sectors)
+        }
+        attributes["calm"] = round(calm * 100 / samples, 1)
+        self._set(key, SECTORS[prevailing], attributes)
+
+    def _set(self, key: str, value: Any, attributes: dict[str, Any]) -> None:
+        if self.values.get(key) != value or self.attributes.get(key) != attributes:
+            self.values[key] = value
+            self.attributes[key] = attributes
+            self._changed.add(key)
+
+    def pop_changed(self) -> set[str]:
+        """Return and reset the keys of wind statistics that changed."""
+
+        changed = self._changed
+        self._changed = set()
+        return changed
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the windows and current values for the diagnostics download."""
+
+        return {
+            "windows": list(self.windows),
+            "values": dict(self.values),
+        }
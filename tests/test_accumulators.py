@@ -0,0 +1,161 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.davis_weatherlink_live.accumulators import (
+    DailyAccumulators,
+    Evapotranspiration,
+    wind_at_2m,
+)
+from custom_components.davis_weatherlink_live.records import (
+    ConditionTopology,
+    IssRecord,
+    WeatherSnapshot,
+)
+from custom_components.davis_weatherlink_live.registry import (
+    accumulator_descriptions,
+)
+
+TOPOLOGY = (ConditionTopology(1, 1, 1, 1),)
+KEYS = tuple(f"{name}_tx1" for name in IssRecord.fields)
+TZ = timezone(timedelta(hours=-5))
+
+
+def snapshot(temp, hum=None, wind=None, solar=None):
+    values = [None] * len(IssRecord.fields)
+    values[IssRecord.field_index["temp"]] = temp
+    values[IssRecord.field_index["hum"]] = hum
+    values[IssRecord.field_index["wind_speed_avg_last_10_min"]] = wind
+    values[IssRecord.field_index["solar_rad"]] = solar
+    return WeatherSnapshot(TOPOLOGY, (IssRecord(KEYS, values),))
+
+
+def accumulators(reset_hour=0):
+    return DailyAccumulators(
+        Evapotranspiration(40.0, -75.0, 100),
+        reset_hour=reset_hour,
+        gdd_base=50.0,
+        degree_day_base=65.0,
+    )
+
+
+class TestEvapotranspiration:
+
+    def test_fao_56_example_19(self):
+        # N'Diaye, Senegal, 1 October 14:00-15:00 local time (UTC-1)
+        et0 = Evapotranspiration(16.22, -16.25, 8)
+        when = datetime(2026, 10, 1, 14, 30, tzinfo=timezone(timedelta(hours=-1)))
+        rate = et0.rate(38.0, 52.0, 3.3, 2.450 / 0.0036, when)
+        assert rate == pytest.approx(0.63, abs=0.02)
+
+    def test_night_is_near_zero(self):
+        et0 = Evapotranspiration(40.0, -75.0, 100)
+        when = datetime(2026, 7, 1, 2, 0, tzinfo=TZ)
+        assert abs(et0.rate(18.0, 90.0, 0.5, 0.0, when)) < 0.02
+
+
+    def test_wind_at_2m(self):
+        # FAO-56 example 14, 3.2 m/s measured at 10 m
+        assert wind_at_2m(3.2, 10) == pytest.approx(2.4, abs=0.01)
+        assert wind_at_2m(3.2, 2) == pytest.approx(3.2, abs=0.01)
+
+
+class TestDailyAccumulators:
+
+    def test_keys_match_sensor_descriptions(self):
+        daily = accumulators()
+        now = datetime(2026, 7, 1, 12, tzinfo=TZ)
+        daily.update(snapshot(70.0, 50.0, 5.0, 500.0), now)
+        assert set(daily.values) == {
+            description.key for description in accumulator_descriptions(1)
+        }
+
+    def test_degree_days_integrate_over_time(self):
+        daily = accumulators()
+        start = datetime(2026, 7, 1, 6, tzinfo=TZ)
+        for minute in range(0, 361, 5):
+            daily.update(snapshot(71.0), start + timedelta(minutes=minute))
+        # A quarter of a day 21 °F above the growing base, 6 °F above 65 °F
+        assert daily.values["gdd_today_tx1"] == pytest.approx(21 / 4, abs=0.01)
+        assert daily.values["cdd_today_tx1"] == pytest.approx(6 / 4, abs=0.01)
+        assert daily.values["hdd_today_tx1"] == 0.0
+        assert "et0_today_tx1" not in daily.values
+
+    def test_long_gaps_are_not_integrated(self):
+        daily = accumulators()
+        start = datetime(2026, 7, 1, 6, tzinfo=TZ)
+        daily.update(snapshot(41.0), start)
+        daily.update(snapshot(41.0), start + timedelta(hours=2))
+        assert daily.values["hdd_today_tx1"] == 0.0
+
+    def test_reset_at_the_reset_hour(self):
+        daily = accumulators(reset_hour=6)
+        start = datetime(2026, 7, 1, 5, tzinfo=TZ)
+        for minute in range(0, 24 * 60 + 1, 10):
+            daily.update(snapshot(53.0), start + timedelta(minutes=minute))
+        # 12 °F below the base from 06:00 to 05:00 the next morning
+        assert daily.values["hdd_today_tx1"] == pytest.approx(12 * 23 / 24, abs=0.01)
+        attributes = daily.attributes["hdd_today_tx1"]
+        assert attributes["since"] == datetime(2026, 7, 1, 6, tzinfo=TZ).isoformat()
+        # The first day started at 05:00 and was only partly observed
+        assert attributes["yesterday"] is None
+
+        # The polls across the reset were missed, the new day starts at 06:10
+        second = datetime(2026, 7, 2, 6, 10, tzinfo=TZ)
+        for minute in range(0, 12 * 60 + 1, 10):
+            daily.update(snapshot(53.0), second + timedelta(minutes=minute))
+        assert daily.attributes["hdd_today_tx1"]["yesterday"] == 11.5
+        assert daily.values["hdd_today_tx1"] == 6.0
+
+        daily.update(snapshot(53.0), datetime(2026, 7, 3, 6, 5, tzinfo=TZ))
+        assert daily.attributes["hdd_today_tx1"]["yesterday"] == 6.0
+        assert daily.values["hdd_today_tx1"] == 0.0
+
+    def test_restored_sums_continue_the_day(self):
+        daily = accumulators()
+        start = datetime(2026, 7, 1, 6, tzinfo=TZ)
+        for minute in range(0, 181, 5):
+            daily.update(snapshot(71.0), start + timedelta(minutes=minute))
+        stored = json.loads(json.dumps(daily.dump()))
+
+        restarted = accumulators()
+        restarted.restore(stored, start + timedelta(hours=3, minutes=5))
+        assert restarted.values == daily.values
+        assert restarted.attributes == daily.attributes
+        for minute in range(185, 361, 5):
+            restarted.update(snapshot(71.0), start + timedelta(minutes=minute))
+        assert restarted.values["gdd_today_tx1"] == pytest.approx(21 / 4, abs=0.01)
+
+    def test_sums_of_another_day_are_not_restored(self):
+        daily = accumulators()
+        daily.update(snapshot(71.0), datetime(2026, 7, 1, 22, tzinfo=TZ))
+        daily.update(snapshot(71.0), datetime(2026, 7, 1, 22, 5, tzinfo=TZ))
+
+        restarted = accumulators()
+        restarted.restore(daily.dump(), datetime(2026, 7, 2, 0, 10, tzinfo=TZ))
+        assert restarted.values == {}
+
+    def test_et0_accumulates_in_daylight(self):
+        daily = accumulators()
+        start = datetime(2026, 7, 1, 11, tzinfo=TZ)
+        for minute in range(0, 121, 5):
+            daily.update(
+                snapshot(86.0, 40.0, 6.0, 850.0), start + timedelta(minutes=minute)
+            )
+        # A hot, dry and sunny summer midday evaporates around 0.7 mm per hour
+        assert 1.0 < daily.values["et0_today_tx1"] < 2.0
+
+    def test_et0_uses_wind_at_2m(self):
+        start = datetime(2026, 7, 1, 11, tzinfo=TZ)
+        totals = []
+        for height in (2.0, 10.0):
+            daily = accumulators()
+            daily.anemometer_height = height
+            for minute in range(0, 61, 5):
+                daily.update(
+                    snapshot(86.0, 40.0, 15.0, 850.0), start + timedelta(minutes=minute)
+                )
+            totals.append(daily.values["et0_today_tx1"])
+        # The same wind measured higher up is weaker at 2 m and dries less
+        assert totals[1] < totals[0]
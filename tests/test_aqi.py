@@ -0,0 +1,108 @@
+import pytest
+
+from custom_components.davis_weatherlink_live.aqi import (
+    PM_10_BREAKPOINTS,
+    PM_2P5_BREAKPOINTS,
+    AirQuality,
+    HourlyAverages,
+    aqi,
+    nowcast,
+)
+from custom_components.davis_weatherlink_live.records import (
+    AirLinkRecord,
+    ConditionTopology,
+    WeatherSnapshot,
+)
+from custom_components.davis_weatherlink_live.registry import aqi_descriptions
+
+KEYS = tuple(f"{name}_ls5" for name in AirLinkRecord.fields)
+HOUR = 3600 * 480_000
+
+
+def snapshot(pm_2p5, pm_10, nowcast_2p5=None, nowcast_10=None):
+    values = [None] * len(AirLinkRecord.fields)
+    values[AirLinkRecord.field_index["pm_2p5"]] = pm_2p5
+    values[AirLinkRecord.field_index["pm_10"]] = pm_10
+    values[AirLinkRecord.field_index["pm_2p5_nowcast"]] = nowcast_2p5
+    values[AirLinkRecord.field_index["pm_10_nowcast"]] = nowcast_10
+    topology = (ConditionTopology(5, 6, None, None),)
+    return WeatherSnapshot(topology, (AirLinkRecord(KEYS, values),))
+
+
+class TestAqi:
+
+    @pytest.mark.parametrize(
+        ("concentration", "expected"),
+        [
+            (0.0, (0, "good")),
+            (9.0, (50, "good")),
+            (9.09, (50, "good")),
+            (9.1, (51, "moderate")),
+            (35.4, (100, "moderate")),
+            (55.5, (151, "unhealthy")),
+            (400.0, (500, "hazardous")),
+        ],
+    )
+    def test_pm_2p5(self, concentration, expected):
+        assert aqi(concentration, PM_2P5_BREAKPOINTS, 1) == expected
+
+    def test_pm_10(self):
+        assert aqi(54.9, PM_10_BREAKPOINTS, 0) == (50, "good")
+        assert aqi(100, PM_10_BREAKPOINTS, 0) == (73, "moderate")
+
+
+class TestNowcast:
+
+    def test_steady_hours_are_an_average(self):
+        assert nowcast([10.0] * 12) == pytest.approx(10.0)
+
+    def test_needs_two_of_the_last_three_hours(self):
+        assert nowcast([10.0, None, None, 10.0]) is None
+        assert nowcast([10.0, None, 10.0]) == pytest.approx(10.0)
+
+    def test_epa_example(self):
+        # Weight factor 0.5 when the concentration more than halved
+        hours = [60.0, 20.0, 10.0] + [None] * 9
+        assert nowcast(hours) == pytest.approx((60 + 10 + 2.5) / 1.75)
+
+
+class TestHourlyAverages:
+
+    def test_incomplete_hours_are_dropped(self):
+        hours = HourlyAverages()
+        for minute in range(60):
+            hours.add(10.0, HOUR + minute * 60)
+        # Only the first 30 minutes of the next hour
+        for minute in range(30):
+            hours.add(20.0, HOUR + 3600 + minute * 60)
+        assert hours.add(30.0, HOUR + 7200)
+        assert hours.last_hours()[:2] == [None, 10.0]
+
+
+class TestAirQuality:
+
+    def test_keys_match_sensor_descriptions(self):
+        air = AirQuality()
+        air.update(snapshot(3.0, 5.0, 4.0, 6.0), HOUR)
+        assert set(air.values) == {
+            description.key for description in aqi_descriptions(5)
+        }
+
+    def test_device_nowcast_until_hours_are_collected(self):
+        air = AirQuality()
+        air.update(snapshot(30.0, 100.0, 12.0, 60.0), HOUR)
+        assert air.values["aqi_pm_2p5_ls5"] == 56
+        assert air.attributes["aqi_pm_2p5_ls5"] == {
+            "category": "moderate",
+            "nowcast": 12.0,
+            "source": "device",
+        }
+
+        for minute in range(1, 120):
+            air.update(snapshot(30.0, 100.0, 12.0, 60.0), HOUR + minute * 60)
+        assert air.attributes["aqi_pm_2p5_ls5"]["source"] == "device"
+        # The second complete hour closes
+        air.update(snapshot(30.0, 100.0, 12.0, 60.0), HOUR + 2 * 3600)
+        assert air.values["aqi_pm_2p5_ls5"] == 90
+        assert air.attributes["aqi_pm_2p5_ls5"]["source"] == "local"
+        assert air.values["aqi_pm_10_ls5"] == 73
@@ -0,0 +1,106 @@
+import pytest
+
+from custom_components.davis_weatherlink_live.barometer import (
+    BarometricTrends,
+    PressureHistory,
+    tendency,
+)
+from custom_components.davis_weatherlink_live.records import (
+    ConditionTopology,
+    LssBarRecord,
+    WeatherSnapshot,
+)
+from custom_components.davis_weatherlink_live.registry import bar_trend_descriptions
+
+KEYS = tuple(f"{name}_ls1" for name in LssBarRecord.fields)
+
+
+def snapshot(bar_sea_level):
+    topology = (ConditionTopology(1, 3, None, None),)
+    record = LssBarRecord(KEYS, [1, bar_sea_level, 0.0, 29.9, 3])
+    return WeatherSnapshot(topology, (record,))
+
+
+def least_squares(points):
+    n = len(points)
+    mean_t = sum(t for t, _ in points) / n
+    mean_p = sum(p for _, p in points) / n
+    return sum((t - mean_t) * (p - mean_p) for t, p in points) / sum(
+        (t - mean_t) ** 2 for t, _ in points
+    )
+
+
+class TestPressureHistory:
+
+    def test_slope_of_a_line(self):
+        history = PressureHistory((3600,))
+        for minute in range(30):
+            history.add(30.0 + 0.001 * minute, 1000 + minute * 60)
+        assert history.fits[0].slope == pytest.approx(0.001 / 60)
+
+    def test_matches_a_full_fit_after_expiry(self):
+        history = PressureHistory((1800, 3600))
+        points = []
+        for minute in range(600):
+            pressure = 30.0 + 0.01 * ((minute * 7) % 13) - 0.0005 * minute
+            now = 5_000_000 + minute * 61
+            history.add(pressure, now)
+            points.append((now, pressure))
+        for fit in history.fits:
+            inside = [(t, p) for t, p in points if t > points[-1][0] - fit.window]
+            assert fit.n == len(inside)
+            assert fit.slope == pytest.approx(least_squares(inside), rel=1e-6)
+
+    def test_close_samples_are_skipped(self):
+        history = PressureHistory((1800,))
+        assert history.add(30.0, 0)
+        assert not history.add(30.1, 30)
+        assert history.add(30.1, 60)
+        assert history.fits[0].n == 2
+
+    def test_arrays_are_bounded(self):
+        history = PressureHistory((1800,))
+        for minute in range(1000):
+            history.add(30.0, minute * 60)
+        assert len(history.times) == history.capacity == 32
+        assert history.fits[0].n == 30
+
+
+class TestBarometricTrends:
+
+    def test_keys_match_sensor_descriptions(self):
+        trends = BarometricTrends((1800, 10800))
+        for minute in range(20):
+            trends.update(snapshot(30.0), minute * 60)
+        assert set(trends.values) == {
+            description.key for description in bar_trend_descriptions(1, (1800, 10800))
+        }
+
+    def test_change_and_tendency(self):
+        trends = BarometricTrends((1800, 3600))
+        # Falling 0.03 inHg per hour
+        for minute in range(31):
+            trends.update(snapshot(30.1 - 0.0005 * minute), minute * 60)
+        assert trends.values["bar_trend_ls1_30m"] == pytest.approx(-0.015)
+        assert trends.attributes["bar_trend_ls1_30m"] == {
+            "tendency": "falling_rapidly"
+        }
+        assert trends.values["bar_trend_ls1_1h"] == pytest.approx(-0.03)
+
+    def test_short_history_is_unknown(self):
+        trends = BarometricTrends((3600,))
+        for minute in range(20):
+            trends.update(snapshot(30.0), minute * 60)
+        assert trends.values["bar_trend_ls1_1h"] is None
+
+    def test_tendency(self):
+        assert tendency(0.0) == "steady"
+        assert tendency(0.03) == "rising_slowly"
+        assert tendency(-0.06) == "falling_rapidly"
+
+    def test_no_windows_is_ignored(self):
+        trends = BarometricTrends(())
+        for minute in range(5):
+            trends.update(snapshot(30.0), minute * 60)
+        assert trends.values == {}
+        assert trends.diagnostics()["windows"] == []
@@ -0,0 +1,21 @@
+import pytest
+import voluptuous as vol
+
+from custom_components.davis_weatherlink_live.config_flow import (
+    validate_polling_section,
+    validate_trend_section,
+)
+
+
+class TestValidators:
+
+    def test_adaptive_interval_range(self):
+        assert validate_polling_section({"min_interval": 10, "max_interval": 300})
+        with pytest.raises(vol.Invalid, match="adaptive_interval_range"):
+            validate_polling_section({"min_interval": 60, "max_interval": 30})
+
+    def test_trend_needs_a_window(self):
+        assert validate_trend_section({"trend": True, "windows": ["3600"]})
+        assert validate_trend_section({"trend": False, "windows": []})
+        with pytest.raises(vol.Invalid, match="trend_windows_required"):
+            validate_trend_section({"trend": True, "windows": []})
@@ -0,0 +1,40 @@
+import asyncio
+
+from homeassistant.components import zeroconf
+
+from custom_components.davis_weatherlink_live import connection
+from custom_components.davis_weatherlink_live.connection import DeviceConnection
+
+
+class FakeResolver:
+
+    def __init__(self, async_zeroconf):
+        self.closed = False
+
+    async def resolve(self, host, port=0, family=0):
+        return []
+
+    async def close(self):
+        self.closed = True
+
+
+class TestDeviceConnection:
+
+    def test_close_closes_the_resolver(self, monkeypatch):
+        monkeypatch.setattr(connection, "AsyncDualMDNSResolver", FakeResolver)
+        monkeypatch.setattr(zeroconf, "async_get_async_zeroconf", lambda hass: None)
+
+        async def main():
+            device = DeviceConnection(None, "weatherlink.local")
+            session = device.session
+            resolver = device._resolver
+            assert isinstance(resolver, FakeResolver)
+
+            await device.async_close()
+            assert session.closed
+            assert resolver.closed
+            assert device._resolver is None
+            # Closing twice is harmless
+            await device.async_close()
+
+        asyncio.run(main())
@@ -0,0 +1,489 @@
+import asyncio
+import tempfile
+from types import MappingProxyType, SimpleNamespace
+
+import pytest
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from custom_components.davis_weatherlink_live import (
+    RuntimeData,
+    async_setup_entry,
+    connection,
+    sensor,
+)
+from custom_components.davis_weatherlink_live.const import DOMAIN
+from custom_components.davis_weatherlink_live.coordinator import WeatherCoordinator
+from custom_components.davis_weatherlink_live.davis_weatherlink_live import (
+    DavisWeatherLinkLive,
+)
+from custom_components.davis_weatherlink_live.sensor import (
+    RollingSensor,
+    WindSensor,
+    async_swap_sensors,
+    build_sensors,
+)
+
+OPTIONS = {
+    "api_host": "127.0.0.1:18081",
+    "api_path": "/v1/current_conditions",
+    "update_interval": 30,
+}
+
+
+def payload(ts, temp=70.0, rainfall_daily=50, rainfall_year=500, bar=30.0):
+    """Return a current conditions response of one ISS and an LSS BAR."""
+    return {
+        "data": {
+            "did": "001D0A700000",
+            "ts": ts,
+            "conditions": [
+                {
+                    "lsid": 100,
+                    "data_structure_type": 1,
+                    "txid": 1,
+                    "temp": temp,
+                    "hum": 50.0,
+                    "wind_speed_last": 2.0,
+                    "wind_dir_last": 90,
+                    "wind_speed_avg_last_10_min": 2.0,
+                    "wind_dir_scalar_avg_last_10_min": 90,
+                    "rain_size": 2,
+                    "rain_rate_last": 0,
+                    "rainfall_daily": rainfall_daily,
+                    "rainfall_year": rainfall_year,
+                    "rx_state": 0,
+                },
+                {
+                    "lsid": 101,
+                    "data_structure_type": 3,
+                    "bar_sea_level": bar,
+                    "bar_trend": 0.0,
+                    "bar_absolute": 29.9,
+                },
+            ],
+        }
+    }
+
+
+@pytest.fixture
+def device(monkeypatch):
+    """Serve device["payload"] to every coordinator instead of the network."""
+
+    # .local names are resolved through zeroconf, not running in these tests
+    monkeypatch.setattr(connection, "AsyncDualMDNSResolver", None)
+    state = {"payload": payload(1000), "requests": 0}
+
+    async def fetch_weather_data(self):
+        state["requests"] += 1
+        return state["payload"]
+
+    monkeypatch.setattr(DavisWeatherLinkLive, "fetch_weather_data", fetch_weather_data)
+    return state
+
+
+def run(test, options=None):
+    """Run a test coroutine with a Home Assistant instance and config entry."""
+
+    async def main():
+        hass = HomeAssistant(tempfile.mkdtemp())
+        entry = ConfigEntry(
+            version=1,
+            minor_version=1,
+            domain=DOMAIN,
+            title="Davis Device",
+            data={},
+            options={**OPTIONS, **(options or {})},
+            source="user",
+            unique_id=None,
+            discovery_keys={},
+            subentries_data=None,
+        )
+        try:
+            await test(hass, entry)
+        finally:
+            await hass.async_stop(force=True)
+
+    asyncio.run(main())
+
+
+def install_sensors(hass, entry, coordinator):
+    """Build the coordinator's sensors as the entry's platform would."""
+    sensors = build_sensors(coordinator, entry.entry_id)
+    for sensor in sensors:
+        sensor.hass = hass
+        sensor.entity_id = f"sensor.{sensor.entity_description.key}"
+    entry.runtime_data.sensors = {
+        sensor.entity_description.key: sensor for sensor in sensors
+    }
+    return sensors
+
+
+async def start(hass, entry):
+    """Return a refreshed coordinator installed as the entry's coordinator."""
+    coordinator = WeatherCoordinator(hass, entry)
+    await coordinator.async_refresh()
+    entry.runtime_data = RuntimeData(coordinator, lambda: None)
+    install_sensors(hass, entry, coordinator)
+    entry.runtime_data.add_sensors = lambda added: None
+    return coordinator
+
+
+class TestListeners:
+
+    def test_move_listeners(self, device):
+        async def test(hass, entry):
+            first = await start(hass, entry)
+            second = WeatherCoordinator(hass, entry)
+            second.data = first.data
+            calls = []
+            remove = first.async_add_listener(lambda: calls.append(1), "temp_tx1")
+
+            first.async_move_listeners(second)
+            assert first._key_listeners == {}
+            (listener,) = second._key_listeners["temp_tx1"]
+            assert listener.coordinator is second
+            # The first dispatch of the new coordinator notifies everyone
+            second.async_update_listeners()
+            assert calls == [1]
+
+            remove()
+            assert second._key_listeners == {}
+            await first.async_shutdown()
+            await second.async_shutdown()
+
+        run(test)
+
+
+class TestWarmReload:
+
+    def test_statistics_carry_over(self, device):
+        async def test(hass, entry):
+            first = await start(hass, entry)
+            rain = first.rain
+            device["payload"] = payload(1010, rainfall_daily=51, rainfall_year=501)
+
+            assert await first.async_warm_reload()
+            second = entry.runtime_data.coordinator
+            assert second is not first
+            assert second.rain is rain
+            assert second.rolling is first.rolling
+            assert second.device_received is first.device_received
+            # Seeded with 50 tips by the first coordinator, the warm-up poll
+            # only fed the new coordinator's own engines
+            assert second.rain.values["rain_today_tx1"] == 10.0
+            device["payload"] = payload(1020, rainfall_daily=52, rainfall_year=502)
+            await second.async_refresh()
+            assert second.rain.values["rain_today_tx1"] == 10.4
+            await second.async_shutdown()
+
+        run(test, {"rain_section": {"rain": True}})
+
+    def test_failed_reload_keeps_running(self, device):
+        async def test(hass, entry):
+            first = await start(hass, entry)
+            deadband = first.deadband
+            deadbands = dict(deadband.deadbands)
+            options = {
+                **entry.options,
+                "filter_section": {"deadband": True, "temperature_deadband": 0.5},
+            }
+            object.__setattr__(entry, "options", MappingProxyType(options))
+            device["payload"] = {"data": {"error": "asyncio.TimeoutError"}}
+
+            assert not await first.async_warm_reload()
+            assert entry.runtime_data.coordinator is first
+            assert first.deadband is deadband
+            assert deadband.deadbands == deadbands
+            await first.async_shutdown()
+
+        run(test)
+
+    def test_new_address_starts_over(self, device):
+        async def test(hass, entry):
+            first = await start(hass, entry)
+            options = {**entry.options, "api_host": "127.0.0.2:18081"}
+            # Options are saved by the options flow before it calls this
+            object.__setattr__(entry, "options", MappingProxyType(options))
+            await first.async_apply_options(entry.options)
+            await hass.async_block_till_done(wait_background_tasks=True)
+
+            second = entry.runtime_data.coordinator
+            assert second is not first
+            assert second.wll_local.api_url.startswith("http://127.0.0.2:18081")
+            assert second.rain is not first.rain
+            assert second.outliers is not first.outliers
+            assert second.device_received is not first.device_received
+            await second.async_shutdown()
+
+        run(test, {"rain_section": {"rain": True}})
+
+
+class TestApplyOptions:
+
+    def test_filters_keep_their_state(self, device):
+        async def test(hass, entry):
+            coordinator = await start(hass, entry)
+            adaptive = coordinator.adaptive
+            deadband = coordinator.deadband
+            device["payload"] = payload(1010)
+            await coordinator.async_refresh()
+            interval = adaptive.interval
+            calls = []
+            coordinator.async_add_listener(lambda: calls.append(1), "temp_tx1")
+
+            options = {
+                **entry.options,
+                "filter_section": {"deadband": True, "temperature_deadband": 0.5},
+            }
+            object.__setattr__(entry, "options", MappingProxyType(options))
+            await coordinator.async_apply_options(entry.options)
+
+            assert coordinator.adaptive is adaptive
+            assert adaptive.interval == interval
+            assert coordinator.deadband is deadband
+            assert deadband.deadbands["temperature"] == 0.5
+            # Unchanged readings are not dispatched again
+            device["payload"] = payload(1020)
+            await coordinator.async_refresh()
+            assert calls == []
+            await coordinator.async_shutdown()
+
+        run(test, {"polling_section": {"adaptive": True}})
+
+
+class TestSwapSensors:
+
+    def test_unchanged_sensors_are_rebound(self, device):
+        async def test(hass, entry):
+            first = await start(hass, entry)
+            first.api_wind = True
+            sensors = install_sensors(hass, entry, first)
+            added = []
+            entry.runtime_data.add_sensors = added.extend
+
+            second = WeatherCoordinator(hass, entry)
+            second.data = first.data
+            second.api_rolling = True
+            await async_swap_sensors(entry, second)
+
+            temp = entry.runtime_data.sensors["temp_tx1"]
+            assert temp is next(
+                sensor
+                for sensor in sensors
+                if sensor.entity_description.key == "temp_tx1"
+            )
+            assert temp.coordinator is second
+            assert added and all(isinstance(sensor, RollingSensor) for sensor in added)
+            # Wind statistics were turned off, their sensors are removed
+            assert not any(
+                isinstance(sensor, WindSensor)
+                for sensor in entry.runtime_data.sensors.values()
+            )
+            removed = [sensor for sensor in sensors if isinstance(sensor, WindSensor)]
+            assert removed and all(
+                sensor._platform_state.name == "REMOVED" for sensor in removed
+            )
+            await first.async_shutdown()
+            await second.async_shutdown()
+
+        run(test)
+
+
+class TestDispatch:
+
+    def test_only_listeners_of_changed_keys_are_notified(self, device):
+        async def test(hass, entry):
+            coordinator = await start(hass, entry)
+            calls = []
+            for key in ("temp_tx1", "hum_tx1", None):
+                coordinator.async_add_listener(lambda key=key: calls.append(key), key)
+
+            device["payload"] = payload(1010, temp=71.0)
+            await coordinator.async_refresh()
+            # Listeners without a key are notified of every update
+            assert sorted(calls, key=str) == [None, "temp_tx1"]
+            await coordinator.async_shutdown()
+
+        run(test)
+
+    def test_statistics_dispatch_with_unchanged_data(self, device):
+        async def test(hass, entry):
+            coordinator = await start(hass, entry)
+            calls = []
+            coordinator.async_add_listener(
+                lambda: calls.append(1), "temp_tx1_max_3600"
+            )
+
+            # A reading leaving the window changes the statistic, not the data
+            def update(snapshot, now):
+                coordinator.rolling._set("temp_tx1_max_3600", 71.0)
+
+            coordinator.rolling.update = update
+            device["payload"] = payload(1010)
+            await coordinator.async_refresh()
+            assert calls == [1]
+
+            device["payload"] = payload(1020)
+            await coordinator.async_refresh()
+            assert calls == [1]
+            await coordinator.async_shutdown()
+
+        run(test, {"statistics_section": {"rolling": True}})
+
+
+class TestStore:
+
+    def test_daily_sums_are_restored(self, device):
+        async def test(hass, entry):
+            first = await start(hass, entry)
+            assert "gdd_today_tx1" in first.accumulators.values
+            await first.store.async_save(first._storage_data())
+            await first.async_shutdown()
+
+            second = WeatherCoordinator(hass, entry)
+            assert await second.async_restore()
+            assert second.accumulators.values == first.accumulators.values
+            assert second.accumulators.attributes == first.accumulators.attributes
+            await second.async_shutdown()
+
+        run(test, {"accumulator_section": {"accumulators": True}})
+
+
+class TestHub:
+
+    def test_error_response_is_a_failed_poll(self, device):
+        async def test(hass, entry):
+            coordinator = await start(hass, entry)
+            device["payload"] = {"data": {"error": "asyncio.TimeoutError"}}
+            await coordinator.async_refresh()
+
+            diagnostics = coordinator.hub.diagnostics()
+            assert diagnostics["polls"] == 2
+            assert diagnostics["failures"] == 1
+            await coordinator.async_shutdown()
+
+        run(test)
+
+
+class TestRealtime:
+
+    def test_frame_is_merged_and_dispatched(self, device):
+        async def test(hass, entry):
+            coordinator = await start(hass, entry)
+            calls = []
+            for key in ("wind_speed_last_tx1", "temp_tx1"):
+                coordinator.async_add_listener(lambda key=key: calls.append(key), key)
+            frame = {
+                "did": "001D0A700000",
+                "ts": 1005,
+                "conditions": [
+                    {
+                        "lsid": 100,
+                        "data_structure_type": 1,
+                        "txid": 1,
+                        "wind_speed_last": 5.0,
+                        "wind_dir_last": 90,
+                        "rain_size": 2,
+                        "rain_storm_start_at": 0,
+                        "rainfall_daily": 50,
+                        "rainfall_year": 500,
+                    }
+                ],
+            }
+
+            coordinator._async_handle_realtime_frame(frame)
+            data = coordinator.data.as_dict()
+            assert data["wind_speed_last_tx1"] == 5.0
+            assert data["rain_storm_start_at_tx1"] is None
+            assert data["temp_tx1"] == 70.0
+            assert calls == ["wind_speed_last_tx1"]
+            # Frames are not polls, the device timestamp is left to HTTP
+            assert coordinator.last_device_ts == 1000
+            await coordinator.async_shutdown()
+
+        run(test)
+
+    def test_frame_before_first_poll_is_ignored(self, device):
+        async def test(hass, entry):
+            coordinator = WeatherCoordinator(hass, entry)
+            coordinator._async_handle_realtime_frame({"conditions": []})
+            assert coordinator.data is None
+            await coordinator.async_shutdown()
+
+        run(test)
+
+
+class TestSkip:
+
+    def test_unchanged_timestamp_is_skipped(self, device):
+        async def test(hass, entry):
+            coordinator = await start(hass, entry)
+            data = coordinator.data
+            calls = []
+            coordinator.async_add_listener(lambda: calls.append(1))
+            coordinator.async_add_listener(lambda: calls.append(1), "temp_tx1")
+
+            # Different readings under the same timestamp are not parsed
+            device["payload"] = payload(1000, temp=75.0)
+            await coordinator.async_refresh()
+            assert coordinator.skipped_cycles == 1
+            assert coordinator.data is data
+            assert coordinator.data.as_dict()["temp_tx1"] == 70.0
+            assert calls == []
+
+            device["payload"] = payload(1010, temp=75.0)
+            await coordinator.async_refresh()
+            assert coordinator.skipped_cycles == 1
+            assert coordinator.last_device_ts == 1010
+            assert calls == [1, 1]
+            await coordinator.async_shutdown()
+
+        run(test)
+
+
+class TestSetup:
+
+    def test_restored_topology_differs_from_device(self, device):
+        async def test(hass, entry):
+            # Stored while the LSS BAR was not connected yet
+            device["payload"] = payload(990)
+            del device["payload"]["data"]["conditions"][1]
+            stored = WeatherCoordinator(hass, entry)
+            await stored.async_refresh()
+            await stored.store.async_save(stored._storage_data())
+            await stored.async_shutdown()
+            device["payload"] = payload(1000)
+
+            added = []
+            restored = []
+
+            def add_sensors(sensors):
+                for added_sensor in sensors:
+                    added_sensor.hass = hass
+                    added_sensor.entity_id = (
+                        f"sensor.{added_sensor.entity_description.key}"
+                    )
+                added.extend(sensors)
+
+            async def forward_entry_setups(config_entry, platforms):
+                # Loading the platform lets the event loop run other tasks
+                await asyncio.sleep(0.01)
+                await sensor.async_setup_entry(hass, config_entry, add_sensors)
+                restored.append(config_entry.runtime_data.coordinator)
+                assert "bar_sea_level_ls101" not in config_entry.runtime_data.sensors
+
+            hass.config_entries = SimpleNamespace(
+                async_forward_entry_setups=forward_entry_setups
+            )
+
+            assert await async_setup_entry(hass, entry)
+            await hass.async_block_till_done(wait_background_tasks=True)
+
+            second = entry.runtime_data.coordinator
+            assert second is not restored[0]
+            assert "bar_sea_level_ls101" in entry.runtime_data.sensors
+            assert entry.runtime_data.sensors["bar_sea_level_ls101"] in added
+            await second.async_shutdown()
+
+        run(test)
@@ -1,5 +1,11 @@
+import asyncio
+import json
 import pytest
-from custom_components.davis_weatherlink_live.davis_weatherlink_live import DavisWeatherLinkLive
+from custom_components.davis_weatherlink_live.davis_weatherlink_live import (
+    DavisWeatherLinkLive,
+    decode_json,
+)
+from custom_components.davis_weatherlink_live.records import ConditionTopology, IssRecord
 from datetime import datetime, timezone
 
 class TestDavisWeatherLinkLive:
@@ -14,6 +20,9 @@ class TestDavisWeatherLinkLive:
         result = self.davis.unix_to_datetime(1445400000)
         assert result == expected_date_time
 
+    def test_unix_to_datetime_zero(self):
+        assert self.davis.unix_to_datetime(0) is None
+
     def test_unix_to_datetime_non_numeric_input(self):
         result = self.davis.unix_to_datetime("123")
         assert result is None
@@ -54,3 +63,234 @@ class TestDavisWeatherLinkLive:
 
         # Test with the maximum valid angle (360)
         assert self.davis.wind_dir_to_rose(360) == "N"
+
+    def test_parse_weather_data_keys_by_device(self):
+        data = {
+            "data": {
+                "conditions": [
+                    {
+                        "lsid": 309782,
+                        "data_structure_type": 1,
+                        "txid": 2,
+                        "temp": 62.1,
+                        "wind_dir_last": 46,
+                        "wind_speed_hi_last_2_min": None,
+                        "rain_size": 2,
+                        "rainfall_daily": 5,
+                    },
+                    {
+                        "lsid": 309779,
+                        "data_structure_type": 3,
+                        "bar_sea_level": 30.079,
+                    },
+                ]
+            }
+        }
+        result = self.davis.parse_weather_data(data).as_dict()
+
+        assert result["temp_tx2"] == 62.1
+        assert result["wind_dir_last_rose_tx2"] == "NE"
+        assert result["wind_speed_hi_last_2_min_tx2"] == 0.0
+        assert result["rainfall_daily_tx2"] == pytest.approx(1.0)
+        assert result["bar_sea_level_ls309779"] == 30.079
+        assert result["bar_trend_ls309779"] is None
+
+    def test_parse_weather_data_topology(self):
+        data = {
+            "data": {
+                "conditions": [
+                    {"lsid": 309782, "data_structure_type": 1, "txid": 2, "rain_size": 2},
+                    {"lsid": 309779, "data_structure_type": 3},
+                ]
+            }
+        }
+        result = self.davis.parse_weather_data(data)
+
+        assert result.topology == (
+            ConditionTopology(309782, 1, 2, 2),
+            ConditionTopology(309779, 3, None, None),
+        )
+        assert isinstance(result.records[0], IssRecord)
+        assert result.records[0].get("txid") == 2
+        # Unchanged topology is reused rather than rebuilt
+        assert self.davis.parse_weather_data(data).topology is result.topology
+
+    def test_restore_snapshot(self):
+        data = {
+            "data": {
+                "conditions": [
+                    {
+                        "lsid": 309782,
+                        "data_structure_type": 1,
+                        "txid": 2,
+                        "rain_size": 2,
+                        "temp": 62.1,
+                        "rain_storm_start_at": 1445400000,
+                    },
+                    {"lsid": 309779, "data_structure_type": 3, "bar_sea_level": 30.079},
+                    {"lsid": 1, "data_structure_type": 99},
+                ]
+            }
+        }
+        snapshot = self.davis.parse_weather_data(data)
+        stored = json.loads(json.dumps(self.davis.dump_snapshot(snapshot)))
+
+        restored = DavisWeatherLinkLive(None, None).restore_snapshot(stored)
+        assert restored == snapshot
+        assert restored.records[0].keys is snapshot.records[0].keys
+        assert restored.records[0].get("rain_storm_start_at") == datetime(
+            2015, 10, 21, 4, 0, tzinfo=timezone.utc
+        )
+
+    def test_parse_weather_data_api_error(self):
+        assert len(self.davis.parse_weather_data({"data": {"error": "busy"}})) == 0
+
+    def test_parse_realtime_data(self):
+        snapshot = self.davis.parse_weather_data(
+            {
+                "data": {
+                    "conditions": [
+                        {
+                            "lsid": 1,
+                            "data_structure_type": 1,
+                            "txid": 1,
+                            "rain_size": 1,
+                            "temp": 50.0,
+                        },
+                        {"lsid": 2, "data_structure_type": 4, "temp_in": 70.0},
+                    ]
+                }
+            }
+        )
+        frame = {
+            "conditions": [
+                {
+                    "data_structure_type": 1,
+                    "txid": 1,
+                    "wind_speed_last": 12.0,
+                    "wind_dir_last": 180,
+                    "rain_size": 1,
+                    "rain_15_min": 3,
+                }
+            ]
+        }
+        merged = self.davis.parse_realtime_data(frame, snapshot)
+        result = merged.as_dict()
+
+        assert result["wind_speed_last_tx1"] == 12.0
+        assert result["wind_dir_last_rose_tx1"] == "S"
+        assert result["rainfall_last_15_min_tx1"] == pytest.approx(0.03)
+        # Fields the frame does not carry keep their polled values
+        assert result["temp_tx1"] == 50.0
+        assert merged.records[1] is snapshot.records[1]
+        assert merged.changed_keys(snapshot) == {
+            "wind_speed_last_tx1",
+            "wind_dir_last_tx1",
+            "wind_dir_last_rose_tx1",
+            "rainfall_last_15_min_tx1",
+        }
+
+    def test_parse_realtime_data_without_storm(self):
+        snapshot = self.davis.parse_weather_data(
+            {
+                "data": {
+                    "conditions": [
+                        {
+                            "lsid": 1,
+                            "data_structure_type": 1,
+                            "txid": 1,
+                            "rain_size": 1,
+                            "rain_storm_start_at": 1445400000,
+                        }
+                    ]
+                }
+            }
+        )
+        frame = {
+            "conditions": [
+                {
+                    "data_structure_type": 1,
+                    "txid": 1,
+                    "rain_size": 1,
+                    "rain_storm": 0,
+                    "rain_storm_start_at": 0,
+                }
+            ]
+        }
+        result = self.davis.parse_realtime_data(frame, snapshot).as_dict()
+        assert result["rain_storm_start_at_tx1"] is None
+
+    def test_parse_realtime_data_unknown_transmitter(self):
+        snapshot = self.davis.parse_weather_data({"data": {"conditions": []}})
+        frame = {"conditions": [{"data_structure_type": 1, "txid": 7, "rain_size": 1}]}
+        assert self.davis.parse_realtime_data(frame, snapshot) is snapshot
+
+    def test_decode_json_bytes(self):
+        body = b'{"data": {"ts": 1746711828, "conditions": []}, "error": null}'
+        assert decode_json(body) == {
+            "data": {"ts": 1746711828, "conditions": []},
+            "error": None,
+        }
+        with pytest.raises(ValueError):
+            decode_json(b"not json")
+
+
+class FakeResponse:
+
+    def __init__(self, body):
+        self.status = 200
+        self.body = body
+
+    async def __aenter__(self):
+        await asyncio.sleep(0.01)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def read(self):
+        return self.body
+
+
+class FakeSession:
+
+    connector = None
+
+    def __init__(self):
+        self.requests = 0
+
+    def get(self, url, **kwargs):
+        self.requests += 1
+        return FakeResponse(b'{"data": {"ts": 1, "conditions": []}}')
+
+
+class TestSingleFlight:
+
+    def test_concurrent_callers_share_one_request(self):
+        session = FakeSession()
+        davis = DavisWeatherLinkLive("http://single-flight/a", session)
+        other = DavisWeatherLinkLive("http://single-flight/a", session)
+
+        async def poll():
+            return await asyncio.gather(
+                davis.get_weather_data(),
+                davis.get_weather_data(),
+                other.fetch_weather_data(),
+            )
+
+        first, second, payload = asyncio.run(poll())
+        assert session.requests == 1
+        assert first is second
+        assert payload == {"data": {"ts": 1, "conditions": []}}
+
+    def test_stale_result_is_not_reused(self):
+        session = FakeSession()
+        davis = DavisWeatherLinkLive("http://single-flight/b", session, freshness=0)
+
+        async def poll():
+            await davis.fetch_weather_data()
+            await asyncio.sleep(0.01)
+            await davis.fetch_weather_data()
+
+        asyncio.run(poll())
+        assert session.requests == 2
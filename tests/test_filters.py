@@ -0,0 +1,128 @@
+import pytest
+
+from custom_components.davis_weatherlink_live.filters import (
+    DeadbandFilter,
+    OutlierFilter,
+)
+from custom_components.davis_weatherlink_live.records import (
+    ConditionTopology,
+    IssRecord,
+    LssBarRecord,
+    LssTempHumRecord,
+    WeatherSnapshot,
+)
+
+DEADBANDS = {"temperature": 0.2, "humidity": 1.0, "pressure": 0.003, "pm": 1.0}
+MIN_DEVIATIONS = {"temperature": 2.0, "humidity": 3.0, "pressure": 0.01}
+ISS_TOPOLOGY = (ConditionTopology(1, 1, 1, 1),)
+ISS_KEYS = tuple(f"{name}_tx1" for name in IssRecord.fields)
+
+
+def iss_snapshot(temp, wind=None):
+    values = [None] * len(IssRecord.fields)
+    values[IssRecord.field_index["temp"]] = temp
+    values[IssRecord.field_index["wind_speed_avg_last_10_min"]] = wind
+    return WeatherSnapshot(ISS_TOPOLOGY, (IssRecord(ISS_KEYS, values),))
+
+
+def bar_snapshot(bar_sea_level):
+    topology = (ConditionTopology(1, 3, None, None),)
+    keys = tuple(f"{name}_ls1" for name in LssBarRecord.fields)
+    record = LssBarRecord(keys, [1, bar_sea_level, 0.01, 29.9, 3])
+    return WeatherSnapshot(topology, (record,))
+
+
+def value(snapshot, name="bar_sea_level"):
+    return snapshot.records[0].get(name)
+
+
+class TestDeadbandFilter:
+
+    def test_rounds_values(self):
+        deadband = DeadbandFilter(DEADBANDS, heartbeat=900)
+        assert value(deadband.apply(bar_snapshot(30.01234), 0)) == 30.012
+
+    def test_holds_small_changes(self):
+        deadband = DeadbandFilter(DEADBANDS, heartbeat=900)
+        deadband.apply(bar_snapshot(30.010), 0)
+        assert value(deadband.apply(bar_snapshot(30.012), 10)) == 30.010
+        # Held changes do not add up, the next value is compared to 30.010
+        assert value(deadband.apply(bar_snapshot(30.011), 20)) == 30.010
+        assert value(deadband.apply(bar_snapshot(30.014), 30)) == 30.014
+        assert deadband.suppressed == 2
+
+    def test_heartbeat_writes_held_change(self):
+        deadband = DeadbandFilter(DEADBANDS, heartbeat=900)
+        deadband.apply(bar_snapshot(30.010), 0)
+        assert value(deadband.apply(bar_snapshot(30.012), 899)) == 30.010
+        assert value(deadband.apply(bar_snapshot(30.012), 900)) == 30.012
+
+    def test_unchanged_record_is_reused(self):
+        deadband = DeadbandFilter(DEADBANDS, heartbeat=900)
+        first = deadband.apply(bar_snapshot(30.01), 0)
+        second = deadband.apply(bar_snapshot(30.01), 10)
+        assert second == first
+        assert second.changed_keys(first) == set()
+
+    def test_groups_by_device_class(self):
+        deadband = DeadbandFilter(DEADBANDS, heartbeat=900)
+        topology = (ConditionTopology(2, 4, None, None),)
+        keys = tuple(f"{name}_ls2" for name in LssTempHumRecord.fields)
+
+        def snapshot(temp, hum):
+            record = LssTempHumRecord(keys, [2, temp, hum, 50.0, 71.0, 4])
+            return WeatherSnapshot(topology, (record,))
+
+        deadband.apply(snapshot(70.0, 40.2), 0)
+        filtered = deadband.apply(snapshot(70.3, 40.4), 10)
+        assert filtered.records[0].get("temp_in") == pytest.approx(70.3)
+        assert filtered.records[0].get("hum_in") == 40
+        assert filtered.records[0].get("lsid") == 2
+
+
+class TestOutlierFilter:
+
+    def test_out_of_range_keeps_the_last_accepted_value(self):
+        outliers = OutlierFilter(3.0, MIN_DEVIATIONS, 5)
+        outliers.apply(iss_snapshot(70.0, 4.0))
+        filtered = outliers.apply(iss_snapshot(70.1, 42606))
+        assert value(filtered, "wind_speed_avg_last_10_min") == 4.0
+        assert value(filtered, "temp") == 70.1
+        assert outliers.out_of_range == {"wind_speed_avg_last_10_min_tx1": 1}
+
+    def test_out_of_range_without_history_is_unknown(self):
+        outliers = OutlierFilter(3.0, MIN_DEVIATIONS, 5)
+        filtered = outliers.apply(iss_snapshot(70.0, 42606))
+        assert value(filtered, "wind_speed_avg_last_10_min") is None
+
+    def test_rejects_a_spike(self):
+        outliers = OutlierFilter(3.0, MIN_DEVIATIONS, 5)
+        for temp in (70.0, 70.2, 70.1, 70.3):
+            outliers.apply(iss_snapshot(temp))
+        assert value(outliers.apply(iss_snapshot(95.0)), "temp") == 70.3
+        assert value(outliers.apply(iss_snapshot(70.4)), "temp") == 70.4
+        assert outliers.spikes == {"temp_tx1": 1}
+
+    def test_accepts_a_lasting_step(self):
+        outliers = OutlierFilter(3.0, MIN_DEVIATIONS, 5)
+        for temp in (70.0, 70.0, 70.0, 70.0):
+            outliers.apply(iss_snapshot(temp))
+        readings = [value(outliers.apply(iss_snapshot(80.0)), "temp") for _ in range(3)]
+        assert readings == [70.0, 70.0, 80.0]
+
+    def test_clean_snapshot_is_returned_as_is(self):
+        outliers = OutlierFilter(3.0, MIN_DEVIATIONS, 5)
+        snapshot = iss_snapshot(70.0, 4.0)
+        assert outliers.apply(snapshot) is snapshot
+
+    def test_unchanged_values_of_a_frame_are_not_counted_again(self):
+        outliers = OutlierFilter(3.0, MIN_DEVIATIONS, 5)
+        for temp in (70.0, 70.0, 70.0):
+            previous = outliers.apply(iss_snapshot(temp, 4.0))
+        for _ in range(5):
+            frame = outliers.apply(iss_snapshot(70.0, 5.0), previous)
+        assert value(frame, "wind_speed_avg_last_10_min") == 5.0
+        # The temperature window still holds only the three polls
+        assert outliers._windows[ISS_TOPOLOGY[0]][
+            IssRecord.field_index["temp"]
+        ].count == 3
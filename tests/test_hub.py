@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from custom_components.davis_weatherlink_live.hub import PollHub
+
+
+class TestPollHub:
+
+    def test_single_entry_uses_interval(self):
+        hub = PollHub()
+        hub.register("a", 30)
+        assert hub.next_delay("a", 30, 1007.3) == 30
+
+    def test_entries_spread_across_interval(self):
+        hub = PollHub()
+        for entry_id in ("a", "b", "c"):
+            hub.register(entry_id, 30)
+
+        now = 1007.3
+        slots = sorted(
+            (now + hub.next_delay(entry_id, 30, now)) % 30
+            for entry_id in ("a", "b", "c")
+        )
+        assert slots == pytest.approx([0, 10, 20])
+
+    def test_shift_is_at_most_half_an_interval(self):
+        hub = PollHub()
+        hub.register("a", 30)
+        hub.register("b", 30)
+        for now in (1000, 1004.9, 1015.1, 1029.9):
+            assert 15 <= hub.next_delay("b", 30, now) <= 45
+
+    def test_slots_use_the_shortest_interval(self):
+        hub = PollHub()
+        hub.register("a", 30)
+        hub.register("b", 60)
+        assert hub.period == 30
+
+        now = 1007.3
+        # Every poll of either device lands on its own slot of the 30 s period
+        assert (now + hub.next_delay("a", 30, now)) % 30 == pytest.approx(0)
+        for _ in range(3):
+            delay = hub.next_delay("b", 60, now)
+            assert 45 <= delay <= 75
+            now += delay
+            assert now % 30 == pytest.approx(15)
+
+    def test_unregister_frees_slot(self):
+        hub = PollHub()
+        hub.register("a", 30)
+        hub.register("b", 30)
+        hub.unregister("a")
+        assert len(hub) == 1
+        assert hub.next_delay("b", 30, 1007.3) == 30
+
+    def test_limits_concurrent_polls(self):
+        hub = PollHub(max_concurrent=2)
+
+        async def poll():
+            async with hub.poll():
+                await asyncio.sleep(0.01)
+
+        async def failing_poll():
+            async with hub.poll():
+                raise TimeoutError
+
+        async def run():
+            await asyncio.gather(*(poll() for _ in range(5)))
+            with pytest.raises(TimeoutError):
+                await failing_poll()
+
+        asyncio.run(run())
+        diagnostics = hub.diagnostics()
+        assert diagnostics["polls"] == 6
+        assert diagnostics["failures"] == 1
+        assert diagnostics["peak_in_flight"] == 2
+        assert diagnostics["in_flight"] == 0
+        assert diagnostics["max_wait"] > 0
+
+    def test_error_responses_count_as_failures(self):
+        hub = PollHub()
+
+        async def run():
+            async with hub.poll() as poll:
+                poll.failed = True
+            async with hub.poll():
+                pass
+
+        asyncio.run(run())
+        assert hub.polls == 2
+        assert hub.failures == 1
@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.davis_weatherlink_live.rain import RainAccounting, RainBuckets
+from custom_components.davis_weatherlink_live.records import (
+    ConditionTopology,
+    IssRecord,
+    WeatherSnapshot,
+)
+from custom_components.davis_weatherlink_live.registry import rain_descriptions
+
+# 0.2 mm rain cup
+TOPOLOGY = (ConditionTopology(1, 1, 1, 2),)
+KEYS = tuple(f"{name}_tx1" for name in IssRecord.fields)
+START = datetime(2026, 5, 1, 9, 0, tzinfo=timezone(timedelta(hours=2)))
+
+
+def snapshot(daily, year, rate=0.0):
+    values = [None] * len(IssRecord.fields)
+    values[IssRecord.field_index["rainfall_daily"]] = daily
+    values[IssRecord.field_index["rainfall_year"]] = year
+    values[IssRecord.field_index["rain_rate_last"]] = rate
+    return WeatherSnapshot(TOPOLOGY, (IssRecord(KEYS, values),))
+
+
+class TestRainBuckets:
+
+    def test_ring_forgets_earlier_laps(self):
+        buckets = RainBuckets(4)
+        buckets.add(1, 2)
+        buckets.add(2, 3)
+        assert buckets.total(0, 3) == 5
+        buckets.add(5, 1)
+        assert buckets.get(1) == 0
+        assert buckets.total(2, 5) == 4
+
+
+class TestRainAccounting:
+
+    def test_keys_match_sensor_descriptions(self):
+        rain = RainAccounting()
+        rain.update(snapshot(1.0, 100.0), START)
+        assert set(rain.values) == {
+            description.key for description in rain_descriptions(1, 2)
+        }
+
+    def test_seeds_today_and_adds_deltas(self):
+        rain = RainAccounting()
+        rain.update(snapshot(1.0, 100.0), START)
+        assert rain.values["rain_today_tx1"] == 1.0
+        assert rain.values["rain_this_hour_tx1"] is None
+        assert rain.values["rain_yesterday_tx1"] is None
+
+        rain.update(snapshot(1.4, 100.4), START + timedelta(hours=1, minutes=5))
+        rain.update(snapshot(2.0, 101.0), START + timedelta(hours=1, minutes=30))
+        assert rain.values["rain_today_tx1"] == 2.0
+        assert rain.values["rain_this_hour_tx1"] == 1.0
+        assert rain.values["rain_last_hour_tx1"] is None
+
+        rain.update(snapshot(2.0, 101.0), START + timedelta(hours=2, minutes=1))
+        assert rain.values["rain_this_hour_tx1"] == 0.0
+        assert rain.values["rain_last_hour_tx1"] == 1.0
+
+    def test_daily_reset_at_midnight(self):
+        rain = RainAccounting()
+        evening = START.replace(hour=23, minute=50)
+        rain.update(snapshot(5.0, 100.0), evening)
+        rain.update(snapshot(5.2, 100.2), evening + timedelta(minutes=5))
+        # Midnight, the daily counter starts over while the year goes on
+        rain.update(snapshot(0.4, 100.6), evening + timedelta(minutes=15))
+        assert rain.values["rain_today_tx1"] == 0.4
+        assert rain.values["rain_yesterday_tx1"] == 5.2
+        assert rain.values["rain_last_7_days_tx1"] is None
+
+    def test_year_rollover(self):
+        rain = RainAccounting()
+        evening = START.replace(month=12, day=31, hour=23, minute=55)
+        rain.update(snapshot(3.0, 900.0), evening)
+        # Both counters start over, the new year begins with its daily rain
+        rain.update(snapshot(0.2, 0.2), evening + timedelta(minutes=10))
+        assert rain.values["rain_today_tx1"] == 0.2
+        assert rain.values["rain_yesterday_tx1"] == 3.0
+
+    def test_blank_counters_are_ignored(self):
+        rain = RainAccounting()
+        rain.update(snapshot(1.0, 100.0), START)
+        # Signal lost, the converter reports 0.0 for missing counters
+        rain.update(snapshot(0.0, 0.0), START + timedelta(minutes=5))
+        rain.update(snapshot(1.2, 100.2), START + timedelta(minutes=10))
+        assert rain.values["rain_today_tx1"] == 1.2
+
+    def test_rain_event(self):
+        rain = RainAccounting()
+        rain.update(snapshot(0.0, 10.0), START)
+        assert rain.values["rain_event_tx1"] == 0.0
+        rain.update(snapshot(0.4, 10.4, rate=4.8), START + timedelta(minutes=5))
+        rain.update(snapshot(0.6, 10.6, rate=2.4), START + timedelta(minutes=10))
+        assert rain.values["rain_event_tx1"] == pytest.approx(0.6)
+        attributes = rain.attributes["rain_event_tx1"]
+        assert attributes["peak_rate"] == 4.8
+        assert attributes["start"] == (START + timedelta(minutes=5)).isoformat()
+
+        rain.update(snapshot(0.6, 10.6), START + timedelta(hours=7))
+        assert rain.values["rain_event_tx1"] == 0.0
+        assert rain.attributes["rain_event_tx1"] == {}
+
+    def test_shared_records_are_not_counted_twice(self):
+        rain = RainAccounting()
+        first = snapshot(1.0, 100.0)
+        rain.update(first, START)
+        rain.pop_changed()
+        merged = WeatherSnapshot(first.topology, first.records)
+        rain.update(merged, START + timedelta(hours=2), previous=first)
+        assert rain.pop_changed() == set()
+
+    def test_older_poll_after_a_frame_is_ignored(self):
+        rain = RainAccounting()
+        rain.update(snapshot(10.0, 100.0), START)
+        # A real-time frame, then a poll answered a few seconds before it
+        rain.update(snapshot(10.2, 100.2), START + timedelta(seconds=3))
+        rain.update(snapshot(10.0, 100.0), START + timedelta(seconds=5))
+        rain.update(snapshot(10.2, 100.2), START + timedelta(seconds=8))
+        assert rain.values["rain_today_tx1"] == 10.2
+        assert rain.diagnostics()["counters"][1] == {"daily": 51, "year": 501}
+
+    def test_older_poll_after_midnight_is_ignored(self):
+        rain = RainAccounting()
+        evening = START.replace(hour=23, minute=59, second=50)
+        rain.update(snapshot(5.0, 100.0), evening)
+        rain.update(snapshot(0.0, 100.0), evening + timedelta(seconds=15))
+        # Answered before midnight but received after the first frame of the day
+        rain.update(snapshot(5.0, 100.0), evening + timedelta(seconds=17))
+        rain.update(snapshot(0.2, 100.2), evening + timedelta(seconds=20))
+        assert rain.values["rain_today_tx1"] == 0.2
+        assert rain.values["rain_yesterday_tx1"] == 5.0
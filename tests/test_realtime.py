@@ -0,0 +1,63 @@
+import asyncio
+
+from custom_components.davis_weatherlink_live import realtime
+from custom_components.davis_weatherlink_live.realtime import (
+    RealtimeListener,
+    RealtimeProtocol,
+)
+
+
+class FakeClient:
+
+    def __init__(self, ports):
+        self.ports = list(ports)
+
+    async def start_realtime_broadcast(self, duration):
+        return self.ports.pop(0)
+
+
+class TestRealtimeProtocol:
+
+    def test_only_frames_of_the_device_are_passed_on(self):
+        frames = []
+        protocol = RealtimeProtocol({"192.168.1.20"}, frames.append)
+
+        protocol.datagram_received(b'{"conditions": []}', ("192.168.1.20", 22222))
+        protocol.datagram_received(b'{"conditions": [1]}', ("192.168.1.21", 22222))
+        protocol.datagram_received(b'{"conditions"', ("192.168.1.20", 22222))
+        assert frames == [{"conditions": []}]
+
+
+class TestRenew:
+
+    def test_failed_renewal_is_retried_with_backoff(self, monkeypatch):
+        delays = []
+
+        def call_later(hass, delay, action):
+            delays.append(delay)
+            return lambda: None
+
+        monkeypatch.setattr(realtime, "async_call_later", call_later)
+        listener = RealtimeListener(
+            None, FakeClient([None, None, None, 22222]), "127.0.0.1", print
+        )
+        listener._transport = object()
+
+        async def main():
+            for _ in range(4):
+                await listener._async_renew()
+
+        asyncio.run(main())
+        assert delays == [5, 10, 20]
+        # Renewed, the next failure starts the backoff again
+        assert listener._retry_delay == 5
+
+    def test_stopped_listener_does_not_retry(self, monkeypatch):
+        delays = []
+        monkeypatch.setattr(
+            realtime, "async_call_later", lambda hass, delay, action: delays.append(1)
+        )
+        listener = RealtimeListener(None, FakeClient([None]), "127.0.0.1", print)
+
+        asyncio.run(listener._async_renew())
+        assert delays == []
@@ -0,0 +1,53 @@
+from custom_components.davis_weatherlink_live.records import (
+    ConditionTopology,
+    IssRecord,
+    LssBarRecord,
+    WeatherSnapshot,
+)
+
+TOPOLOGY = (ConditionTopology(1, 3, None, None),)
+KEYS = ("lsid_ls1", "bar_sea_level_ls1", "bar_trend_ls1", "bar_absolute_ls1")
+
+
+class TestWeatherSnapshot:
+
+    def test_only_changed_fields_are_reported(self):
+        previous = WeatherSnapshot(TOPOLOGY, (LssBarRecord(KEYS, [1, 30.01, 0.0, 29.9]),))
+        current = WeatherSnapshot(TOPOLOGY, (LssBarRecord(KEYS, [1, 30.02, 0.0, 29.9]),))
+        assert current.changed_keys(previous) == {"bar_sea_level_ls1"}
+
+    def test_topology_change_reports_all_keys(self):
+        previous = WeatherSnapshot()
+        current = WeatherSnapshot(TOPOLOGY, (LssBarRecord(KEYS, [1, 30.01, 0.0, 29.9]),))
+        assert current.changed_keys(previous) == set(KEYS)
+
+    def test_identical_snapshots(self):
+        record = LssBarRecord(KEYS, [1, 30.01, None, 29.9])
+        previous = WeatherSnapshot(TOPOLOGY, (record,))
+        current = WeatherSnapshot(TOPOLOGY, (LssBarRecord(KEYS, list(record.values)),))
+        assert current == previous
+        assert current.changed_keys(previous) == set()
+
+
+class TestConditionRecord:
+
+    def test_field_access_by_name(self):
+        record = LssBarRecord(KEYS, [1, 30.01, -0.02, 29.9])
+        assert record.get("bar_trend") == -0.02
+        assert record.get("temp") is None
+        assert LssBarRecord.fields == (
+            "lsid",
+            "bar_sea_level",
+            "bar_trend",
+            "bar_absolute",
+            "data_structure_type",
+        )
+
+    def test_records_are_slotted(self):
+        assert not hasattr(IssRecord([], []), "__dict__")
+
+    def test_fill_missing_keeps_previous_values_of_null_fields(self):
+        previous = LssBarRecord(KEYS, [1, 30.01, -0.02, 29.9])
+        current = LssBarRecord(KEYS, [1, None, 0.0, 29.8])
+        condition = {"lsid": 1, "bar_sea_level": None, "bar_trend": None, "bar_absolute": 29.8}
+        assert current.fill_missing(previous, condition).values == [1, 30.01, -0.02, 29.8]
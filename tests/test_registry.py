@@ -0,0 +1,47 @@
+from homeassistant.const import UnitOfLength, UnitOfVolumetricFlux
+
+from custom_components.davis_weatherlink_live.davis_weatherlink_live import (
+    compiled_fields,
+)
+from custom_components.davis_weatherlink_live.records import IssRecord
+from custom_components.davis_weatherlink_live.registry import (
+    CONDITION_FIELDS,
+    sensor_descriptions,
+    validation_table,
+)
+
+
+class TestSensorRegistry:
+
+    def test_every_sensor_has_a_parsed_value(self):
+        for data_type in CONDITION_FIELDS:
+            _, keys, _, _ = compiled_fields(data_type, 7, 1)
+            descriptions = sensor_descriptions(data_type, 7, 1)
+            assert {description.key for description in descriptions} <= set(keys)
+
+    def test_descriptions_are_memoized(self):
+        assert sensor_descriptions(1, 1, 2) is sensor_descriptions(1, 1, 2)
+
+    def test_rain_units_follow_rain_size(self):
+        metric = {d.key: d for d in sensor_descriptions(1, 3, 2)}
+        imperial = {d.key: d for d in sensor_descriptions(1, 3, 1)}
+        assert metric["rain_rate_last_tx3"].native_unit_of_measurement == (
+            UnitOfVolumetricFlux.MILLIMETERS_PER_HOUR
+        )
+        assert metric["rainfall_daily_tx3"].native_unit_of_measurement == (
+            UnitOfLength.MILLIMETERS
+        )
+        assert imperial["rainfall_daily_tx3"].native_unit_of_measurement == (
+            UnitOfLength.INCHES
+        )
+        assert sensor_descriptions(1, 3, None)[0].key == "lsid_tx3"
+
+    def test_validation_ranges(self):
+        table = {
+            IssRecord.fields[index]: (lowest, highest, group)
+            for index, lowest, highest, group in validation_table(1)
+        }
+        assert table["hum"] == (0.0, 100.0, "humidity")
+        assert table["wind_speed_avg_last_10_min"] == (0.0, 200.0, None)
+        assert table["solar_rad"] == (0, 1800, None)
+        assert "rain_rate_last" not in table
@@ -0,0 +1,83 @@
+import pytest
+
+from custom_components.davis_weatherlink_live.records import (
+    ConditionTopology,
+    LssBarRecord,
+    WeatherSnapshot,
+)
+from custom_components.davis_weatherlink_live.registry import rolling_descriptions
+from custom_components.davis_weatherlink_live.rolling import (
+    RollingStatistics,
+    RollingWindow,
+)
+
+
+class TestRollingWindow:
+
+    def test_min_max_mean(self):
+        window = RollingWindow(600, buckets=60)
+        for now, value in enumerate((3.0, 1.0, 4.0, 1.0, 5.0)):
+            window.add(value, now * 10)
+        assert window.min == 1.0
+        assert window.max == 5.0
+        assert window.mean == pytest.approx(14 / 5)
+
+    def test_empty(self):
+        window = RollingWindow(600)
+        assert window.min is None
+        assert window.max is None
+        assert window.mean is None
+
+    def test_expires_old_values(self):
+        window = RollingWindow(600, buckets=60)
+        window.add(10.0, 0)
+        window.add(2.0, 300)
+        window.add(6.0, 590)
+        assert window.max == 10.0
+        # The first bucket ends 10 seconds in, so it expires at 610
+        window.add(4.0, 610)
+        assert window.max == 6.0
+        assert window.min == 2.0
+        assert window.mean == pytest.approx(4.0)
+        window.expire(910)
+        assert window.min == 4.0
+
+    def test_memory_is_bounded_by_buckets(self):
+        window = RollingWindow(600, buckets=60)
+        # Steadily falling values would keep every sample as a candidate minimum
+        for second in range(6000):
+            window.add(-second, second)
+        assert len(window._buckets) <= 61
+        assert len(window._min) <= 61
+        assert window.max == -(6000 - 610)
+
+
+class TestRollingStatistics:
+
+    KEYS = tuple(f"{name}_ls1" for name in LssBarRecord.fields)
+
+    def snapshot(self, bar_sea_level):
+        topology = (ConditionTopology(1, 3, None, None),)
+        record = LssBarRecord(self.KEYS, [1, bar_sea_level, 0.01, 29.9, 3])
+        return WeatherSnapshot(topology, (record,))
+
+    def test_keys_match_sensor_descriptions(self):
+        rolling = RollingStatistics((600, 86400))
+        rolling.update(self.snapshot(30.01), 0)
+        descriptions = rolling_descriptions(3, 1, None, (600, 86400))
+        assert set(rolling.values) == {
+            description.key for description in descriptions
+        }
+        assert rolling.values["bar_sea_level_ls1_max_24h"] == 30.01
+
+    def test_reports_changed_keys(self):
+        rolling = RollingStatistics((600,))
+        rolling.update(self.snapshot(30.01), 0)
+        assert rolling.pop_changed() == {
+            "bar_sea_level_ls1_min_10m",
+            "bar_sea_level_ls1_max_10m",
+        }
+        rolling.update(self.snapshot(30.02), 10)
+        assert rolling.pop_changed() == {"bar_sea_level_ls1_max_10m"}
+        rolling.update(self.snapshot(30.02), 20)
+        assert rolling.pop_changed() == set()
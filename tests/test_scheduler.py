@@ -0,0 +1,87 @@
+import pytest
+
+from custom_components.davis_weatherlink_live.const import PHASE_LOCK_MIN_DELAY
+from custom_components.davis_weatherlink_live.records import (
+    ConditionTopology,
+    LssBarRecord,
+    WeatherSnapshot,
+)
+from custom_components.davis_weatherlink_live.scheduler import (
+    AdaptiveInterval,
+    PhaseLockedScheduler,
+)
+
+
+class TestPhaseLockedScheduler:
+
+    def test_unlocked_uses_interval(self):
+        scheduler = PhaseLockedScheduler()
+        scheduler.observe(1000, 1000.4)
+        assert scheduler.next_delay(30, 1000.5) == 30
+
+    def test_learns_period_and_phase(self):
+        scheduler = PhaseLockedScheduler()
+        scheduler.observe(1000, 1000.4)
+        scheduler.observe(1010, 1010.2)
+        scheduler.observe(1030, 1030.3)
+        assert scheduler.period == 10
+        # Lands one margin after the device update closest to the interval
+        delay = scheduler.next_delay(30, 1031)
+        assert 1031 + delay == pytest.approx(1060 + 0.2 + scheduler.margin)
+
+    def test_stale_poll_widens_margin(self):
+        scheduler = PhaseLockedScheduler()
+        scheduler.observe(1000, 1000.2)
+        scheduler.observe(1010, 1010.2)
+        margin = scheduler.margin
+        scheduler.observe(1010, 1020.1)
+        assert scheduler.margin > margin
+        assert scheduler.margin <= scheduler.period / 2
+
+    def test_delay_never_below_minimum(self):
+        scheduler = PhaseLockedScheduler()
+        scheduler.observe(1000, 1000.2)
+        scheduler.observe(1010, 1010.2)
+        assert scheduler.next_delay(0, 1019) >= PHASE_LOCK_MIN_DELAY
+
+
+class TestAdaptiveInterval:
+
+    SNAPSHOT_KEYS = ("lsid_ls1", "bar_sea_level_ls1", "bar_trend_ls1", "bar_absolute_ls1")
+
+    def snapshot(self, trend):
+        topology = (ConditionTopology(1, 3, None, None),)
+        record = LssBarRecord(self.SNAPSHOT_KEYS, [1, 30.01, trend, 29.9])
+        return WeatherSnapshot(topology, (record,))
+
+    def test_active_weather_uses_minimum(self):
+        adaptive = AdaptiveInterval(30, min_interval=10, max_interval=300)
+        assert adaptive.record_success(self.snapshot(-0.08)) == 10
+        assert adaptive.active
+
+    def test_quiet_weather_lengthens_to_maximum(self):
+        adaptive = AdaptiveInterval(30, min_interval=10, max_interval=60)
+        intervals = [adaptive.record_success(self.snapshot(0.0)) for _ in range(10)]
+        assert intervals[0] > 30
+        assert intervals == sorted(intervals)
+        assert intervals[-1] == 60
+
+    def test_failures_back_off_with_jitter(self):
+        adaptive = AdaptiveInterval(30, min_interval=10, max_interval=300)
+        first = adaptive.record_failure()
+        assert 30 <= first <= 60
+        for _ in range(20):
+            assert adaptive.record_failure() <= 300
+        assert adaptive.record_success(self.snapshot(0.0)) == 30
+        assert adaptive.failures == 0
+
+    def test_reconfigure_keeps_state(self):
+        adaptive = AdaptiveInterval(30, min_interval=10, max_interval=300)
+        for _ in range(10):
+            adaptive.record_success(self.snapshot(0.0))
+        assert adaptive.interval > 60
+
+        adaptive.reconfigure(AdaptiveInterval(20, min_interval=5, max_interval=60))
+        assert adaptive.base_interval == 20
+        assert adaptive.interval == 60
+        assert not adaptive.active
@@ -0,0 +1,73 @@
+import pytest
+
+from custom_components.davis_weatherlink_live.records import (
+    ConditionTopology,
+    IssRecord,
+    WeatherSnapshot,
+)
+from custom_components.davis_weatherlink_live.wind import SumWindow, WindStatistics
+
+TOPOLOGY = (ConditionTopology(1, 1, 1, 1),)
+KEYS = tuple(f"{name}_tx1" for name in IssRecord.fields)
+
+
+def snapshot(speed, direction):
+    values = [None] * len(IssRecord.fields)
+    values[IssRecord.field_index["wind_speed_last"]] = speed
+    values[IssRecord.field_index["wind_dir_last"]] = direction
+    return WeatherSnapshot(TOPOLOGY, (IssRecord(KEYS, values),))
+
+
+class TestSumWindow:
+
+    def test_expires_old_sums(self):
+        window = SumWindow(600, 2, buckets=60)
+        window.add((1.0, 2.0), 0)
+        window.add((3.0, 4.0), 300)
+        assert window.totals == [4.0, 6.0]
+        window.add((5.0, 6.0), 610)
+        assert window.totals == [8.0, 10.0]
+
+
+class TestWindStatistics:
+
+    def test_vector_mean_around_north(self):
+        wind = WindStatistics((600,))
+        for now, direction in enumerate((350, 10, 350, 10)):
+            wind.update(snapshot(10, direction), now)
+        assert wind.values["wind_dir_vector_avg_tx1_10m"] == 0
+        attributes = wind.attributes["wind_dir_vector_avg_tx1_10m"]
+        assert attributes["compass"] == "N"
+        assert attributes["scalar_speed"] == 10
+        assert attributes["steadiness"] == pytest.approx(0.98, abs=0.01)
+
+    def test_calm_has_no_direction(self):
+        wind = WindStatistics((600,))
+        wind.update(snapshot(0, 90), 0)
+        assert wind.values["wind_dir_vector_avg_tx1_10m"] is None
+        assert wind.values["wind_rose_tx1"] is None
+        assert wind.attributes["wind_rose_tx1"] == {"calm": 100.0}
+
+    def test_rose_is_speed_weighted(self):
+        wind = WindStatistics((600,))
+        wind.update(snapshot(3, 270), 0)
+        wind.update(snapshot(1, 90), 10)
+        wind.update(snapshot(0, 0), 20)
+        assert wind.values["wind_rose_tx1"] == "W"
+        attributes = wind.attributes["wind_rose_tx1"]
+        assert attributes["W"] == 75.0
+        assert attributes["E"] == 25.0
+        assert attributes["N"] == 0.0
+        assert attributes["calm"] == pytest.approx(33.3)
+
+    def test_shared_records_are_not_counted_twice(self):
+        wind = WindStatistics((600,))
+        first = snapshot(5, 180)
+        wind.update(first, 0)
+        assert wind.pop_changed() == {
+            "wind_dir_vector_avg_tx1_10m",
+            "wind_rose_tx1",
+        }
+        merged = WeatherSnapshot(first.topology, first.records)
+        wind.update(merged, 1, previous=first)
+        assert wind.pop_changed() == set()